@@ -0,0 +1,102 @@
+"""자리표 좌석 데이터 준비 단계 벤치마크 (기존 iterrows 방식 vs 한 번에 처리하는 방식)
+
+사용법:
+    python benchmarks/bench_grid_build.py
+    python benchmarks/bench_grid_build.py --sizes 10000 100000 1000000 --legacy-max 100000
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from create_combined_seating_html import prepare_class_seats
+
+
+def make_synthetic_frame(n_students, class_size=30, n_cols=6, missing_score_rate=0.1, seed=0):
+    """합성 학생 데이터 생성 (사진 없음)"""
+    rng = np.random.default_rng(seed)
+    idx = np.arange(n_students)
+    class_nums = idx // class_size + 1
+    seat = idx % class_size
+    scores = rng.uniform(0, 100, n_students).round(1)
+    scores[rng.random(n_students) < missing_score_rate] = np.nan
+    return pd.DataFrame({
+        '클래스': class_nums,
+        '학번': 30000 + (class_nums % 100) * 100 + seat + 1,
+        '이름': [f"학생{i}" for i in idx],
+        '점수': scores,
+        '행': seat // n_cols + 1,
+        '열': seat % n_cols + 1,
+        '파일명': np.nan,
+    })
+
+
+def legacy_grid_build(df):
+    """기존 방식: 클래스마다 필터링 + 복사 후 iterrows로 좌석 딕셔너리 생성"""
+    grids = []
+    for class_num in sorted(df['클래스'].unique()):
+        class_students = df[df['클래스'] == class_num].copy()
+        max_row = class_students['행'].max()
+        max_col = class_students['열'].max()
+        seating_grid = {}
+        for _, student in class_students.iterrows():
+            row, col = student['행'], student['열']
+            if pd.notna(student['점수']):
+                score = student['점수']
+                if score >= 80:
+                    score_class, score_emoji = "excellent", "🌟"
+                elif score >= 60:
+                    score_class, score_emoji = "good", "👍"
+                else:
+                    score_class, score_emoji = "needs", "💪"
+                score_text = f"{score:.0f}"
+            else:
+                score_class, score_emoji, score_text = "none", "❓", "-"
+            student_id = str(student['학번'])
+            if len(student_id) >= 4 and student_id.startswith('3'):
+                class_number = str(int(student_id[1:3]))
+            else:
+                class_number = str(class_num)
+            seating_grid[(row, col)] = {
+                'id': f"{class_number}반 {student['이름']}",
+                'name': student['이름'],
+                'score_text': score_text,
+                'score_class': score_class,
+                'score_emoji': score_emoji,
+                'image_path': "",
+                'has_photo': pd.notna(student['파일명'])
+            }
+        grids.append((class_num, max_row, max_col, seating_grid))
+    return grids
+
+
+def timed(func, df):
+    start = time.perf_counter()
+    func(df)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10_000, 100_000, 1_000_000])
+    parser.add_argument('--legacy-max', type=int, default=100_000,
+                        help='기존 방식을 실행할 최대 학생 수 (그보다 크면 건너뜀)')
+    args = parser.parse_args()
+
+    print(f"{'학생 수':>10} {'기존(s)':>10} {'신규(s)':>10} {'배속':>8}")
+    for n in args.sizes:
+        df = make_synthetic_frame(n)
+        new = timed(prepare_class_seats, df)
+        if n <= args.legacy_max:
+            old = timed(legacy_grid_build, df)
+            print(f"{n:>10} {old:>10.3f} {new:>10.3f} {old / new:>7.1f}x")
+        else:
+            print(f"{n:>10} {'-':>10} {new:>10.3f} {'-':>8}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""클래스별 탭 병렬 생성(--jobs) 확장성 벤치마크
+
+사용법:
+    python benchmarks/bench_parallel_render.py
+    python benchmarks/bench_parallel_render.py --students 200000 --max-jobs 8
+"""
+import argparse
+import hashlib
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from create_combined_seating_html import PhotoIndex, iter_combined_seating_chart_html
+from bench_grid_build import make_synthetic_frame
+
+
+def render(df, photo_index, jobs):
+    """HTML 전체를 만들어 (걸린 시간, 출력 해시) 반환"""
+    digest = hashlib.sha256()
+    start = time.perf_counter()
+    for chunk in iter_combined_seating_chart_html(df, photo_index=photo_index, jobs=jobs):
+        digest.update(chunk)
+    return time.perf_counter() - start, digest.hexdigest()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--students', type=int, default=100_000)
+    parser.add_argument('--class-size', type=int, default=30)
+    parser.add_argument('--max-jobs', type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    df = make_synthetic_frame(args.students, class_size=args.class_size)
+    photo_index = PhotoIndex()
+    print(f"학생 {args.students}명, 클래스 {df['클래스'].nunique()}개")
+    print(f"{'jobs':>5} {'시간(s)':>10} {'배속':>8}")
+
+    base_time, base_digest = None, None
+    for jobs in range(1, args.max_jobs + 1):
+        seconds, digest = render(df, photo_index, jobs)
+        if base_time is None:
+            base_time, base_digest = seconds, digest
+        assert digest == base_digest, f"jobs={jobs} 출력이 jobs=1과 다릅니다"
+        print(f"{jobs:>5} {seconds:>10.3f} {base_time / seconds:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,167 @@
+"""자리표 생성 전체 과정 벤치마크 (단계별 시간, 최대 메모리, 출력 크기 → JSON)
+
+합성 데이터(synthetic_data.py)를 만들어 단계별로 잰다.
+  load     학생 데이터 CSV 읽기 (student_data.load_students)
+  index    사진 폴더 색인 (PhotoIndex)
+  grid     좌석 정보 계산과 클래스별 묶기 (seat_columns + group_class_seats)
+  photos   사진 경로 찾기 (resolve_photos)
+  emit     HTML 조각 생성과 파일 쓰기 (iter_class_seats_html)
+시간은 --repeat번 중 가장 짧은 값이며, 최대 메모리는 tracemalloc을 켠 별도 실행에서 잰다.
+--compare로 이전 결과 JSON을 주면 같은 설정끼리 단계별 배율을 함께 보여 준다.
+
+사용법:
+    python benchmarks/bench_pipeline.py
+    python benchmarks/bench_pipeline.py --classes 10 100 --class-size 35 --json results.json
+    python benchmarks/bench_pipeline.py --json new.json --compare old.json
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, ROOT)
+from create_combined_seating_html import (
+    PhotoIndex, group_class_seats, iter_class_seats_html, resolve_photos, seat_columns,
+)
+from student_data import SMALL_CSV_BYTES, load_students
+from synthetic_data import generate_dataset
+
+STAGES = ('load', 'index', 'grid', 'photos', 'emit')
+
+
+def run_pipeline(dataset, out_path, small_threshold, clock):
+    """한 번 실행하며 단계마다 clock(단계 이름)을 부르고 출력 크기(바이트)를 반환"""
+    clock('start')
+    data = load_students(dataset['csv'], small_threshold=small_threshold, cache_dir=None)
+    clock('load')
+    photo_index = PhotoIndex(dataset['image_root'], extra_roots=())
+    clock('index')
+    columns = seat_columns(data)
+    clock('grid')
+    image_paths, full_paths = resolve_photos(columns, photo_index)
+    clock('photos')
+    class_seats = group_class_seats(columns, image_paths, full_paths)
+    clock('grid')
+    size = 0
+    with open(out_path, 'wb') as f:
+        for chunk in iter_class_seats_html(class_seats):
+            f.write(chunk)
+            size += len(chunk)
+    clock('emit')
+    return size
+
+
+def measure(dataset, out_path, small_threshold, repeat, memory):
+    """단계별 최소 시간(초), 단계별 최대 메모리(바이트), 출력 크기 측정"""
+    best = {}
+    for _ in range(repeat):
+        times = dict.fromkeys(STAGES, 0.0)
+        last = [0.0]
+
+        def clock(stage):
+            now = time.perf_counter()
+            if stage != 'start':
+                times[stage] += now - last[0]
+            last[0] = now
+
+        output_bytes = run_pipeline(dataset, out_path, small_threshold, clock)
+        for stage, seconds in times.items():
+            best[stage] = min(best.get(stage, seconds), seconds)
+
+    peaks = {}
+    if memory:
+        tracemalloc.start()
+
+        def clock(stage):
+            if stage != 'start':
+                peaks[stage] = max(peaks.get(stage, 0), tracemalloc.get_traced_memory()[1])
+            tracemalloc.reset_peak()
+
+        run_pipeline(dataset, out_path, small_threshold, clock)
+        tracemalloc.stop()
+    return best, peaks, output_bytes
+
+
+def git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def config_key(config):
+    return tuple(sorted(config.items()))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--classes', type=int, nargs='+', default=[10, 100])
+    parser.add_argument('--class-size', type=int, nargs='+', default=[30])
+    parser.add_argument('--cols', type=int, default=6, help='한 줄의 자리 수')
+    parser.add_argument('--missing-score', type=float, default=0.1)
+    parser.add_argument('--missing-photo', type=float, default=0.1)
+    parser.add_argument('--loader', choices=('auto', 'records', 'frame'), default='auto',
+                        help='auto: 파일 크기로 결정, records: 항상 csv 모듈, frame: 항상 pandas')
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--no-memory', action='store_true', help='최대 메모리 측정 건너뛰기')
+    parser.add_argument('--json', help='결과를 저장할 JSON 파일')
+    parser.add_argument('--compare', help='비교할 이전 결과 JSON 파일')
+    args = parser.parse_args()
+
+    small_threshold = {'auto': SMALL_CSV_BYTES, 'records': float('inf'), 'frame': 0}[args.loader]
+    previous = {}
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            previous = {config_key(result['config']): result for result in json.load(f)['results']}
+
+    results = []
+    print(f"{'클래스':>6} {'크기':>5} " + ' '.join(f"{stage + '(ms)':>11}" for stage in STAGES)
+          + f" {'최대 메모리':>11} {'출력':>10}")
+    for classes in args.classes:
+        for class_size in args.class_size:
+            config = {'classes': classes, 'class_size': class_size, 'cols': args.cols,
+                      'missing_score': args.missing_score, 'missing_photo': args.missing_photo,
+                      'loader': args.loader}
+            with tempfile.TemporaryDirectory() as tmp:
+                dataset = generate_dataset(tmp, classes, class_size, args.cols, args.missing_score,
+                                           args.missing_photo)
+                times, peaks, output_bytes = measure(dataset, os.path.join(tmp, 'out.html'), small_threshold,
+                                                     args.repeat, not args.no_memory)
+            result = {'config': config, 'students': dataset['students'], 'seconds': times,
+                      'peak_bytes': peaks, 'output_bytes': output_bytes}
+            results.append(result)
+
+            peak = max(peaks.values()) if peaks else 0
+            print(f"{classes:>6} {class_size:>5} " + ' '.join(f"{times[stage] * 1000:>11.1f}" for stage in STAGES)
+                  + f" {peak / 1024 / 1024:>9.1f}MB {output_bytes / 1024:>8.0f}KB")
+            old = previous.get(config_key(config))
+            if old:
+                print(f"{'이전 대비':>12} " + ' '.join(
+                    f"{times[stage] / old['seconds'][stage]:>10.2f}x" if old['seconds'].get(stage) else f"{'-':>11}"
+                    for stage in STAGES))
+
+    if args.json:
+        report = {
+            'meta': {
+                'commit': git_commit(),
+                'python': platform.python_version(),
+                'platform': platform.platform(),
+                'time': time.strftime('%Y-%m-%dT%H:%M:%S'),
+                'repeat': args.repeat,
+            },
+            'results': results,
+        }
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=1)
+        print(f"✅ {args.json} 저장 완료")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""자리 배열(seat_grid) 벤치마크: 행 훑기 시간과 좌석당 메모리
+
+기존 방식은 (행, 열) → 좌석 딕셔너리를 만들고 행마다 모든 열을 두 번 찾아본다.
+
+사용법:
+    python benchmarks/bench_seat_grid.py
+    python benchmarks/bench_seat_grid.py --students 1000000 --n-cols 8
+"""
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from create_combined_seating_html import PhotoIndex, iter_seat_rows, prepare_class_seats
+from bench_grid_build import make_synthetic_frame
+
+
+def legacy_seat_rows(max_row, max_col, seats):
+    """기존 방식: 딕셔너리로 행마다 any() 확인 후 다시 찾아보기"""
+    seating_grid = {(seat[0], seat[1]): seat for seat in seats}
+    for row in range(1, max_row + 1):
+        if any((row, col) in seating_grid for col in range(1, max_col + 1)):
+            yield [seating_grid.get((row, col)) for col in range(1, max_col + 1)]
+
+
+def scan(class_seats, seat_rows):
+    start = time.perf_counter()
+    for _, max_row, max_col, seats in class_seats:
+        for _ in seat_rows(max_row, max_col, seats):
+            pass
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--students', type=int, default=300_000)
+    parser.add_argument('--class-size', type=int, default=30)
+    parser.add_argument('--n-cols', type=int, default=6)
+    args = parser.parse_args()
+
+    df = make_synthetic_frame(args.students, class_size=args.class_size, n_cols=args.n_cols)
+    photo_index = PhotoIndex()
+
+    tracemalloc.start()
+    class_seats = prepare_class_seats(df, photo_index)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"학생 {args.students}명: 좌석 데이터 {current / 1024 / 1024:.1f} MB ({current / args.students:.0f} B/좌석)")
+
+    old = scan(class_seats, legacy_seat_rows)
+    new = scan(class_seats, iter_seat_rows)
+    print(f"행 훑기: 기존 {old:.3f}s, 자리 배열 {new:.3f}s ({old / new:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""자리 배치 도우미(seating_solver) 속도 벤치마크
+
+클래스 크기별로 한 클래스를 푸는 시간과 행 평균 점수 차이를 잰다.
+
+사용법:
+    python benchmarks/bench_solver.py
+    python benchmarks/bench_solver.py --sizes 20 40 60 --classes 20 --max-jobs 4
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from seating_solver import build_problems, solve_class, solve_seating
+from bench_grid_build import make_synthetic_frame
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[20, 30, 40, 60])
+    parser.add_argument('--classes', type=int, default=10, help='병렬 측정에 쓸 클래스 수')
+    parser.add_argument('--max-jobs', type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    print(f"{'자리 수':>7} {'시간(ms)':>10} {'행 평균 차이':>14}")
+    for size in args.sizes:
+        df = make_synthetic_frame(size, class_size=size)
+        # 앞 두 학생은 떨어뜨리고, 뒤쪽 세 학생은 앞자리로
+        student_ids = df['학번'].astype(str).tolist()
+        constraints = {'apart': [(student_ids[0], student_ids[1])], 'front': student_ids[-3:], 'front_rows': 2}
+        (_, _, problem), = build_problems(df, constraints)[0]
+        _, seat_of, seconds = solve_class((problem, 1500, 0))
+        before, after = problem.describe(range(problem.n)), problem.describe(seat_of)
+        print(f"{size:>7} {seconds * 1000:>10.1f} {before[0]:>6.1f} → {after[0]:<5.1f}")
+
+    df = make_synthetic_frame(args.classes * 40, class_size=40)
+    print(f"\n40자리 클래스 {args.classes}개")
+    print(f"{'jobs':>5} {'시간(s)':>10}")
+    for jobs in range(1, args.max_jobs + 1):
+        start = time.perf_counter()
+        solve_seating(df, {'apart': [], 'front': [], 'front_rows': 2}, jobs=jobs)
+        print(f"{jobs:>5} {time.perf_counter() - start:>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
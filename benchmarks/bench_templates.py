@@ -0,0 +1,88 @@
+"""자리 HTML 생성 벤치마크 (f-string으로 매번 만드는 방식 vs 미리 해석한 틀 채우기)
+
+사용법:
+    python benchmarks/bench_templates.py
+    python benchmarks/bench_templates.py --students 100000
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from create_combined_seating_html import PhotoIndex, iter_class_tab_html, iter_seat_rows, prepare_class_seats
+from bench_grid_build import make_synthetic_frame
+
+
+def legacy_class_tab_html(class_num, max_row, max_col, seats, active=False):
+    """기존 방식: 자리마다 f-string으로 HTML을 만들어 이어 붙임"""
+    active_class = "active" if active else ""
+    html = f"""
+        <div id="class-{class_num}" class="tab-content {active_class}">
+            <div class="seating-container">
+                <table class="seating-table">
+"""
+    for seat_row in iter_seat_rows(max_row, max_col, seats):
+        html += "                    <tr>\n"
+        for seat in seat_row:
+            if seat is None:
+                html += '                        <td class="seat"></td>\n'
+                continue
+            _, _, score_class, score_emoji, score_text, label, name, image_path, full_path, _ = seat
+            if image_path:
+                full_attr = f' data-full="{full_path}"' if full_path else ''
+                image_html = (f'<img src="{image_path}"{full_attr} alt="{name}" class="student-photo" '
+                              f'loading="lazy" decoding="async">')
+            else:
+                image_html = '<div class="no-photo">👤</div>'
+            html += f"""                        <td class="seat {score_class}">
+                            {image_html}
+                            <div class="student-id">{label}</div>
+                            <div class="student-score">{score_emoji} {score_text}</div>
+                        </td>
+"""
+        html += "                    </tr>\n"
+    html += """                </table>
+            </div>
+        </div>
+"""
+    return html
+
+
+def template_class_tab_html(class_num, max_row, max_col, seats, active=False):
+    return ''.join(iter_class_tab_html(class_num, max_row, max_col, seats, active=active))
+
+
+def timed(render, class_seats):
+    start = time.perf_counter()
+    output = [render(class_num, max_row, max_col, seats) for class_num, max_row, max_col, seats in class_seats]
+    return time.perf_counter() - start, output
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--students', type=int, default=50_000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    df = make_synthetic_frame(args.students)
+    # 사진이 있는 자리도 재도록 절반은 이미지 경로를 채움
+    class_seats = [
+        (class_num, max_row, max_col,
+         [seat[:7] + (f"image/class_{class_num}/{seat[6]}.jpg" if i % 2 else "", "") + seat[9:]
+          for i, seat in enumerate(seats)])
+        for class_num, max_row, max_col, seats in prepare_class_seats(df, PhotoIndex())
+    ]
+
+    legacy = min(timed(legacy_class_tab_html, class_seats)[0] for _ in range(args.repeat))
+    template = min(timed(template_class_tab_html, class_seats)[0] for _ in range(args.repeat))
+    assert timed(legacy_class_tab_html, class_seats)[1] == timed(template_class_tab_html, class_seats)[1]
+
+    per_1k = 1000 / args.students * 1000
+    print(f"학생 {args.students}명 (1,000자리당 ms)")
+    print(f"  기존 f-string: {legacy * per_1k:.2f} ms")
+    print(f"  미리 해석한 틀: {template * per_1k:.2f} ms ({legacy / template:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
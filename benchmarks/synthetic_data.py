@@ -0,0 +1,107 @@
+"""벤치마크용 합성 학생 데이터 + 가짜 사진 파일 생성기
+
+integrated_student_data.csv와 같은 열(클래스/학번/이름/점수/행/열/파일명)의 CSV와
+image/class_N/<학번>_<이름>.jpg 사진 파일, image/all_class_images.csv를 만든다.
+사진은 Pillow가 있으면 작은 JPEG 한 장을 만들어 학생마다 끝에 학번을 덧붙여
+(내용 해시가 서로 다르도록) 쓰고, 없으면 빈 JPEG 머리/꼬리만 쓴다.
+
+사용법:
+    python benchmarks/synthetic_data.py /tmp/seating_data --classes 20 --class-size 35
+"""
+import argparse
+import csv
+import io
+import math
+import os
+import random
+
+SURNAMES = '김이박최정강조윤장임한오서신권황안송류홍'
+GIVEN_NAMES = '민서지현수준우윤하도영예은채시아진호연재'
+PLACEHOLDER_JPEG = b'\xff\xd8\xff\xd9'  # SOI + EOI
+
+
+def _photo_template(size):
+    """학생 사진 대신 쓸 작은 JPEG 바이트"""
+    try:
+        from PIL import Image
+    except ImportError:
+        return PLACEHOLDER_JPEG
+    buffer = io.BytesIO()
+    Image.new('RGB', size, (180, 200, 220)).save(buffer, 'JPEG', quality=80)
+    return buffer.getvalue()
+
+
+def generate_dataset(out_dir, classes=10, class_size=30, n_cols=6, missing_score_rate=0.1,
+                     missing_photo_rate=0.1, photos=True, photo_size=(120, 160), seed=0):
+    """합성 데이터를 out_dir에 쓰고 통계를 dict로 반환
+
+    n_cols는 한 줄의 자리 수이며 행 수는 클래스 크기에 맞춰 정해진다.
+    missing_photo_rate의 비율만큼은 CSV에 파일명을 적지 않는다.
+    photos가 False면 CSV만 쓴다 (파일명은 적지만 사진 파일은 없음).
+    """
+    rng = random.Random(seed)
+    template = _photo_template(photo_size) if photos else b''
+    image_root = os.path.join(out_dir, 'image')
+    os.makedirs(image_root, exist_ok=True)
+
+    student_rows, image_rows = [], []
+    photo_bytes = 0
+    for class_num in range(1, classes + 1):
+        folder = f"class_{class_num}"
+        if photos:
+            os.makedirs(os.path.join(image_root, folder), exist_ok=True)
+        for seat in range(class_size):
+            # 3XXYY 형태의 학번 (XX는 반, YY는 번호 - 100반/100번이 넘으면 자릿수가 늘어남)
+            student_id = f"3{class_num:02d}{seat + 1:02d}"
+            name = rng.choice(SURNAMES) + rng.choice(GIVEN_NAMES) + rng.choice(GIVEN_NAMES)
+            score = '' if rng.random() < missing_score_rate else f"{rng.uniform(30, 100):.1f}"
+            file_name = ''
+            if rng.random() >= missing_photo_rate:
+                file_name = f"{student_id}_{name}.jpg"
+                image_rows.append([class_num, student_id, name, file_name, f"{folder}\\{file_name}"])
+                if photos:
+                    data = template + student_id.encode('ascii')
+                    with open(os.path.join(image_root, folder, file_name), 'wb') as f:
+                        f.write(data)
+                    photo_bytes += len(data)
+            student_rows.append([class_num, student_id, name, score, seat // n_cols + 1, seat % n_cols + 1, file_name])
+
+    csv_path = os.path.join(out_dir, 'integrated_student_data.csv')
+    with open(csv_path, 'w', encoding='utf-8-sig', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(['클래스', '학번', '이름', '점수', '행', '열', '파일명'])
+        writer.writerows(student_rows)
+    with open(os.path.join(image_root, 'all_class_images.csv'), 'w', encoding='utf-8-sig', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(['클래스', '학번', '이름', '파일명', '파일경로'])
+        writer.writerows(image_rows)
+
+    return {
+        'csv': csv_path,
+        'image_root': image_root,
+        'students': len(student_rows),
+        'photos': len(image_rows) if photos else 0,
+        'photo_bytes': photo_bytes,
+        'grid': (math.ceil(class_size / n_cols), n_cols),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('out_dir')
+    parser.add_argument('--classes', type=int, default=10)
+    parser.add_argument('--class-size', type=int, default=30)
+    parser.add_argument('--cols', type=int, default=6, help='한 줄의 자리 수')
+    parser.add_argument('--missing-score', type=float, default=0.1, help='점수 없는 학생 비율')
+    parser.add_argument('--missing-photo', type=float, default=0.1, help='사진 없는 학생 비율')
+    parser.add_argument('--no-photos', action='store_true', help='사진 파일은 만들지 않음')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    stats = generate_dataset(args.out_dir, args.classes, args.class_size, args.cols, args.missing_score,
+                             args.missing_photo, photos=not args.no_photos, seed=args.seed)
+    print(f"✅ 학생 {stats['students']}명, 사진 {stats['photos']}장 ({stats['photo_bytes'] / 1024:.0f} KB) → {args.out_dir}")
+
+
+if __name__ == "__main__":
+    main()
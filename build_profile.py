@@ -0,0 +1,81 @@
+"""자리표 생성 단계별 측정 (--profile)
+
+단계(load, grid, photos, render, write 등)마다 걸린 시간, 호출 수, 바이트 수를 모으고
+클래스별 탭 생성 시간과 크기, 파일 시스템 확인(stat) 수 같은 횟수도 함께 기록한다.
+결과는 표로 출력하거나 JSON으로 저장할 수 있다.
+"""
+import json
+import platform
+import time
+from contextlib import contextmanager
+
+
+class BuildProfile:
+    """단계 이름 → [걸린 시간(초), 호출 수, 바이트 수] 기록"""
+
+    def __init__(self):
+        self.stages = {}
+        self.classes = {}   # 클래스 → [걸린 시간(초), 바이트 수]
+        self.counters = {}  # 'stat', '사진 찾기' 등의 횟수
+        self.started = time.perf_counter()
+
+    def add(self, stage, seconds, calls=1, nbytes=0):
+        entry = self.stages.setdefault(stage, [0.0, 0, 0])
+        entry[0] += seconds
+        entry[1] += calls
+        entry[2] += nbytes
+
+    @contextmanager
+    def stage(self, name, nbytes=0):
+        """with 블록 하나를 단계 한 번으로 기록"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, time.perf_counter() - start, nbytes=nbytes)
+
+    def add_class(self, class_num, seconds, nbytes):
+        self.classes[class_num] = [seconds, nbytes]
+
+    def count(self, name, n=1):
+        self.counters[name] = self.counters.get(name, 0) + n
+
+    def total_seconds(self):
+        return time.perf_counter() - self.started
+
+    def report_lines(self, slowest=5):
+        """사람이 읽을 표 (줄 목록)"""
+        # 한글 머리글은 두 칸씩 차지하므로 그만큼 폭을 줄임
+        lines = [f"   {'단계':<10}{'시간(ms)':>8}{'호출':>6}{'크기(KB)':>9}"]
+        for stage, (seconds, calls, nbytes) in self.stages.items():
+            size = f"{nbytes / 1024:.1f}" if nbytes else '-'
+            lines.append(f"   {stage:<12}{seconds * 1000:>10.1f}{calls:>8}{size:>11}")
+        lines.append(f"   {'합계':<10}{self.total_seconds() * 1000:>10.1f}")
+        if self.counters:
+            lines.append("   " + ", ".join(f"{name} {n}회" for name, n in self.counters.items()))
+        if self.classes:
+            ranked = sorted(self.classes.items(), key=lambda item: item[1][0], reverse=True)[:slowest]
+            lines.append("   느린 클래스: " + ", ".join(
+                f"{class_num}반 {seconds * 1000:.1f} ms ({nbytes / 1024:.1f} KB)"
+                for class_num, (seconds, nbytes) in ranked))
+        return lines
+
+    def to_dict(self, **meta):
+        """JSON으로 저장할 dict (meta는 그대로 함께 넣음)"""
+        return {
+            'meta': {
+                'time': time.strftime('%Y-%m-%dT%H:%M:%S'),
+                'python': platform.python_version(),
+                **meta,
+            },
+            'total_seconds': self.total_seconds(),
+            'stages': {stage: {'seconds': seconds, 'calls': calls, 'bytes': nbytes}
+                       for stage, (seconds, calls, nbytes) in self.stages.items()},
+            'classes': {str(class_num): {'seconds': seconds, 'bytes': nbytes}
+                        for class_num, (seconds, nbytes) in self.classes.items()},
+            'counters': self.counters,
+        }
+
+    def save_json(self, path, **meta):
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(**meta), f, ensure_ascii=False, indent=1)
@@ -1,650 +1,1158 @@
-import pandas as pd
+import argparse
+import base64
+from array import array
+import csv
+import hashlib
+import io
+import json
 import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
 from pathlib import Path
 
-def create_combined_seating_chart_html(df):
-    """모든 클래스의 자리표를 하나의 HTML 파일로 통합"""
-    
-    # 클래스 목록 가져오기
-    classes = sorted(df['클래스'].unique())
-    
-    # HTML 시작 부분
-    html_content = """
-<!DOCTYPE html>
-<html lang="ko">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>전체 클래스 자리표</title>
-    <style>
-        body {
-            font-family: 'Malgun Gothic', Arial, sans-serif;
-            margin: 0;
-            padding: 20px;
-            background-color: #f5f5f5;
-        }
-        
-        .header {
-            text-align: center;
-            margin-bottom: 0;
-            background: white;
-            padding: 15px 20px 10px 20px;
-            border-radius: 10px 10px 0 0;
-            box-shadow: 0 2px 10px rgba(0,0,0,0.1);
-        }
-        
-        .header h1 {
-            color: #2c3e50;
-            margin: 0;
-            font-size: 1.8em;
-        }
-        
-        /* 탭 스타일 */
-        .tab-container {
-            background: white;
-            border-radius: 0 0 10px 10px;
-            box-shadow: 0 2px 10px rgba(0,0,0,0.1);
-            margin-bottom: 20px;
-            overflow: hidden;
-        }
-        
-        .tab-buttons {
-            display: flex;
-            background: #ecf0f1;
-        }
-        
-        .tab-button {
-            flex: 1;
-            padding: 15px 20px;
-            background: #ecf0f1;
-            border: none;
-            cursor: pointer;
-            font-size: 1.1em;
-            font-weight: bold;
-            color: #7f8c8d;
-            transition: all 0.3s ease;
-        }
-        
-        .tab-button:hover {
-            background: #d5dbdb;
-        }
-        
-        .tab-button.active {
-            background: #3498db;
-            color: white;
-        }
-        
-        .tab-content {
-            display: none;
-            padding: 20px;
-        }
-        
-        .tab-content.active {
-            display: block;
-        }
-        
-        .seating-container {
-            display: flex;
-            justify-content: center;
-            margin-bottom: 30px;
-        }
-        
-        .seating-table {
-            border-collapse: separate;
-            border-spacing: 10px;
-            background: white;
-            padding: 20px;
-            border-radius: 15px;
-            box-shadow: 0 4px 15px rgba(0,0,0,0.1);
-        }
-        
-        .seat {
-            width: 120px;
-            height: 110px;
-            border: 2px solid #ddd;
-            border-radius: 8px;
-            text-align: center;
-            vertical-align: top;
-            padding: 5px 5px 2px 5px;
-            background: white;
-            transition: all 0.3s ease;
-            position: relative;
-            cursor: pointer;
-        }
-        
-        .seat:hover {
-            transform: translateY(-3px);
-            box-shadow: 0 6px 20px rgba(0,0,0,0.15);
-        }
-        
-        .seat.excellent {
-            border-color: #27ae60;
-            background: linear-gradient(135deg, #ffffff 0%, #f8fff8 100%);
-        }
-        
-        .seat.good {
-            border-color: #f39c12;
-            background: linear-gradient(135deg, #ffffff 0%, #fffdf8 100%);
-        }
-        
-        .seat.needs {
-            border-color: #e74c3c;
-            background: linear-gradient(135deg, #ffffff 0%, #fff8f8 100%);
-        }
-        
-        .seat.none {
-            border-color: #95a5a6;
-            background: linear-gradient(135deg, #ffffff 0%, #f8f9fa 100%);
-        }
-        
-        .student-photo {
-            width: 50px;
-            height: 50px;
-            border-radius: 12px;
-            object-fit: cover;
-            margin: 2px auto 5px;
-            border: 2px solid #fff;
-            box-shadow: 0 2px 6px rgba(0,0,0,0.2);
-            display: block;
-        }
-        
-        .no-photo {
-            width: 50px;
-            height: 50px;
-            border-radius: 12px;
-            background: #ecf0f1;
-            margin: 2px auto 5px;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            font-size: 1.2em;
-            color: #bdc3c7;
-        }
-        
-        .student-id {
-            font-size: 0.8em;
-            font-weight: bold;
-            color: #2c3e50;
-            margin-bottom: 3px;
-            line-height: 1.1;
-        }
-        
-        .student-score {
-            font-size: 0.75em;
-            font-weight: bold;
-            padding: 1px 4px;
-            border-radius: 10px;
-            display: inline-block;
-        }
-        
-        .excellent .student-score {
-            background: #27ae60;
-            color: white;
-        }
-        
-        .good .student-score {
-            background: #f39c12;
-            color: white;
-        }
-        
-        .needs .student-score {
-            background: #e74c3c;
-            color: white;
-        }
-        
-        .none .student-score {
-            background: #95a5a6;
-            color: white;
-        }
-        
-        /* 이미지 모달 스타일 */
-        .modal {
-            display: none;
-            position: fixed;
-            z-index: 1000;
-            left: 0;
-            top: 0;
-            width: 100%;
-            height: 100%;
-            background-color: rgba(0,0,0,0.8);
-            animation: fadeIn 0.3s;
-        }
-        
-        .modal-content {
-            position: absolute;
-            top: 50%;
-            left: 50%;
-            transform: translate(-50%, -50%);
-            background: white;
-            padding: 20px;
-            border-radius: 15px;
-            text-align: center;
-            box-shadow: 0 10px 30px rgba(0,0,0,0.3);
-            max-width: 90%;
-            max-height: 90%;
-        }
-        
-        .modal-image {
-            max-width: 300px;
-            max-height: 400px;
-            border-radius: 15px;
-            box-shadow: 0 5px 15px rgba(0,0,0,0.2);
-        }
-        
-        .modal-info {
-            margin-top: 15px;
-            font-size: 1.2em;
-            color: #2c3e50;
-        }
-        
-        .close {
-            position: absolute;
-            top: 10px;
-            right: 15px;
-            font-size: 28px;
-            font-weight: bold;
-            color: #aaa;
-            cursor: pointer;
-        }
-        
-        .close:hover {
-            color: #000;
-        }
-        
-        @keyframes fadeIn {
-            from { opacity: 0; }
-            to { opacity: 1; }
-        }
-        
-        /* 비밀번호 인증 스타일 */
-        .password-overlay {
-            position: fixed;
-            top: 0;
-            left: 0;
-            width: 100%;
-            height: 100%;
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            display: flex;
-            justify-content: center;
-            align-items: center;
-            z-index: 9999;
-        }
-        
-        .password-container {
-            background: white;
-            padding: 40px;
-            border-radius: 20px;
-            box-shadow: 0 20px 40px rgba(0,0,0,0.3);
-            text-align: center;
-            max-width: 400px;
-            width: 90%;
-        }
-        
-        .password-container h2 {
-            color: #2c3e50;
-            margin-bottom: 20px;
-            font-size: 1.5em;
-        }
-        
-        .password-input {
-            width: 100%;
-            padding: 15px;
-            font-size: 1.2em;
-            border: 2px solid #ddd;
-            border-radius: 10px;
-            margin-bottom: 20px;
-            text-align: center;
-            box-sizing: border-box;
-        }
+from student_data import DEFAULT_CACHE_DIR, DEFAULT_CSV, list_classes, load_students
+from seating_templates import (
+    EMPTY_SEAT, FULL_ATTR, HTML_HEAD_BYTES, HTML_HEAD_HEADER_BYTES, HTML_HEAD_STYLE_BYTES, HTML_HEAD_STYLE_END_BYTES,
+    HTML_HEAD_TABS_BYTES, HTML_TAIL_BYTES, LAZY_TAB_CLOSE, ROW_CLOSE, ROW_OPEN, SEARCH_BOX_BYTES, SEARCH_SCRIPT,
+    SEARCH_STYLE_BYTES, SEAT_NO_PHOTO, SEAT_PHOTO, SEAT_SPRITE, SPRITE_SCRIPT, SPRITE_STYLE, STATS_STYLE_BYTES,
+    STATS_TAB_BUTTON_BYTES, TAB_BUTTON, TAB_BUTTONS_END_BYTES, TAB_CLOSE, TAB_OPEN,
+)
+
+DEFAULT_OUTPUT = 'all_classes_seating_chart.html'
+
+# 자리 사진 표시 크기 (.student-photo)
+PHOTO_DISPLAY_SIZE = 50
+
+# 성적 구간: (CSS 클래스, 이모지) - 80점 이상 / 60점 이상 / 그 외 / 점수 없음 순서
+SCORE_BANDS = (
+    ("excellent", "🌟"),
+    ("good", "👍"),
+    ("needs", "💪"),
+    ("none", "❓"),
+)
+
+# 학생 사진 위치
+IMAGE_ROOT = 'image'
+EXTRA_IMAGE_ROOTS = ('student_images',)
+IMAGE_LIST_CSV = 'image/all_class_images.csv'
+
+class PhotoIndex:
+    """이미지 폴더를 한 번만 훑어서 (클래스, 파일명) → 이미지 경로를 찾아주는 색인
+    
+    찾는 순서는 image/class_N/ → student_images/ → image/ 이다.
+    같은 객체를 여러 클래스, 여러 번의 생성에 재사용할 수 있으며 refresh()는
+    수정 시간이 바뀐 폴더만 다시 읽는다.
+    """
+    
+    def __init__(self, image_root=IMAGE_ROOT, extra_roots=EXTRA_IMAGE_ROOTS):
+        self.image_root = image_root
+        self.extra_roots = tuple(extra_roots)
+        self.scan_count = 0
+        self.stat_count = 0  # os.stat / 존재 확인 횟수 (--profile 보고용)
+        self._dirs = {}  # 폴더 경로 -> (수정 시간, 파일명 집합)
+        self.refresh()
+    
+    def _scan_dir(self, path):
+        """폴더 하나를 scandir로 읽어 (수정 시간, 파일명 집합) 반환"""
+        self.stat_count += 1
+        try:
+            mtime = os.stat(path).st_mtime_ns
+            with os.scandir(path) as entries:
+                names = {entry.name for entry in entries}
+        except (FileNotFoundError, NotADirectoryError):
+            return None, set()
+        self.scan_count += 1
+        return mtime, names
+    
+    def _dir_is_current(self, path):
+        self.stat_count += 1
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except (FileNotFoundError, NotADirectoryError):
+            mtime = None
+        return path in self._dirs and self._dirs[path][0] == mtime
+    
+    def refresh(self):
+        """바뀐 폴더만 다시 읽어 색인 갱신"""
+        if not self._dir_is_current(self.image_root):
+            self._dirs[self.image_root] = self._scan_dir(self.image_root)
         
-        .password-input:focus {
-            outline: none;
-            border-color: #3498db;
-        }
+        # image/class_N 폴더 목록은 image 폴더 내용에서 얻음
+        class_dirs = [f"{self.image_root}/{name}" for name in self._dirs[self.image_root][1]
+                      if name.startswith('class_')]
+        for path in (*class_dirs, *self.extra_roots):
+            if not self._dir_is_current(path):
+                self._dirs[path] = self._scan_dir(path)
         
-        .password-button {
-            background: #3498db;
-            color: white;
-            border: none;
-            padding: 15px 30px;
-            font-size: 1.1em;
-            border-radius: 10px;
-            cursor: pointer;
-            transition: background 0.3s ease;
-        }
+        # 사라진 class_N 폴더 정리
+        for path in list(self._dirs):
+            if path != self.image_root and path not in self.extra_roots and path not in class_dirs:
+                del self._dirs[path]
+    
+    def _candidate_dirs(self, class_num):
+        return (f"{self.image_root}/class_{class_num}", *self.extra_roots, self.image_root)
+    
+    def resolve(self, class_num, file_name):
+        """파일명으로 실제 이미지 경로 찾기 (없으면 빈 문자열)"""
+        # 하위 폴더가 포함된 파일명은 색인으로 알 수 없으므로 직접 확인
+        if '/' in file_name or os.sep in file_name:
+            for directory in self._candidate_dirs(class_num):
+                path = f"{directory}/{file_name}"
+                self.stat_count += 1
+                if os.path.exists(path):
+                    return path
+            return ""
         
-        .password-button:hover {
-            background: #2980b9;
-        }
+        for directory in self._candidate_dirs(class_num):
+            entry = self._dirs.get(directory)
+            if entry is not None and file_name in entry[1]:
+                return f"{directory}/{file_name}"
+        return ""
+    
+    def class_photos(self):
+        """image/class_N 폴더의 모든 사진을 (폴더명, 파일명)으로 반환"""
+        prefix = f"{self.image_root}/"
+        for path, (_, names) in sorted(self._dirs.items()):
+            if path.startswith(prefix):
+                folder = path[len(prefix):]
+                for name in sorted(names):
+                    yield folder, name
+    
+    def check_image_list(self, csv_path=IMAGE_LIST_CSV):
+        """all_class_images.csv(파일경로)와 실제 폴더 비교
         
-        .password-error {
-            color: #e74c3c;
-            margin-top: 10px;
-            display: none;
-        }
+        (목록에 있지만 파일이 없는 사진, 파일은 있지만 목록에 없는 사진)을 반환한다.
+        """
+        listed = set()
+        with open(csv_path, encoding='utf-8-sig', newline='') as f:
+            for record in csv.DictReader(f):
+                folder, _, name = record['파일경로'].replace('\\', '/').rpartition('/')
+                listed.add((folder, name))
         
-        .main-content {
-            display: none;
-        }
+        on_disk = set(self.class_photos())
+        missing = sorted(listed - on_disk)
+        orphaned = sorted(on_disk - listed)
+        return missing, orphaned
+
+def score_band(score):
+    """점수 하나의 성적 구간 번호 (SCORE_BANDS 순서, 점수가 없으면 3)"""
+    if score is None:
+        return 3
+    if score >= 80:
+        return 0
+    if score >= 60:
+        return 1
+    return 2
+
+def score_band_array(scores):
+    """점수 열(Series) 전체의 (점수 있음 배열, float 점수 배열(없으면 NaN), 성적 구간 번호 배열)"""
+    import numpy as np
+    import pandas as pd
+    
+    has_score = scores.notna().to_numpy()
+    values = pd.to_numeric(scores).to_numpy(dtype=float, na_value=np.nan)
+    with np.errstate(invalid='ignore'):
+        band = np.select([~has_score, values >= 80, values >= 60], [3, 0, 1], default=2)
+    return has_score, values, band
+
+def _seat_columns_from_frame(df):
+    """DataFrame에서 좌석 정보를 열 단위 벡터 연산으로 계산"""
+    import numpy as np
+    import pandas as pd
+    
+    # 성적 구간 계산 (80/60 기준)
+    has_score, values, band = score_band_array(df['점수'])
+    band = band.tolist()
+    # 같은 값의 문자열은 객체 하나를 함께 씀 (학생 수가 많아도 좌석마다 문자열을 새로 만들지 않음)
+    score_classes = [SCORE_BANDS[b][0] for b in band]
+    score_emojis = [SCORE_BANDS[b][1] for b in band]
+    unique_texts, text_index = np.unique(
+        np.where(has_score, np.char.mod('%.0f', np.nan_to_num(values)), '-'), return_inverse=True)
+    unique_texts = unique_texts.tolist()
+    score_texts = [unique_texts[i] for i in text_index.tolist()]
+    
+    # 학번에서 반 번호 추출 (3XXYY 형태에서 XX 부분, 아니면 클래스 번호 사용)
+    student_ids = df['학번'].astype(str)
+    from_id = (student_ids.str.len() >= 4) & student_ids.str.startswith('3')
+    class_numbers = df['클래스'].astype(str)
+    if from_id.any():
+        class_numbers = class_numbers.where(~from_id, student_ids[from_id].str[1:3].astype(int).astype(str))
+    labels = class_numbers + '반 ' + df['이름'].astype(str)
+    
+    return {
+        '클래스': df['클래스'].tolist(),
+        '행': df['행'].tolist(),
+        '열': df['열'].tolist(),
+        'score_classes': score_classes,
+        'score_emojis': score_emojis,
+        'score_texts': score_texts,
+        'labels': labels.tolist(),
+        '이름': df['이름'].tolist(),
+        '학번': df['학번'].fillna('').astype(str).tolist(),
+        '파일명': [None if pd.isna(file_name) else file_name for file_name in df['파일명'].tolist()],
+        'groups': df.groupby('클래스', observed=True).indices,
+    }
+
+def _seat_columns_from_records(records):
+    """행(dict) 목록에서 좌석 정보 계산 (pandas 없이, 작은 입력용)"""
+    columns = {key: [] for key in ('클래스', '행', '열', 'score_classes', 'score_emojis', 'score_texts',
+                                   'labels', '이름', '학번', '파일명')}
+    groups = {}
+    for i, record in enumerate(records):
+        class_num, score = record['클래스'], record['점수']
+        score_class, score_emoji = SCORE_BANDS[score_band(score)]
         
-        @media print {
-            body { margin: 0; }
-            .password-overlay { display: none !important; }
-            .main-content { display: block !important; }
-            .tab-container { 
-                box-shadow: none;
-                margin-bottom: 0;
-            }
-            .tab-buttons { display: none; }
-            .tab-content { 
-                display: none !important;
-                padding: 0;
-            }
-            .tab-content.active { 
-                display: block !important;
-            }
-            .seating-table { 
-                page-break-inside: avoid;
-                box-shadow: none;
-            }
-            .modal { display: none !important; }
-            .header {
-                box-shadow: none;
-                margin-bottom: 10px;
-            }
-        }
-    </style>
-</head>
-<body>
-    <div class="password-overlay">
-        <div class="password-container">
-            <h2>비밀번호 인증</h2>
-            <input type="password" class="password-input" id="password-input" placeholder="비밀번호를 입력하세요">
-            <button class="password-button" id="password-button">인증</button>
-            <div class="password-error" id="password-error"></div>
-        </div>
-    </div>
-    
-    <div class="main-content">
-        <div class="header">
-            <h1>🏫 전체 클래스 자리표</h1>
-        </div>
+        # 학번에서 반 번호 추출 (3XXYY 형태에서 XX 부분)
+        student_id = str(record['학번'])
+        if len(student_id) >= 4 and student_id.startswith('3'):
+            class_number = str(int(student_id[1:3]))  # int로 변환하여 앞의 0 제거
+        else:
+            class_number = str(class_num)
         
-        <div class="tab-container">
-            <div class="tab-buttons">
-"""
+        columns['클래스'].append(class_num)
+        columns['행'].append(record['행'])
+        columns['열'].append(record['열'])
+        columns['score_classes'].append(score_class)
+        columns['score_emojis'].append(score_emoji)
+        columns['score_texts'].append("%.0f" % score if score is not None else "-")
+        columns['labels'].append(f"{class_number}반 {record['이름']}")
+        columns['이름'].append(record['이름'])
+        columns['학번'].append(record['학번'] or '')
+        columns['파일명'].append(record['파일명'])
+        groups.setdefault(class_num, []).append(i)
+    columns['groups'] = groups
+    return columns
+
+def seat_columns(data):
+    """DataFrame / 행(dict) 목록에서 좌석 정보를 열 단위로 계산"""
+    if isinstance(data, list):
+        return _seat_columns_from_records(data)
+    return _seat_columns_from_frame(data)
+
+def resolve_photos(columns, photo_index, thumbnails=None, photo_store=None):
+    """학생마다 (자리 이미지 경로, 모달 이미지 경로) 목록 두 개를 반환"""
     
-    # 탭 버튼 생성
-    for i, class_num in enumerate(classes):
-        active_class = "active" if i == 0 else ""
-        html_content += f'            <button class="tab-button {active_class}" onclick="showTab({class_num})">{class_num}반</button>\n'
+    # 이미지 경로 확인 (폴더는 색인으로 한 번만 읽음)
+    image_paths = [
+        "" if file_name is None else photo_index.resolve(class_num, file_name)
+        for class_num, file_name in zip(columns['클래스'], columns['파일명'])
+    ]
     
-    html_content += """        </div>
-"""
+    # 썸네일 / 내용 주소 사진으로 바꾸기 (바뀐 사진만 새로 생성)
+    full_paths = [""] * len(image_paths)
+    for store in (thumbnails, photo_store):
+        if store is None:
+            continue
+        replaced = store.build(path for path in image_paths if path)
+        for i, path in enumerate(image_paths):
+            if path in replaced:
+                image_paths[i], full_paths[i] = replaced[path]
+    return image_paths, full_paths
+
+def group_class_seats(columns, image_paths, full_paths):
+    """좌석 정보를 클래스별 (클래스, 최대 행, 최대 열, 좌석 목록)로 묶기"""
+    rows = columns['행']
+    cols = columns['열']
+    records = list(zip(
+        rows, cols, columns['score_classes'], columns['score_emojis'], columns['score_texts'],
+        columns['labels'], columns['이름'], image_paths, full_paths, columns['학번']
+    ))
     
-    # 각 클래스별 탭 콘텐츠 생성
-    for i, class_num in enumerate(classes):
-        active_class = "active" if i == 0 else ""
-        html_content += f"""
-        <div id="class-{class_num}" class="tab-content {active_class}">
-            <div class="seating-container">
-                <table class="seating-table">
-"""
-        
-        # 해당 클래스 학생들만 필터링
-        class_students = df[df['클래스'] == class_num].copy()
+    # 클래스별로 한 번에 묶기
+    class_seats = []
+    for class_num, positions in sorted(columns['groups'].items()):
+        seats = [records[i] for i in positions]
+        max_row = max(rows[i] for i in positions)
+        max_col = max(cols[i] for i in positions)
+        class_seats.append((class_num, max_row, max_col, seats))
+    return class_seats
+
+def prepare_class_seats(data, photo_index=None, thumbnails=None, photo_store=None, profile=None):
+    """전체 데이터를 한 번에 처리하여 클래스별 좌석 레코드 생성
+    
+    data는 pandas DataFrame 또는 student_data.read_csv_records()의 행(dict) 목록이다.
+    photo_index를 주지 않으면 새 PhotoIndex를 만들어 사용한다.
+    thumbnails(ThumbnailCache)를 주면 자리에는 썸네일을, 모달에는 중간 크기 사진을 쓴다.
+    photo_store(image_catalog.HashedPhotoStore)를 주면 원본 사진 대신 내용 주소 이름
+    (photo.<해시>.jpg)으로 복사한 사진을 쓴다.
+    반환값은 (클래스, 최대 행, 최대 열, 좌석 목록)의 리스트이며 클래스 순으로 정렬되어 있다.
+    좌석 하나는 (행, 열, 색상 클래스, 이모지, 점수 표시, 학생 표시, 이름, 이미지 경로,
+    모달 이미지 경로, 학번) 튜플이며 모달 이미지 경로가 빈 문자열이면 자리 이미지를 그대로 쓴다.
+    profile(build_profile.BuildProfile)을 주면 grid / photos 단계 시간과 stat 수를 기록한다.
+    """
+    stage = profile.stage if profile is not None else nullcontext
+    # grid 단계(좌석 정보 계산 + 클래스별 묶기)는 사진 찾기 앞뒤로 나뉘므로 합쳐서 한 번으로 기록
+    start = time.perf_counter()
+    columns = seat_columns(data)
+    grid_seconds = time.perf_counter() - start
+    if photo_index is None:
+        photo_index = PhotoIndex()
+    stat_count = photo_index.stat_count
+    with stage('photos'):
+        image_paths, full_paths = resolve_photos(columns, photo_index, thumbnails, photo_store)
+    start = time.perf_counter()
+    class_seats = group_class_seats(columns, image_paths, full_paths)
+    grid_seconds += time.perf_counter() - start
+    if profile is not None:
+        profile.add('grid', grid_seconds)
+        profile.count('사진 찾기', sum(1 for file_name in columns['파일명'] if file_name is not None))
+        profile.count('stat', photo_index.stat_count - stat_count)
+    return class_seats
+
+def build_photo_sprite(class_seats, thumbnails):
+    """모든 자리 썸네일을 한 장의 스프라이트로 합쳐 HTML에 넣을 정보 반환
+    
+    {'positions': {썸네일 경로: (열, 행)}, 'style': CSS, 'script': 스크립트, 'size': 바이트 수}
+    """
+    from thumbnails import THUMB_SIZE, build_sprite
+    
+    thumb_paths = {seat[7] for _, _, _, seats in class_seats for seat in seats if seat[7]}
+    data, positions, (n_cols, n_rows) = build_sprite(thumb_paths, thumbnails.fmt, thumbnails.quality)
+    data_url = f"data:image/{thumbnails.fmt};base64,{base64.b64encode(data).decode('ascii')}"
+    return {
+        'positions': positions,
+        'style': SPRITE_STYLE.fill(n_cols * PHOTO_DISPLAY_SIZE, n_rows * PHOTO_DISPLAY_SIZE),
+        'script': SPRITE_SCRIPT.fill(data_url, THUMB_SIZE[0]),
+        'size': len(data),
+    }
+
+def seat_grid(max_row, max_col, seats):
+    """좌석 목록을 빽빽한 자리 배열로 정리
+    
+    (자리 배열, 행별 학생 수)를 반환한다. 자리 배열은 (행-1)*max_col + (열-1) 위치에
+    seats 안의 좌석 번호를 담은 array('i')이며 빈 자리는 -1이다. 행별 학생 수는 행 번호로
+    바로 찾을 수 있도록 0번을 비워 둔 목록이다. 같은 자리에 두 명이 있으면 뒤의 학생이 앉는다.
+    """
+    cells = array('i', [-1]) * (max_row * max_col)
+    row_counts = [0] * (max_row + 1)
+    for i, seat in enumerate(seats):
+        row, col = seat[0], seat[1]
+        if 1 <= row <= max_row and 1 <= col <= max_col:
+            cell = (row - 1) * max_col + col - 1
+            if cells[cell] < 0:
+                row_counts[row] += 1
+            cells[cell] = i
+    return cells, row_counts
+
+def iter_seat_rows(max_row, max_col, seats):
+    """학생이 있는 행마다 열 순서의 좌석 목록(빈 자리는 None) 생성"""
+    cells, row_counts = seat_grid(max_row, max_col, seats)
+    
+    # 학생이 있는 행만 출력
+    for row in range(1, max_row + 1):
+        if row_counts[row]:
+            start = (row - 1) * max_col
+            yield [seats[i] if i >= 0 else None for i in cells[start:start + max_col]]
+
+def build_search_index(class_seats):
+    """검색 상자용 색인: {'classes': 클래스 목록, 'keys': 학생별 '반 이름 학번', 'seats': 학생별 4개씩의 수}
+    
+    seats에는 학생마다 (클래스 위치, 성적 구간 번호, 자리표 표의 행, 열)을 차례로 넣는다.
+    표에는 학생이 있는 행만 나오므로(iter_seat_rows) 표의 행은 자리의 행 번호와 다를 수 있다.
+    브라우저에서는 이 위치로 자리를 바로 찾으므로 자리표(DOM)를 훑지 않는다.
+    """
+    band_of = {score_class: i for i, (score_class, _) in enumerate(SCORE_BANDS)}
+    classes, keys, positions = [], [], []
+    for class_index, (class_num, max_row, max_col, seats) in enumerate(class_seats):
+        classes.append(str(class_num))
+        cells, row_counts = seat_grid(max_row, max_col, seats)
+        table_rows = [0] * (max_row + 1)
+        for row in range(1, max_row):
+            table_rows[row + 1] = table_rows[row] + bool(row_counts[row])
         
-        # 자리표 크기 결정
-        max_row = class_students['행'].max()
-        max_col = class_students['열'].max()
+        # 같은 자리에 두 명이 있으면 표에 나오는 학생만 넣음
+        for i in cells:
+            if i < 0:
+                continue
+            seat = seats[i]
+            keys.append(f"{seat[5]} {seat[9]}".rstrip())
+            positions.extend((class_index, band_of[seat[2]], table_rows[seat[0]], seat[1] - 1))
+    return {'classes': classes, 'keys': keys, 'seats': positions}
+
+def search_script(class_seats):
+    """검색 색인을 넣은 검색 스크립트 (UTF-8 바이트)"""
+    index = json.dumps(build_search_index(class_seats), ensure_ascii=False, separators=(',', ':'))
+    return SEARCH_SCRIPT.fill(index.replace('</', '<\\/')).encode('utf-8')
+
+def seat_tile(seat, sprite_positions):
+    """스프라이트 안의 사진 위치 ('열,행' 문자열, 없으면 빈 문자열)"""
+    if sprite_positions and seat[7] in sprite_positions:
+        return "%d,%d" % sprite_positions[seat[7]]
+    return ""
+
+def photo_url(path, photo_base):
+    """사진 경로를 photo_base 폴더(출력 HTML이 있는 곳)에서 가는 상대 주소로 바꿈
+    
+    photo_base가 None이거나 경로가 없으면 그대로 두고, 상대 주소를 만들 수 없으면
+    (윈도에서 드라이브가 다를 때) 원래 경로를 쓴다.
+    """
+    if not path or photo_base is None:
+        return path
+    try:
+        return os.path.relpath(path, photo_base).replace(os.sep, '/')
+    except ValueError:
+        return path
+
+def iter_class_tab_html(class_num, max_row, max_col, seats, active=False, sprite_positions=None, lazy=False,
+                        photo_base=None):
+    """한 클래스의 탭 콘텐츠를 <tr> 단위 조각(문자열)으로 생성
+    
+    sprite_positions가 있으면 사진을 <img> 대신 스프라이트 배경 위치로 표시한다.
+    lazy이면 자리표 대신 자리 데이터(JSON)만 넣고 탭을 처음 열 때 브라우저에서 만든다.
+    photo_base(출력 파일의 폴더)를 주면 사진 주소를 그 폴더 기준 상대 경로로 쓴다.
+    """
+    yield TAB_OPEN.fill(class_num, "active" if active else "")
+    
+    if lazy:
+        # 좌석: [색상 클래스, 이모지, 점수 표시, 학생 표시, 이름, 이미지, 모달 이미지, 스프라이트 위치]
+        rows = [
+            [list(seat[2:7]) + [photo_url(seat[7], photo_base), photo_url(seat[8], photo_base),
+                                seat_tile(seat, sprite_positions)] if seat else 0 for seat in row]
+            for row in iter_seat_rows(max_row, max_col, seats)
+        ]
+        seat_data = json.dumps(rows, ensure_ascii=False, separators=(',', ':')).replace('</', '<\\/')
+        yield LAZY_TAB_CLOSE.fill(seat_data)
+        return
+    
+    # 자리표 테이블 생성 (행 하나씩 내보냄)
+    fill_photo, fill_sprite, fill_no_photo = SEAT_PHOTO.fill, SEAT_SPRITE.fill, SEAT_NO_PHOTO.fill
+    for seat_row in iter_seat_rows(max_row, max_col, seats):
+        row_html = [ROW_OPEN]
         
-        # 자리표 데이터 준비
-        seating_grid = {}
-        for _, student in class_students.iterrows():
-            row, col = student['행'], student['열']
+        for seat in seat_row:
+            if seat is None:
+                row_html.append(EMPTY_SEAT)
+                continue
             
-            # 성적에 따른 색상 클래스
-            if pd.notna(student['점수']):
-                score = student['점수']
-                if score >= 80:
-                    score_class = "excellent"
-                    score_emoji = "🌟"
-                elif score >= 60:
-                    score_class = "good"
-                    score_emoji = "👍"
-                else:
-                    score_class = "needs"
-                    score_emoji = "💪"
-                score_text = f"{score:.0f}"
-            else:
-                score_class = "none"
-                score_emoji = "❓"
-                score_text = "-"
-            
-            # 이미지 경로 확인
-            image_path = ""
-            if pd.notna(student['파일명']):
-                # 상대 경로로 이미지 찾기
-                possible_paths = [
-                    f"image/class_{class_num}/{student['파일명']}",
-                    f"student_images/{student['파일명']}",
-                    f"image/{student['파일명']}"
-                ]
-                
-                for path in possible_paths:
-                    if os.path.exists(path):
-                        image_path = path
-                        break
+            _, _, score_class, score_emoji, score_text, label, name, image_path, full_path, _ = seat
             
-            # 학번에서 반 번호 추출 (3XXYY 형태에서 XX 부분)
-            student_id = str(student['학번'])
-            if len(student_id) >= 4 and student_id.startswith('3'):
-                class_number = str(int(student_id[1:3]))  # int로 변환하여 앞의 0 제거
+            # 사진 종류별 틀 (썸네일이면 큰 사진은 모달에서만 불러옴)
+            if sprite_positions and image_path in sprite_positions:
+                tile_col, tile_row = sprite_positions[image_path]
+                row_html.append(fill_sprite(score_class, f"{tile_col},{tile_row}", name,
+                                            tile_col * PHOTO_DISPLAY_SIZE, tile_row * PHOTO_DISPLAY_SIZE,
+                                            label, score_emoji, score_text))
+            elif image_path:
+                full_attr = FULL_ATTR.fill(photo_url(full_path, photo_base)) if full_path else ''
+                row_html.append(fill_photo(score_class, photo_url(image_path, photo_base), full_attr, name, label,
+                                           score_emoji, score_text))
             else:
-                class_number = str(class_num)
-            
-            seating_grid[(row, col)] = {
-                'id': f"{class_number}반 {student['이름']}",
-                'name': student['이름'],
-                'score_text': score_text,
-                'score_class': score_class,
-                'score_emoji': score_emoji,
-                'image_path': image_path,
-                'has_photo': pd.notna(student['파일명'])
-            }
-        
-        # 자리표 테이블 생성
-        for row in range(1, max_row + 1):
-            # 해당 행에 학생이 있는지 확인
-            has_students_in_row = any((row, col) in seating_grid for col in range(1, max_col + 1))
-            
-            # 학생이 있는 행만 출력
-            if has_students_in_row:
-                html_content += "                    <tr>\n"
-                
-                for col in range(1, max_col + 1):
-                    if (row, col) in seating_grid:
-                        student = seating_grid[(row, col)]
-                        
-                        # 이미지 HTML
-                        if student['image_path'] and os.path.exists(student['image_path']):
-                            image_html = f'<img src="{student["image_path"]}" alt="{student["name"]}" class="student-photo">'
-                        else:
-                            image_html = '<div class="no-photo">👤</div>'
-                        
-                        html_content += f"""                        <td class="seat {student['score_class']}">
-                            {image_html}
-                            <div class="student-id">{student['id']}</div>
-                            <div class="student-score">{student['score_emoji']} {student['score_text']}</div>
-                        </td>
-"""
-                    else:
-                        html_content += '                        <td class="seat"></td>\n'
-                
-                html_content += "                    </tr>\n"
+                row_html.append(fill_no_photo(score_class, label, score_emoji, score_text))
         
-        html_content += """                </table>
-            </div>
-        </div>
-"""
-    
-    html_content += """    </div>
-    </div>
-    
-    <!-- 이미지 모달 -->
-    <div id="imageModal" class="modal">
-        <div class="modal-content">
-            <span class="close">&times;</span>
-            <img id="modalImage" class="modal-image" src="" alt="">
-            <div id="modalInfo" class="modal-info"></div>
-        </div>
-    </div>
-    
-    <script>
-        // 탭 전환 함수
-        function showTab(classNum) {
-            // 모든 탭 버튼과 콘텐츠 비활성화
-            document.querySelectorAll('.tab-button').forEach(btn => btn.classList.remove('active'));
-            document.querySelectorAll('.tab-content').forEach(content => content.classList.remove('active'));
-            
-            // 선택된 탭 활성화
-            event.target.classList.add('active');
-            document.getElementById(`class-${classNum}`).classList.add('active');
-        }
-        
-        // 모달 관련 요소들
-        const modal = document.getElementById('imageModal');
-        const modalImage = document.getElementById('modalImage');
-        const modalInfo = document.getElementById('modalInfo');
-        const closeBtn = document.querySelector('.close');
-        
-        // 자리 클릭 시 학생 정보 강조 및 이미지 모달
-        document.querySelectorAll('.seat:not(:empty)').forEach(seat => {
-            seat.addEventListener('click', function() {
-                // 기존 강조 제거
-                document.querySelectorAll('.seat').forEach(s => s.style.transform = '');
-                
-                // 클릭된 자리 강조
-                this.style.transform = 'scale(1.05)';
-                
-                // 이미지가 있는 경우 모달 표시
-                const img = this.querySelector('.student-photo');
-                if (img) {
-                    modalImage.src = img.src;
-                    modalImage.alt = img.alt;
-                    
-                    const studentId = this.querySelector('.student-id').textContent;
-                    const studentScore = this.querySelector('.student-score').textContent;
-                    modalInfo.innerHTML = `<strong>${studentId}</strong><br>성적: ${studentScore}`;
-                    
-                    modal.style.display = 'block';
-                }
-                
-                // 3초 후 강조 해제
-                setTimeout(() => {
-                    this.style.transform = '';
-                }, 3000);
-            });
-        });
-        
-        // 모달 닫기
-        closeBtn.addEventListener('click', function() {
-            modal.style.display = 'none';
-        });
-        
-        // 모달 배경 클릭 시 닫기
-        modal.addEventListener('click', function(e) {
-            if (e.target === modal) {
-                modal.style.display = 'none';
-            }
-        });
-        
-        // ESC 키로 모달 닫기
-        document.addEventListener('keydown', function(e) {
-            if (e.key === 'Escape') {
-                modal.style.display = 'none';
-            }
-        });
-        
-        // 인쇄 기능
-        function printSeatingChart() {
-            window.print();
-        }
-        
-        // 키보드 단축키 (Ctrl+P)
-        document.addEventListener('keydown', function(e) {
-            if (e.ctrlKey && e.key === 'p') {
-                e.preventDefault();
-                printSeatingChart();
-            }
-        });
-        
-        // 비밀번호 인증
-        const passwordInput = document.getElementById('password-input');
-        const passwordButton = document.getElementById('password-button');
-        const passwordError = document.getElementById('password-error');
-        const mainContent = document.querySelector('.main-content');
-        const passwordOverlay = document.querySelector('.password-overlay');
-        
-        passwordButton.addEventListener('click', function() {
-            const password = passwordInput.value.trim();
-            if (password === '1679') {
-                mainContent.style.display = 'block';
-                passwordOverlay.style.display = 'none';
-            } else {
-                passwordError.style.display = 'block';
-                passwordError.textContent = '잘못된 비밀번호입니다.';
-                passwordInput.value = '';
-                passwordInput.focus();
-            }
-        });
-        
-        // Enter 키로 비밀번호 인증
-        passwordInput.addEventListener('keypress', function(e) {
-            if (e.key === 'Enter') {
-                passwordButton.click();
-            }
-        });
+        row_html.append(ROW_CLOSE)
+        yield ''.join(row_html)
+    
+    yield TAB_CLOSE
+
+def render_class_tab(task):
+    """탭 하나를 UTF-8 바이트로 만들고 (조각, 걸린 시간) 반환 (작업 프로세스에서도 실행됨)
+    
+    task는 (클래스, 최대 행, 최대 열, 좌석 목록, 활성 여부, 스프라이트 위치, 지연 여부, 사진 기준 폴더)이다.
+    """
+    class_num, max_row, max_col, seats, active, sprite_positions, lazy, photo_base = task
+    start = time.perf_counter()
+    fragment = ''.join(iter_class_tab_html(class_num, max_row, max_col, seats, active=active,
+                                           sprite_positions=sprite_positions, lazy=lazy,
+                                           photo_base=photo_base)).encode('utf-8')
+    return fragment, time.perf_counter() - start
+
+def iter_parallel_class_tabs(tasks, jobs, fragment_cache=None):
+    """탭 조각들을 프로세스 풀에서 만들어 클래스 순서대로 반환
+    
+    각 작업에는 그 클래스의 좌석 데이터만 넘긴다. fragment_cache가 있으면 캐시에 없는
+    클래스만 풀로 보낸다.
+    """
+    cached = {}
+    digests = {}
+    pending = []
+    for task in tasks:
+        if fragment_cache is not None:
+            fragment, digests[task[0]] = fragment_cache.lookup(*task)
+            if fragment is not None:
+                cached[task[0]] = fragment
+                continue
+        pending.append(task)
+    
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        chunksize = max(1, len(pending) // (jobs * 4))
+        rendered = zip(pending, pool.map(render_class_tab, pending, chunksize=chunksize))
+        for task in tasks:
+            class_num = task[0]
+            if class_num in cached:
+                yield cached.pop(class_num)
+                continue
+            _, (fragment, seconds) = next(rendered)
+            if fragment_cache is not None:
+                fragment_cache.store(class_num, digests[class_num], fragment, seconds)
+            yield fragment
+
+class FragmentCache:
+    """클래스별 탭 HTML 조각을 디스크에 보관하는 캐시 (증분 생성용)
+    
+    조각의 키는 그 클래스의 좌석 데이터(학생 행에서 계산한 값과 사진 경로), 참조하는 사진의
+    수정 시간, 탭 표시 옵션을 해시한 값이다. 키가 같으면 저장된 조각을 그대로 쓰고,
+    다르면 다시 만들어 저장한다.
+    """
+    
+    VERSION = 1  # 조각 HTML 형식이 바뀌면 올려서 기존 캐시를 무효화
+    
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR):
+        self.cache_dir = cache_dir
+        self.rebuilt = []  # (클래스, 걸린 시간) 목록
+        self.reused = []
+        self.stat_count = 0
+        self._manifest_path = os.path.join(cache_dir, 'manifest.json')
+        try:
+            with open(self._manifest_path, encoding='utf-8') as f:
+                self._manifest = json.load(f)
+        except (FileNotFoundError, ValueError):
+            self._manifest = {}
+        self._seen = set()
+    
+    def _fragment_path(self, class_num):
+        return os.path.join(self.cache_dir, f"class_{class_num}.html")
+    
+    def _read_fragment(self, class_num):
+        """저장된 조각 (없으면 None)"""
+        try:
+            with open(self._fragment_path(class_num), 'rb') as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+    
+    def _write_fragment(self, class_num, fragment):
+        os.makedirs(self.cache_dir, exist_ok=True)
+        with open(self._fragment_path(class_num), 'wb') as f:
+            f.write(fragment)
+    
+    def _remove_fragment(self, class_num):
+        try:
+            os.remove(self._fragment_path(class_num))
+        except FileNotFoundError:
+            pass
+    
+    def _digest(self, class_num, max_row, max_col, seats, options):
+        photo_mtimes = []
+        for seat in seats:
+            for path in (seat[7], seat[8]):
+                self.stat_count += bool(path)
+                try:
+                    photo_mtimes.append(os.stat(path).st_mtime_ns if path else 0)
+                except OSError:
+                    photo_mtimes.append(None)
+        key = repr((self.VERSION, str(class_num), max_row, max_col, seats, photo_mtimes, options))
+        return hashlib.sha256(key.encode('utf-8')).hexdigest()
+    
+    def lookup(self, class_num, max_row, max_col, seats, active=False, sprite_positions=None, lazy=False,
+               photo_base=None):
+        """(저장된 조각 또는 None, 키) 반환 - 조각이 None이면 다시 만들어 store()로 저장해야 함"""
+        tiles = [seat_tile(seat, sprite_positions) for seat in seats]
+        options = (active, lazy, tiles) if photo_base is None else (active, lazy, tiles, photo_base)
+        digest = self._digest(class_num, max_row, max_col, seats, options)
+        self._seen.add(str(class_num))
         
-        // 페이지 로드 시 비밀번호 입력창에 포커스
-        passwordInput.focus();
-    </script>
-</body>
-</html>
-"""
+        if self._manifest.get(str(class_num)) == digest:
+            fragment = self._read_fragment(class_num)
+            if fragment is not None:
+                self.reused.append(class_num)
+                return fragment, digest
+        return None, digest
+    
+    def store(self, class_num, digest, fragment, seconds):
+        """다시 만든 조각 저장"""
+        self._write_fragment(class_num, fragment)
+        self._manifest[str(class_num)] = digest
+        self.rebuilt.append((class_num, seconds))
+    
+    def render(self, class_num, max_row, max_col, seats, active=False, sprite_positions=None, lazy=False,
+               photo_base=None):
+        """캐시된 탭 조각(바이트)을 돌려주거나, 입력이 바뀌었으면 다시 만들어 저장 후 반환"""
+        fragment, digest = self.lookup(class_num, max_row, max_col, seats, active, sprite_positions, lazy, photo_base)
+        if fragment is None:
+            fragment, seconds = render_class_tab((class_num, max_row, max_col, seats, active, sprite_positions, lazy,
+                                                  photo_base))
+            self.store(class_num, digest, fragment, seconds)
+        return fragment
+    
+    def prune(self):
+        """이번 생성에 없던 클래스의 조각 삭제"""
+        for key in set(self._manifest) - self._seen:
+            del self._manifest[key]
+            self._remove_fragment(key)
+        self._seen = set()
+    
+    def save(self):
+        """매니페스트 저장 (이번 생성에 없던 클래스의 조각은 삭제)"""
+        self.prune()
+        os.makedirs(self.cache_dir, exist_ok=True)
+        tmp_path = self._manifest_path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self._manifest, f, ensure_ascii=False, indent=1, sort_keys=True)
+        os.replace(tmp_path, self._manifest_path)
+
+def iter_combined_seating_chart_html(df, photo_index=None, thumbnails=None, bundle=False, class_sizes=None,
+                                     lazy_tabs=False, fragment_cache=None, jobs=1, photo_store=None, profile=None,
+                                     search=True, analytics=False):
+    """모든 클래스의 자리표 HTML을 탭/행 단위 조각(UTF-8 바이트)으로 순서대로 생성
+    
+    정적인 부분은 미리 인코딩해 둔 바이트를 그대로 내보낸다.
+    bundle이면 썸네일을 스프라이트 한 장으로 합쳐 HTML 안에 넣는다 (thumbnails 필요).
+    lazy_tabs이면 첫 번째 탭만 자리표로 만들고 나머지는 자리 데이터(JSON)로 넣는다.
+    class_sizes(dict)를 주면 클래스별 탭 HTML 크기(바이트)를 기록한다.
+    fragment_cache(FragmentCache)를 주면 바뀐 클래스의 탭만 다시 만든다.
+    jobs가 2 이상이면 클래스별 탭을 프로세스 풀에서 나눠 만든다 (출력 순서와 내용은 같음).
+    photo_store(image_catalog.HashedPhotoStore)를 주면 사진 주소를 photo.<해시>.jpg로 바꾼다.
+    profile(build_profile.BuildProfile)을 주면 단계별 시간과 클래스별 탭 생성 시간/크기를 기록한다.
+    search이면 학생 찾기 상자와 성적 구간 필터, 그 검색 색인(이름, 학번, 반, 성적 구간)을 넣는다.
+    analytics이면 점수 통계(seating_analytics)를 한 번 계산해 '통계' 탭으로 넣는다.
+    """
+    
+    # 클래스별 좌석 데이터 미리 계산
+    class_seats = prepare_class_seats(df, photo_index, thumbnails, photo_store, profile)
+    score_stats = compute_analytics(df, profile) if analytics else None
+    yield from iter_class_seats_html(class_seats, thumbnails=thumbnails, bundle=bundle, class_sizes=class_sizes,
+                                     lazy_tabs=lazy_tabs, fragment_cache=fragment_cache, jobs=jobs, profile=profile,
+                                     search=search, score_stats=score_stats)
+    save_fragment_cache(fragment_cache, profile)
+
+def iter_class_seats_html(class_seats, thumbnails=None, bundle=False, class_sizes=None, lazy_tabs=False,
+                          fragment_cache=None, jobs=1, profile=None, search=True, score_stats=None,
+                          photo_base=None):
+    """prepare_class_seats()로 만든 클래스별 좌석 데이터로 자리표 HTML 조각(UTF-8 바이트) 생성
+    
+    옵션은 iter_combined_seating_chart_html과 같다. fragment_cache는 저장하지 않으므로
+    다 쓴 뒤 save_fragment_cache()를 불러야 한다 (여러 파일에 나눠 쓸 때 한 번만 저장하도록).
+    score_stats(compute_analytics()의 결과)를 주면 마지막에 '통계' 탭을 넣는다.
+    photo_base(출력 파일의 폴더)를 주면 사진 주소를 그 폴더 기준 상대 경로로 쓴다.
+    """
+    stage = profile.stage if profile is not None else nullcontext
+    sprite_positions = None
+    if bundle:
+        if thumbnails is None:
+            raise ValueError("한 파일 묶음(bundle)에는 썸네일(thumbnails)이 필요합니다")
+        with stage('sprite'):
+            sprite = build_photo_sprite(class_seats, thumbnails)
+        sprite_positions = sprite['positions']
+        if class_sizes is not None:
+            class_sizes['사진'] = sprite['size']
+    
+    if bundle or search or score_stats:
+        yield HTML_HEAD_STYLE_BYTES
+        if bundle:
+            yield sprite['style'].encode('utf-8')
+        if search:
+            yield SEARCH_STYLE_BYTES
+        if score_stats:
+            yield STATS_STYLE_BYTES
+        yield HTML_HEAD_STYLE_END_BYTES
+        if bundle:
+            yield sprite['script'].encode('utf-8')
+        yield HTML_HEAD_HEADER_BYTES
+        if search:
+            yield SEARCH_BOX_BYTES
+        yield HTML_HEAD_TABS_BYTES
+    else:
+        yield HTML_HEAD_BYTES
     
-    # HTML 파일 저장
-    filename = 'all_classes_seating_chart.html'
-    with open(filename, 'w', encoding='utf-8') as f:
-        f.write(html_content)
+    # 탭 버튼 생성
+    yield ''.join(
+        TAB_BUTTON.fill("active" if i == 0 else "", class_num, class_num)
+        for i, (class_num, _, _, _) in enumerate(class_seats)
+    ).encode('utf-8')
+    if score_stats:
+        yield STATS_TAB_BUTTON_BYTES
+    
+    yield TAB_BUTTONS_END_BYTES
     
-    file_size = os.path.getsize(filename) / 1024  # KB 단위
-    print(f"✅ {filename} 생성 완료 ({file_size:.1f} KB)")
+    # 각 클래스별 탭 콘텐츠 생성
+    parallel_tabs = None
+    if jobs > 1:
+        tasks = []
+        for i, (class_num, max_row, max_col, seats) in enumerate(class_seats):
+            # 작업 프로세스에는 그 클래스가 쓰는 스프라이트 위치만 넘김
+            class_positions = None
+            if sprite_positions:
+                class_positions = {seat[7]: sprite_positions[seat[7]] for seat in seats if seat[7] in sprite_positions}
+            tasks.append((class_num, max_row, max_col, seats, i == 0, class_positions, lazy_tabs and i > 0,
+                          photo_base))
+        parallel_tabs = iter_parallel_class_tabs(tasks, jobs, fragment_cache)
     
-    return filename
+    for i, (class_num, max_row, max_col, seats) in enumerate(class_seats):
+        start = time.perf_counter()
+        if parallel_tabs is not None:
+            tab_chunks = [next(parallel_tabs)]
+        elif fragment_cache is not None:
+            tab_chunks = [fragment_cache.render(class_num, max_row, max_col, seats, active=(i == 0),
+                                                sprite_positions=sprite_positions, lazy=(lazy_tabs and i > 0),
+                                                photo_base=photo_base)]
+        else:
+            tab_chunks = (chunk.encode('utf-8') for chunk in iter_class_tab_html(
+                class_num, max_row, max_col, seats, active=(i == 0),
+                sprite_positions=sprite_positions, lazy=(lazy_tabs and i > 0), photo_base=photo_base))
+        if profile is not None:
+            # 측정할 때는 탭을 한 번에 만들어 시간과 크기를 기록
+            fragment = b''.join(tab_chunks)
+            seconds = time.perf_counter() - start
+            profile.add('render', seconds, nbytes=len(fragment))
+            profile.add_class(class_num, seconds, len(fragment))
+            tab_chunks = [fragment]
+        if class_sizes is None:
+            yield from tab_chunks
+            continue
+        class_sizes[class_num] = 0
+        for chunk in tab_chunks:
+            class_sizes[class_num] += len(chunk)
+            yield chunk
+    
+    if score_stats:
+        from seating_analytics import iter_stats_tab_html
+        with stage('analytics'):
+            stats_tab = b''.join(iter_stats_tab_html(score_stats))
+        if class_sizes is not None:
+            class_sizes['통계'] = len(stats_tab)
+        yield stats_tab
+    
+    if search:
+        with stage('search'):
+            script = search_script(class_seats)
+        if class_sizes is not None:
+            class_sizes['검색'] = len(script)
+        yield script
+    yield HTML_TAIL_BYTES
+
+def compute_analytics(data, profile=None):
+    """점수 통계 계산 (seating_analytics.compute_score_stats, profile이 있으면 analytics 단계로 기록)"""
+    from seating_analytics import compute_score_stats
+    stage = profile.stage if profile is not None else nullcontext
+    with stage('analytics'):
+        return compute_score_stats(data)
 
-def main():
+def save_fragment_cache(fragment_cache, profile=None):
+    """조각 캐시 저장 (없으면 아무것도 안 함, profile이 있으면 시간과 stat 수 기록)"""
+    if fragment_cache is None:
+        return
+    start = time.perf_counter()
+    fragment_cache.save()
+    if profile is not None:
+        profile.add('cache save', time.perf_counter() - start)
+        profile.count('stat', fragment_cache.stat_count)
+        fragment_cache.stat_count = 0
+
+def write_chunks(chunks, out, profile=None):
+    """HTML 조각들을 파일 객체(out)에 차례로 기록하고 쓴 바이트 수 반환
+    
+    out은 바이너리/텍스트 파일 객체 모두 가능하다.
+    profile이 있으면 쓰기(write) 단계의 시간과 바이트를 기록한다.
+    """
+    binary = isinstance(out, (io.RawIOBase, io.BufferedIOBase)) or 'b' in getattr(out, 'mode', '')
+    write = out.write if binary else (lambda chunk: out.write(chunk.decode('utf-8')))
+    size = 0
+    if profile is not None:
+        for chunk in chunks:
+            start = time.perf_counter()
+            write(chunk)
+            profile.add('write', time.perf_counter() - start, nbytes=len(chunk))
+            size += len(chunk)
+    else:
+        for chunk in chunks:
+            write(chunk)
+            size += len(chunk)
+    return size
+
+def write_html_file(filename, chunks, profile=None):
+    """HTML 조각들을 임시 파일에 다 쓴 뒤 filename으로 바꿔치기하고 바이트 수 반환
+    
+    열어 둔 브라우저나 서버가 반쯤 쓴 파일을 읽지 않도록 한다.
+    """
+    folder = os.path.dirname(filename)
+    if folder:
+        os.makedirs(folder, exist_ok=True)
+    tmp_path = filename + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        size = write_chunks(chunks, f, profile)
+    start = time.perf_counter()
+    os.replace(tmp_path, filename)
+    if profile is not None:
+        profile.add('write', time.perf_counter() - start, calls=0)
+    return size
+
+def write_combined_seating_chart_html(df, out, **options):
+    """자리표 HTML을 파일 객체(out)에 조각 단위로 바로 기록 (전체 문서를 메모리에 올리지 않음)
+    
+    out은 바이너리/텍스트 파일 객체 모두 가능하다.
+    options는 iter_combined_seating_chart_html에 그대로 전달된다.
+    options에 profile이 있으면 쓰기(write) 단계의 시간과 바이트도 기록한다.
+    """
+    write_chunks(iter_combined_seating_chart_html(df, **options), out, options.get('profile'))
+
+def select_classes(data, classes):
+    """지정한 클래스의 학생만 남긴 데이터 (data와 같은 형태, 클래스는 문자열로 비교)"""
+    wanted = {str(class_num) for class_num in classes}
+    if isinstance(data, list):
+        return [record for record in data if str(record['클래스']) in wanted]
+    return data[data['클래스'].astype(str).isin(wanted)]
+
+def class_output_path(pattern, class_num):
+    """클래스별 출력 경로: {class_num}을 바꾸거나, 없으면 파일 이름 뒤에 _<클래스>를 붙임"""
+    if '{class_num}' in pattern:
+        return pattern.replace('{class_num}', str(class_num))
+    stem, ext = os.path.splitext(pattern)
+    return f"{stem}_{class_num}{ext or '.html'}"
+
+class RenderResult:
+    """render()의 결과
+    
+    outputs는 (출력 대상, 바이트 수) 목록이고 출력 대상은 파일 경로, 파일 객체 또는 '-'이다.
+    class_sizes는 {클래스: 탭 HTML 바이트 수}이며 한 파일 묶음이면 '사진' 항목에 스프라이트 크기가,
+    검색 상자를 넣으면 '검색' 항목에 검색 색인과 스크립트 크기가, 점수 통계를 넣으면 '통계' 항목에
+    통계 탭 크기가 있다.
+    """
+    
+    def __init__(self, outputs, students, classes, class_sizes, seconds, profile=None):
+        self.outputs = outputs
+        self.students = students
+        self.classes = classes
+        self.class_sizes = class_sizes
+        self.seconds = seconds
+        self.profile = profile
+    
+    @property
+    def paths(self):
+        """파일로 쓴 출력 경로 목록"""
+        return [target for target, _ in self.outputs if isinstance(target, str) and target != '-']
+    
+    @property
+    def total_bytes(self):
+        return sum(size for _, size in self.outputs)
+    
+    def __repr__(self):
+        return (f"RenderResult(outputs={len(self.outputs)}, students={self.students}, "
+                f"classes={self.classes}, bytes={self.total_bytes}, seconds={self.seconds:.3f})")
+
+def render(source, out=DEFAULT_OUTPUT, image_roots=None, classes=None, split=False, photo_index=None,
+           cache_dir=DEFAULT_CACHE_DIR, photo_store=None, analytics=False, **options):
+    """자리표 생성 라이브러리 API - RenderResult 반환
+    
+    source: pandas DataFrame, student_data.read_csv_records()의 행 목록, 또는 CSV 경로
+    out: 파일 경로, 쓰기 가능한 파일 객체, 또는 표준 출력을 뜻하는 '-'
+    image_roots: 사진 폴더 목록 (첫 번째는 class_N 폴더가 있는 곳, 기본값: image, student_images)
+    classes: 이 클래스들만 생성 (기본값: 전체)
+    split: 클래스마다 한 파일로 나눠 쓰기. out에 {class_num}이 있으면 클래스 번호로 바꾸고,
+        없으면 파일 이름 뒤에 _<클래스>를 붙인다. 데이터 처리는 모든 파일에 한 번만 한다.
+    photo_index: 이미 만든 PhotoIndex (같은 프로세스에서 여러 번 생성할 때 재사용)
+    cache_dir: CSV 경로를 줄 때 쓰는 데이터 캐시 폴더
+    options(thumbnails, bundle, lazy_tabs, fragment_cache, jobs, profile, search)와 photo_store, analytics는
+    iter_combined_seating_chart_html과 같다. 점수 통계는 한 번만 계산해 파일마다 그 파일의 클래스만 넣는다.
+    """
+    start = time.perf_counter()
+    profile = options.get('profile')
+    if isinstance(source, (str, os.PathLike)):
+        load_start = time.perf_counter()
+        source = load_students(os.fspath(source), cache_dir=cache_dir)
+        if profile is not None:
+            profile.add('load', time.perf_counter() - load_start)
+    if classes is not None:
+        source = select_classes(source, classes)
+    if photo_index is None:
+        roots = list(image_roots) if image_roots else [IMAGE_ROOT, *EXTRA_IMAGE_ROOTS]
+        photo_index = PhotoIndex(roots[0], roots[1:])
+    
+    class_seats = prepare_class_seats(source, photo_index, options.get('thumbnails'), photo_store, profile)
+    score_stats = compute_analytics(source, profile) if analytics else None
+    
+    if not split:
+        targets = [(out, class_seats)]
+    elif out == '-' or hasattr(out, 'write'):
+        raise ValueError("클래스별 파일로 나눠 쓰려면(split) 출력 경로가 필요합니다")
+    else:
+        targets = [(class_output_path(out, entry[0]), [entry]) for entry in class_seats]
+    
+    outputs = []
+    class_sizes = {}
+    for target, seats in targets:
+        sizes = {}
+        if score_stats is not None:
+            options['score_stats'] = {entry[0]: score_stats[entry[0]] for entry in seats if entry[0] in score_stats}
+        # 파일로 쓸 때는 사진 주소를 그 파일의 폴더 기준으로 (다른 폴더에 써도 사진이 보이도록)
+        photo_base = None
+        if isinstance(target, (str, os.PathLike)) and target != '-':
+            photo_base = os.path.dirname(os.path.abspath(target))
+        chunks = iter_class_seats_html(seats, class_sizes=sizes, photo_base=photo_base, **options)
+        if target == '-':
+            size = write_chunks(chunks, sys.stdout.buffer, profile)
+            sys.stdout.buffer.flush()
+        elif hasattr(target, 'write'):
+            size = write_chunks(chunks, target, profile)
+        else:
+            size = write_html_file(target, chunks, profile)
+        outputs.append((target, size))
+        for key, value in sizes.items():
+            class_sizes[key] = class_sizes.get(key, 0) + value
+    save_fragment_cache(options.get('fragment_cache'), profile)
+    
+    return RenderResult(outputs, len(source), [entry[0] for entry in class_seats], class_sizes,
+                        time.perf_counter() - start, profile)
+
+def create_combined_seating_chart_html(df, output=DEFAULT_OUTPUT, **options):
+    """모든 클래스의 자리표를 하나의 HTML 파일로 통합
+    
+    output에는 파일 경로, 쓰기 가능한 파일 객체, 또는 표준 출력을 뜻하는 '-'를 줄 수 있다.
+    options(photo_index, thumbnails, bundle, lazy_tabs, fragment_cache, jobs, photo_store, profile,
+    search, analytics, classes, split)는 render()에 그대로 전달된다. 파일로 쓰면 크기를 출력하고 파일 경로를
+    (split이면 경로 목록을) 반환한다.
+    """
+    result = render(df, output, **options)
+    
+    # 표준 출력 / 파일 객체로 스트리밍
+    if output == '-' or hasattr(output, 'write'):
+        return output
+    
+    for filename, size in result.outputs:
+        print(f"✅ {filename} 생성 완료 ({size / 1024:.1f} KB)")
+    
+    # 한 파일 묶음은 클래스별 크기도 보고
+    if options.get('bundle'):
+        for key, size in result.class_sizes.items():
+            label = {'사진': "사진 스프라이트", '검색': "검색 색인", '통계': "점수 통계"}.get(key, f"{key}반")
+            print(f"   - {label}: {size / 1024:.1f} KB")
+    
+    return result.paths if options.get('split') else result.paths[0]
+
+def parse_args(argv=None):
+    """명령행 옵션 처리"""
+    parser = argparse.ArgumentParser(description="통합 자리표 HTML 생성기")
+    parser.add_argument('--csv', default=DEFAULT_CSV,
+                        help=f'학생 데이터 CSV (기본값: {DEFAULT_CSV})')
+    parser.add_argument('--output', '-o', default=DEFAULT_OUTPUT,
+                        help=f"출력 HTML 파일, '-'이면 표준 출력 (기본값: {DEFAULT_OUTPUT})")
+    parser.add_argument('--image-root', default=IMAGE_ROOT,
+                        help=f'class_N 사진 폴더가 있는 곳 (기본값: {IMAGE_ROOT})')
+    parser.add_argument('--extra-image-root', action='append', metavar='DIR',
+                        help=f"사진을 더 찾아볼 폴더, 여러 번 줄 수 있음 (기본값: {', '.join(EXTRA_IMAGE_ROOTS)})")
+    parser.add_argument('--classes', nargs='+', metavar='N',
+                        help='이 클래스들만 생성 (기본값: 전체)')
+    parser.add_argument('--split', action='store_true',
+                        help='클래스마다 한 파일로 나눠 쓰기 (--output에 {class_num}이 있으면 클래스 번호로 바꿈)')
+    parser.add_argument('--thumbnails', action='store_true',
+                        help='원본 사진 대신 작은 썸네일을 만들어 사용 (Pillow 필요)')
+    parser.add_argument('--thumbnail-dir', default='thumbnails',
+                        help='썸네일 캐시 폴더 (기본값: thumbnails)')
+    parser.add_argument('--bundle', action='store_true',
+                        help='사진까지 HTML 한 파일에 넣기 (썸네일 스프라이트, Pillow 필요)')
+    parser.add_argument('--lazy-tabs', action='store_true',
+                        help='첫 번째 탭만 바로 그리고 나머지 탭은 처음 열 때 그리기')
+    parser.add_argument('--no-search', dest='search', action='store_false',
+                        help='학생 찾기 상자와 성적 구간 필터(검색 색인)를 넣지 않기')
+    parser.add_argument('--analytics', action='store_true',
+                        help="클래스별 평균/중앙값, 성적 구간별 학생 수, 행/열 평균 열지도를 '통계' 탭으로 넣기")
+    parser.add_argument('--incremental', action='store_true',
+                        help='바뀐 클래스의 탭만 다시 만들고 나머지는 캐시된 조각 사용')
+    parser.add_argument('--cache-dir', default=DEFAULT_CACHE_DIR,
+                        help=f'증분 생성용 조각 / 데이터 캐시 폴더 (기본값: {DEFAULT_CACHE_DIR})')
+    parser.add_argument('--jobs', '-j', type=int, default=1,
+                        help='클래스별 탭을 나눠 만들 프로세스 수 (기본값: 1)')
+    parser.add_argument('--hashed-photos', metavar='DIR',
+                        help='사진을 DIR/photo.<해시>.jpg 이름으로 복사해 사용 (오래 캐시해도 되는 주소)')
+    parser.add_argument('--static-assets', action='store_true',
+                        help='정적 호스팅용: CSS/JS를 assets/에 내용 해시 이름으로 꺼내고 .gz/.br 압축본과 '
+                             'static-manifest.json(ETag, Cache-Control) 만들기')
+    parser.add_argument('--roster-store', metavar='DIR',
+                        help='생성한 명단을 DIR에 학기/클래스별 스냅숏으로 쌓고 지난 생성 이후 바뀐 클래스 보고 (pyarrow 필요)')
+    parser.add_argument('--term', help='--roster-store에 기록할 학기 이름 (기본값: 오늘 날짜의 학기, 예: 2026-2)')
+    parser.add_argument('--watch', action='store_true',
+                        help='CSV와 사진 폴더를 감시하다가 바뀐 클래스의 탭만 다시 만들기 (Ctrl+C로 종료)')
+    parser.add_argument('--serve', type=int, metavar='PORT',
+                        help='--watch와 함께 http://127.0.0.1:PORT/ 에서 자리표를 보여 주고 바뀌면 자동 새로 고침')
+    parser.add_argument('--profile', action='store_true',
+                        help='단계별(load/grid/photos/render/write) 시간, 호출 수, 크기, stat 수 보고')
+    parser.add_argument('--profile-json', metavar='FILE',
+                        help='단계별 측정 결과를 JSON으로 저장 (--profile 포함)')
+    parser.add_argument('--profile-dump', metavar='FILE',
+                        help='cProfile 결과를 FILE에 저장하고 오래 걸린 함수 보고 (--profile 포함)')
+    args = parser.parse_args(argv)
+    if args.profile_json or args.profile_dump:
+        args.profile = True
+    if args.serve is not None:
+        args.watch = True
+    if args.extra_image_root is None:
+        args.extra_image_root = list(EXTRA_IMAGE_ROOTS)
+    if args.split and args.output == '-':
+        parser.error("--split에는 파일 경로 --output이 필요합니다")
+    if args.static_assets and (args.watch or args.output == '-'):
+        parser.error("--static-assets는 파일 출력에서만 쓸 수 있고 --watch/--serve와 함께 쓸 수 없습니다")
+    if args.watch and (args.split or args.output == '-'):
+        parser.error("--watch/--serve는 한 파일 출력에서만 쓸 수 있습니다")
+    if args.hashed_photos and (args.thumbnails or args.bundle):
+        parser.error("--hashed-photos는 --thumbnails/--bundle과 함께 쓸 수 없습니다 (썸네일 이름은 이미 내용 해시)")
+    return args
+
+def report_profile(profile, cprofiler, args, paths, df, classes):
+    """--profile 결과 출력 (--profile-json / --profile-dump가 있으면 파일로도 저장)"""
+    if cprofiler is not None:
+        cprofiler.disable()
+    
+    print("\n⏱️ 단계별 측정")
+    for line in profile.report_lines():
+        print(line)
+    
+    if cprofiler is not None:
+        import pstats
+        cprofiler.dump_stats(args.profile_dump)
+        print(f"\n🔬 cProfile 결과 저장: {args.profile_dump} (누적 시간 상위 10개)")
+        stream = io.StringIO()
+        pstats.Stats(cprofiler, stream=stream).sort_stats('cumulative').print_stats(10)
+        for line in stream.getvalue().splitlines():
+            if line.strip():
+                print(f"   {line}")
+    
+    if args.profile_json:
+        profile.save_json(args.profile_json, argv=sys.argv[1:], students=len(df), classes=len(classes),
+                          output=paths, output_bytes=sum(os.path.getsize(path) for path in paths))
+        print(f"📝 단계별 측정 JSON 저장: {args.profile_json}")
+
+def report_static_assets(paths, profile=None):
+    """--static-assets: HTML에서 CSS/JS를 꺼내고 압축본과 static-manifest.json을 만든 뒤 결과 출력"""
+    from static_assets import HAS_BROTLI, MANIFEST_NAME, export_static
+    start = time.perf_counter()
+    export = export_static(paths)
+    if profile is not None:
+        profile.add('static', time.perf_counter() - start)
+    html_bytes = sum(os.path.getsize(path) for path in paths)
+    gzip_bytes = sum(os.path.getsize(path + '.gz') for path in paths)
+    print(f"📦 정적 자산: CSS/JS 새로 씀 {export.written}개, 이미 있음 {export.reused}개"
+          f" ({os.path.relpath(export.asset_dir)}/)")
+    print(f"   HTML {export.original_bytes / 1024:.1f} KB → {html_bytes / 1024:.1f} KB"
+          f" (gzip {gzip_bytes / 1024:.1f} KB"
+          + (f", brotli {sum(os.path.getsize(path + '.br') for path in paths) / 1024:.1f} KB)" if HAS_BROTLI
+             else ", brotli 패키지가 없어 .br 생략)"))
+    print(f"   캐시 헤더 목록: {os.path.relpath(os.path.join(export.root, MANIFEST_NAME))}")
+    if export.skipped:
+        print(f"⚠️ 목록에 넣지 않은 사진 {len(export.skipped)}개 ({export.skipped_summary()})")
+
+def report_roster_snapshot(args, df):
+    """--roster-store: 이번 명단을 스냅숏으로 쌓고 지난 스냅숏 이후 바뀐 클래스 출력"""
+    from roster_store import RosterStore
+    store = RosterStore(args.roster_store)
+    snapshot, added = store.append(df, args.term, source=args.csv)
+    if not added:
+        print(f"🗂️ 명단 스냅숏: {snapshot['id']}번과 같음 ({snapshot['term']})")
+        return
+    print(f"🗂️ 명단 스냅숏 {snapshot['id']}번 추가 ({snapshot['term']}, 새 파일 {store.files_written}개)")
+    if len(store.snapshots) > 1:
+        changes = store.changed_classes()
+        summary = ", ".join(f"{label} {', '.join(changes[key])}" for label, key in
+                            (('새 클래스', 'added'), ('없어진 클래스', 'removed'), ('바뀐 클래스', 'changed'))
+                            if changes[key])
+        print(f"   지난 스냅숏 이후: {summary or '바뀐 클래스 없음'}")
+
+def main(argv=None):
     """메인 함수"""
+    args = parse_args(argv)
+    
     print("=" * 60)
     print("              통합 자리표 HTML 생성기")
     print("=" * 60)
     
+    # 단계별 측정 (--profile)
+    profile = cprofiler = None
+    if args.profile:
+        from build_profile import BuildProfile
+        profile = BuildProfile()
+    if args.profile_dump:
+        import cProfile
+        cprofiler = cProfile.Profile()
+        cprofiler.enable()
+    
     # 데이터 로드
     try:
-        df = pd.read_csv('integrated_student_data.csv', encoding='utf-8-sig')
+        # 열 자료형을 정해 읽기 (작은 파일은 pandas 없이)
+        start = time.perf_counter()
+        df = load_students(args.csv, cache_dir=args.cache_dir)
+        if profile is not None:
+            profile.add('load', time.perf_counter() - start, nbytes=os.path.getsize(args.csv))
         print(f"✅ 데이터 로드 완료: {len(df)}명의 학생 정보")
         
-        classes = sorted(df['클래스'].unique())
+        classes = list_classes(df)
         print(f"📚 발견된 클래스: {classes}")
         
+        # 사진 색인 (폴더를 한 번만 읽음)
+        start = time.perf_counter()
+        photo_index = PhotoIndex(args.image_root, args.extra_image_root)
+        if profile is not None:
+            profile.add('index', time.perf_counter() - start)
+            profile.count('폴더 읽기', photo_index.scan_count)
+            profile.count('stat', photo_index.stat_count)
+        
+        # 썸네일 캐시 (바뀐 사진만 새로 생성)
+        thumbnails = None
+        if args.thumbnails or args.bundle:
+            from thumbnails import ThumbnailCache
+            thumbnails = ThumbnailCache(args.thumbnail_dir)
+        
+        # 내용 주소 사진 (photo.<해시>.jpg)
+        photo_store = None
+        if args.hashed_photos:
+            from image_catalog import HashedPhotoStore, ImageCatalog
+            catalog = ImageCatalog(photo_index.image_root, cache_dir=args.cache_dir)
+            photo_store = HashedPhotoStore(catalog, args.hashed_photos)
+        
+        # 증분 생성용 조각 캐시 (감시 모드는 메모리에 보관)
+        fragment_cache = None
+        if args.incremental:
+            fragment_cache = FragmentCache(args.cache_dir)
+        elif args.watch:
+            from seating_watch import MemoryFragmentCache
+            fragment_cache = MemoryFragmentCache()
+        
         # 통합 HTML 생성
         print("\n🌐 통합 자리표 HTML 생성 중...")
-        filename = create_combined_seating_chart_html(df)
+        options = dict(photo_index=photo_index, thumbnails=thumbnails, bundle=args.bundle,
+                       lazy_tabs=args.lazy_tabs, fragment_cache=fragment_cache, jobs=args.jobs,
+                       photo_store=photo_store, search=args.search, analytics=args.analytics, classes=args.classes,
+                       split=args.split)
+        filename = create_combined_seating_chart_html(df, args.output, profile=profile, **options)
+        paths = filename if args.split else [filename] if filename != '-' else []
+        if args.incremental:
+            for class_num, seconds in fragment_cache.rebuilt:
+                print(f"🔁 {class_num}반 다시 생성 ({seconds * 1000:.1f} ms)")
+            print(f"♻️ 캐시 사용: {len(fragment_cache.reused)}개 클래스, 다시 생성: {len(fragment_cache.rebuilt)}개 클래스")
+        if thumbnails is not None:
+            print(f"🖼️ 썸네일: 새로 생성 {thumbnails.generated}개, 캐시 사용 {thumbnails.reused}개 ({args.thumbnail_dir}/)")
+        if photo_store is not None:
+            photo_store.catalog.save()
+            print(f"📦 내용 주소 사진: 새로 복사 {photo_store.copied}장, 이미 있음 {photo_store.reused}장 ({args.hashed_photos}/)")
+        
+        # 정적 호스팅용 CSS/JS 분리, 미리 압축, 캐시 헤더 목록
+        if args.static_assets:
+            report_static_assets(paths, profile)
+        
+        # 명단 스냅숏 (학기/클래스별 Arrow 파일)
+        if args.roster_store:
+            report_roster_snapshot(args, df)
+        
+        # 단계별 측정 결과
+        if profile is not None:
+            report_profile(profile, cprofiler, args, paths, df, classes)
+        
+        # 사진 목록(all_class_images.csv)과 실제 파일 비교
+        image_list = f"{args.image_root}/all_class_images.csv"
+        if os.path.exists(image_list):
+            missing, orphaned = photo_index.check_image_list(image_list)
+            if missing or orphaned:
+                print(f"⚠️ 사진 목록 불일치: 파일 없음 {len(missing)}개, 목록에 없음 {len(orphaned)}개")
+                for folder, name in missing[:5]:
+                    print(f"   - 파일 없음: {folder}/{name}")
+                for folder, name in orphaned[:5]:
+                    print(f"   - 목록에 없음: {folder}/{name}")
+            else:
+                print("📷 사진 목록과 실제 파일이 일치합니다")
         
         print("\n" + "=" * 60)
         print("                HTML 생성 완료!")
         print("=" * 60)
-        print(f"🌐 생성된 파일: {filename}")
+        print(f"🌐 생성된 파일: {', '.join(paths) if paths else filename}")
         print("\n💡 사용법:")
         print("  • HTML 파일을 브라우저에서 열어 자리표를 확인하세요")
         print("  • 상단 탭을 클릭하여 클래스를 전환할 수 있습니다")
@@ -652,8 +1160,14 @@ def main():
         print("  • Ctrl+P로 인쇄할 수 있습니다")
         print("  • 성적에 따라 색상이 구분되어 있습니다")
         
+        # 감시 모드: 바뀔 때마다 다시 생성
+        if args.watch:
+            from seating_watch import watch
+            print()
+            watch(args.csv, filename, options, cache_dir=args.cache_dir, serve_port=args.serve)
+        
     except FileNotFoundError:
-        print("❌ integrated_student_data.csv 파일을 찾을 수 없습니다.")
+        print(f"❌ {args.csv} 파일을 찾을 수 없습니다.")
         print("   먼저 데이터 통합을 실행해주세요.")
     except Exception as e:
         print(f"❌ 오류 발생: {e}")
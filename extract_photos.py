@@ -0,0 +1,232 @@
+"""picture_*.pptx 사진 명렬표에서 학생 사진 추출
+
+image/picture_N.pptx 한 개가 클래스 N 하나에 해당한다. 슬라이드의 표에는
+"3학년 1반 2번  권민지" 형태의 이름 칸이, 그 위에는 학생 사진이 놓여 있다.
+사진은 위치(위→아래, 왼쪽→오른쪽) 순서로, 이름 칸은 표 순서로 맞춰 짝을 짓는다.
+
+결과는 image/class_N/<학번>_<이름>.jpg 와 image/all_class_images.csv 로 저장한다.
+PPTX는 zip으로 열어 필요한 ppt/media/* 항목만 읽으며, 발표 자료 하나를 작업 프로세스 하나가
+처리한다. 내용 해시가 바뀌지 않은 발표 자료는 건너뛴다.
+사진은 기본으로 저장소의 image/class_* 사진과 같은 품질(75)의 JPEG로 다시 인코딩하므로
+(Pillow 필요) 같은 발표 자료에서 같은 파일이 다시 만들어진다. --original이면 원본을 그대로 복사한다.
+
+사용법:
+    python extract_photos.py
+    python extract_photos.py --jobs 4 --original
+"""
+import argparse
+import csv
+import glob
+import importlib.util
+import io
+import json
+import os
+import posixpath
+import re
+import shutil
+import zipfile
+import xml.etree.ElementTree as ET
+from concurrent.futures import ProcessPoolExecutor
+
+from student_data import DEFAULT_CACHE_DIR
+from thumbnails import file_hash
+
+IMAGE_ROOT = 'image'
+DECK_PATTERN = 'picture_*.pptx'
+MANIFEST_PATH = os.path.join(DEFAULT_CACHE_DIR, 'pptx_manifest.json')
+CSV_COLUMNS = ['클래스', '학번', '이름', '파일명', '파일경로']
+JPEG_QUALITY = 75     # image/class_* 사진의 품질 (이 값으로 다시 인코딩하면 저장소의 파일과 같은 바이트)
+CONVERT_QUALITY = 90  # 원본을 복사할 때 JPEG가 아닌 사진을 바꾸는 품질
+HAS_PILLOW = importlib.util.find_spec('PIL') is not None
+
+NS = {
+    'p': 'http://schemas.openxmlformats.org/presentationml/2006/main',
+    'a': 'http://schemas.openxmlformats.org/drawingml/2006/main',
+    'r': 'http://schemas.openxmlformats.org/officeDocument/2006/relationships',
+    'rel': 'http://schemas.openxmlformats.org/package/2006/relationships',
+}
+LABEL_PATTERN = re.compile(r'(\d)학년\s*(\d+)반\s*(\d+)번\s*(\S+)')
+
+
+def deck_class(path):
+    """picture_N.pptx 파일명에서 클래스 번호 N"""
+    match = re.search(r'picture_(\d+)\.pptx$', os.path.basename(path))
+    if match is None:
+        raise ValueError(f"발표 자료 이름에서 클래스 번호를 찾을 수 없습니다: {path}")
+    return int(match.group(1))
+
+
+def _slide_names(zf):
+    """슬라이드 파일 목록 (슬라이드 번호 순)"""
+    names = [name for name in zf.namelist() if re.fullmatch(r'ppt/slides/slide\d+\.xml', name)]
+    return sorted(names, key=lambda name: int(re.search(r'(\d+)\.xml$', name).group(1)))
+
+
+def _slide_media(zf, slide_name):
+    """슬라이드의 관계 ID → ppt/media 항목 이름"""
+    rels_name = posixpath.join(posixpath.dirname(slide_name), '_rels', posixpath.basename(slide_name) + '.rels')
+    root = ET.fromstring(zf.read(rels_name))
+    media = {}
+    for rel in root.findall('rel:Relationship', NS):
+        target = posixpath.normpath(posixpath.join(posixpath.dirname(slide_name), rel.get('Target')))
+        if target.startswith('ppt/media/'):
+            media[rel.get('Id')] = target
+    return media
+
+
+def _offset(element):
+    off = element.find('.//a:off', NS)
+    return int(off.get('y')), int(off.get('x'))
+
+
+def slide_students(zf, slide_name):
+    """슬라이드 하나에서 (학번, 이름, 사진 항목 이름) 목록과 경고 목록 반환"""
+    root = ET.fromstring(zf.read(slide_name))
+    media = _slide_media(zf, slide_name)
+
+    # 사진: 위→아래, 왼쪽→오른쪽 순서
+    pictures = []
+    for pic in root.iter(f"{{{NS['p']}}}pic"):
+        blip = pic.find('.//a:blip', NS)
+        rel_id = blip.get(f"{{{NS['r']}}}embed") if blip is not None else None
+        if rel_id in media:
+            pictures.append((_offset(pic), media[rel_id]))
+    pictures.sort()
+
+    # 이름 칸: 표(위→아래) 안의 칸 순서
+    labels = []
+    frames = sorted(root.iter(f"{{{NS['p']}}}graphicFrame"), key=_offset)
+    for frame in frames:
+        for cell in frame.iter(f"{{{NS['a']}}}tc"):
+            text = ''.join(t.text or '' for t in cell.iter(f"{{{NS['a']}}}t"))
+            match = LABEL_PATTERN.search(text)
+            if match:
+                grade, class_no, number, name = match.groups()
+                labels.append((f"{grade}{int(class_no):02d}{int(number):02d}", name))
+
+    if len(labels) != len(pictures):
+        return [], [f"{slide_name}: 이름 {len(labels)}개와 사진 {len(pictures)}개의 수가 달라 건너뜀"]
+    return [(student_id, name, media_name) for (student_id, name), (_, media_name) in zip(labels, pictures)], []
+
+
+def _copy_photo(zf, media_name, dest_path, quality):
+    """ppt/media 항목 하나를 파일로 저장 (quality가 있으면 Pillow로 JPEG 다시 인코딩)"""
+    with zf.open(media_name) as src:
+        if quality is None:
+            with open(dest_path, 'wb') as dest:
+                shutil.copyfileobj(src, dest)
+            return
+        from PIL import Image
+        with Image.open(io.BytesIO(src.read())) as image:
+            image.convert('RGB').save(dest_path, 'JPEG', quality=quality)
+
+
+def extract_deck(task):
+    """발표 자료 하나에서 사진을 추출하고 (발표 자료 경로, CSV 행 목록, 경고 목록) 반환
+
+    작업 프로세스에서 실행된다.
+    """
+    deck_path, image_root, quality = task
+    class_num = deck_class(deck_path)
+    folder = f"class_{class_num}"
+    os.makedirs(os.path.join(image_root, folder), exist_ok=True)
+
+    rows, warnings = [], []
+    with zipfile.ZipFile(deck_path) as zf:
+        for slide_name in _slide_names(zf):
+            students, slide_warnings = slide_students(zf, slide_name)
+            warnings.extend(f"{os.path.basename(deck_path)} {w}" for w in slide_warnings)
+            for student_id, name, media_name in students:
+                # JPEG가 아닌 사진(PNG 등)은 Pillow가 있으면 JPEG로 바꿔 저장
+                ext = posixpath.splitext(media_name)[1].lower()
+                photo_quality = quality
+                if ext not in ('.jpeg', '.jpg') and photo_quality is None and HAS_PILLOW:
+                    photo_quality = CONVERT_QUALITY
+                if ext in ('.jpeg', '.jpg') or photo_quality is not None:
+                    ext = '.jpg'
+                file_name = f"{student_id}_{name}{ext}"
+                _copy_photo(zf, media_name, os.path.join(image_root, folder, file_name), photo_quality)
+                rows.append([class_num, student_id, name, file_name, f"{folder}\\{file_name}"])
+    return deck_path, rows, warnings
+
+
+def _load_manifest(path):
+    try:
+        with open(path, encoding='utf-8') as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        return {}
+
+
+def extract_all(image_root=IMAGE_ROOT, jobs=None, quality=JPEG_QUALITY, force=False, manifest_path=MANIFEST_PATH):
+    """image_root의 모든 picture_*.pptx를 추출하고 all_class_images.csv 작성
+
+    quality가 None이면 사진을 다시 인코딩하지 않고 원본 그대로 복사한다 (그 밖에는 Pillow 필요).
+
+    (새로 추출한 발표 자료 목록, 건너뛴 발표 자료 목록, 경고 목록)을 반환한다.
+    """
+    manifest = _load_manifest(manifest_path)
+    decks = sorted(glob.glob(os.path.join(image_root, DECK_PATTERN)), key=deck_class)
+
+    # 내용 해시와 설정이 같고 사진 파일도 남아 있는 발표 자료는 이전 결과 사용
+    digests = {deck: file_hash(deck) for deck in decks}
+    pending, skipped = [], []
+    for deck in decks:
+        entry = manifest.get(os.path.basename(deck))
+        if (not force and entry and entry['hash'] == digests[deck] and entry['quality'] == quality
+                and all(os.path.exists(os.path.join(image_root, f"class_{row[0]}", row[3])) for row in entry['rows'])):
+            skipped.append(deck)
+        else:
+            pending.append((deck, image_root, quality))
+
+    warnings = []
+    if len(pending) > 1 and jobs != 1:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            results = list(pool.map(extract_deck, pending))
+    else:
+        results = [extract_deck(task) for task in pending]
+    for deck, rows, deck_warnings in results:
+        manifest[os.path.basename(deck)] = {'hash': digests[deck], 'quality': quality, 'rows': rows}
+        warnings.extend(deck_warnings)
+
+    # 사진 목록 CSV (클래스 순, 슬라이드 순)
+    with open(os.path.join(image_root, 'all_class_images.csv'), 'w', encoding='utf-8-sig', newline='') as f:
+        writer = csv.writer(f, lineterminator='\n')  # 저장소의 all_class_images.csv와 같은 LF 줄바꿈
+        writer.writerow(CSV_COLUMNS)
+        for deck in decks:
+            writer.writerows(manifest[os.path.basename(deck)]['rows'])
+
+    os.makedirs(os.path.dirname(manifest_path) or '.', exist_ok=True)
+    with open(manifest_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=1)
+    return [task[0] for task in pending], skipped, warnings
+
+
+def main(argv=None):
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="picture_*.pptx에서 학생 사진 추출")
+    parser.add_argument('--image-root', default=IMAGE_ROOT, help='발표 자료와 사진 폴더가 있는 곳 (기본값: image)')
+    parser.add_argument('--jobs', '-j', type=int, default=None, help='동시에 처리할 발표 자료 수 (기본값: CPU 수)')
+    parser.add_argument('--quality', type=int, default=JPEG_QUALITY,
+                        help=f'JPEG로 다시 인코딩할 때의 품질 (기본값: {JPEG_QUALITY}, 저장소의 사진과 같음, Pillow 필요)')
+    parser.add_argument('--original', action='store_true',
+                        help='다시 인코딩하지 않고 원본 그대로 복사 (파일이 더 크고 저장소의 사진과 바이트가 다름)')
+    parser.add_argument('--force', action='store_true', help='바뀌지 않은 발표 자료도 다시 추출')
+    args = parser.parse_args(argv)
+
+    quality = None if args.original else args.quality
+    if quality is not None and not HAS_PILLOW:
+        print("⚠️ Pillow가 없어 원본 그대로 복사합니다 (저장소의 사진과 바이트가 다름, pip install pillow)")
+        quality = None
+    extracted, skipped, warnings = extract_all(args.image_root, args.jobs, quality, args.force)
+    for deck in extracted:
+        print(f"📤 추출: {os.path.basename(deck)}")
+    for deck in skipped:
+        print(f"⏭️ 변경 없음: {os.path.basename(deck)}")
+    for warning in warnings:
+        print(f"⚠️ {warning}")
+    print(f"✅ {os.path.join(args.image_root, 'all_class_images.csv')} 작성 완료")
+
+
+if __name__ == "__main__":
+    main()
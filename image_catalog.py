@@ -0,0 +1,230 @@
+"""image/ 폴더 사진 목록(카탈로그): 내용 해시 색인, 중복 / 불일치 검사
+
+image/ 아래의 모든 사진을 한 번씩 해시해 캐시 폴더(기본값 .seating_cache/)의 image_index.json에 저장한다.
+다음 실행부터는 수정 시간/크기가 바뀐 사진만 다시 해시한다.
+같은 내용의 사진, 여러 폴더에 있는 같은 학생, all_class_images.csv와 다른 점을 보고하고,
+자리표 생성기가 쓸 수 있도록 사진을 내용 주소 이름(photo.<해시>.jpg)으로 내보낸다.
+
+사용법:
+    python image_catalog.py
+    python image_catalog.py --publish photos
+"""
+import argparse
+import csv
+import json
+import os
+import re
+import shutil
+
+from student_data import DEFAULT_CACHE_DIR
+from thumbnails import file_hash
+
+IMAGE_ROOT = 'image'
+IMAGE_LIST_CSV = 'image/all_class_images.csv'
+INDEX_NAME = 'image_index.json'
+IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png')
+STUDENT_FILE_PATTERN = re.compile(r'^(\d+)_')
+
+
+class ImageCatalog:
+    """사진 경로 → 내용 해시 색인 (수정 시간/크기가 그대로면 해시를 다시 계산하지 않음)
+
+    index_path를 주지 않으면 cache_dir/image_index.json을 쓴다.
+    """
+
+    def __init__(self, image_root=IMAGE_ROOT, index_path=None, cache_dir=DEFAULT_CACHE_DIR):
+        self.image_root = image_root
+        self.index_path = index_path or os.path.join(cache_dir, INDEX_NAME)
+        self.hashed = 0
+        self.reused = 0
+        self._entries = self._load_index()
+        self.refresh()
+
+    def _load_index(self):
+        try:
+            with open(self.index_path, encoding='utf-8') as f:
+                return json.load(f)
+        except (FileNotFoundError, ValueError):
+            return {}
+
+    def save(self):
+        """색인을 임시 파일에 쓴 뒤 바꿔치기"""
+        os.makedirs(os.path.dirname(self.index_path) or '.', exist_ok=True)
+        tmp_path = self.index_path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self._entries, f, ensure_ascii=False, indent=1, sort_keys=True)
+        os.replace(tmp_path, self.index_path)
+
+    def _walk(self, path):
+        """scandir로 사진 파일을 (경로, stat)로 나열 (하위 폴더 포함)"""
+        try:
+            with os.scandir(path) as entries:
+                entries = sorted(entries, key=lambda entry: entry.name)
+        except (FileNotFoundError, NotADirectoryError):
+            return
+        for entry in entries:
+            if entry.is_dir():
+                yield from self._walk(f"{path}/{entry.name}")
+            elif entry.name.lower().endswith(IMAGE_EXTENSIONS):
+                yield f"{path}/{entry.name}", entry.stat()
+
+    def refresh(self):
+        """바뀐 사진만 다시 해시하고 사라진 사진은 색인에서 지움"""
+        seen = set()
+        for path, stat in self._walk(self.image_root):
+            seen.add(path)
+            entry = self._entries.get(path)
+            if entry and entry['mtime_ns'] == stat.st_mtime_ns and entry['size'] == stat.st_size:
+                self.reused += 1
+                continue
+            self._entries[path] = {'mtime_ns': stat.st_mtime_ns, 'size': stat.st_size, 'hash': file_hash(path)}
+            self.hashed += 1
+        for path in set(self._entries) - seen:
+            del self._entries[path]
+
+    def __len__(self):
+        return len(self._entries)
+
+    def paths(self):
+        return sorted(self._entries)
+
+    def total_size(self):
+        return sum(entry['size'] for entry in self._entries.values())
+
+    def hash_of(self, path):
+        """사진의 내용 해시 (색인 밖의 파일은 바로 계산)"""
+        entry = self._entries.get(path)
+        return entry['hash'] if entry else file_hash(path)
+
+    def duplicates(self):
+        """내용이 같은 사진 묶음: {해시: [경로, ...]} (두 장 이상인 것만)"""
+        groups = {}
+        for path, entry in sorted(self._entries.items()):
+            groups.setdefault(entry['hash'], []).append(path)
+        return {digest: paths for digest, paths in groups.items() if len(paths) > 1}
+
+    def wasted_bytes(self):
+        """중복 사진이 차지하는 크기 (묶음마다 한 장을 뺀 나머지)"""
+        return sum(self._entries[path]['size'] for paths in self.duplicates().values() for path in paths[1:])
+
+    def students_in_several_folders(self):
+        """<학번>_<이름> 사진이 두 폴더 이상에 있는 학생: {학번: [경로, ...]}"""
+        by_student = {}
+        for path in sorted(self._entries):
+            folder, _, name = path.rpartition('/')
+            match = STUDENT_FILE_PATTERN.match(name)
+            if match:
+                by_student.setdefault(match.group(1), {}).setdefault(folder, path)
+        return {student_id: list(folders.values())
+                for student_id, folders in by_student.items() if len(folders) > 1}
+
+    def check_image_list(self, csv_path=IMAGE_LIST_CSV):
+        """all_class_images.csv와 실제 사진 비교
+
+        (목록에 있지만 파일이 없는 경로, image/class_N에 있지만 목록에 없는 경로,
+        클래스 열과 폴더가 다른 (경로, 클래스) 목록)을 반환한다.
+        """
+        listed = set()
+        wrong_class = []
+        with open(csv_path, encoding='utf-8-sig', newline='') as f:
+            for record in csv.DictReader(f):
+                relative = record['파일경로'].replace('\\', '/')
+                path = f"{self.image_root}/{relative}"
+                listed.add(path)
+                folder = relative.partition('/')[0]
+                if folder != f"class_{record['클래스']}":
+                    wrong_class.append((path, record['클래스']))
+
+        in_class_dirs = {path for path in self._entries if path.startswith(f"{self.image_root}/class_")}
+        missing = sorted(listed - set(self._entries))
+        unlisted = sorted(in_class_dirs - listed)
+        return missing, unlisted, wrong_class
+
+
+class HashedPhotoStore:
+    """사진을 내용 주소 이름(photo.<해시>.jpg)으로 한 폴더에 복사
+
+    이름이 내용으로 정해지므로 브라우저/CDN이 기한 없이 캐시해도 되고,
+    같은 내용의 사진은 한 파일만 남는다. ThumbnailCache.build와 같은 형태로
+    {원본 경로: (새 경로, '')}를 돌려주어 자리표 생성기에 그대로 넘길 수 있다.
+    """
+
+    def __init__(self, catalog, dest_dir='photos'):
+        self.catalog = catalog
+        self.dest_dir = dest_dir
+        self.copied = 0
+        self.reused = 0
+
+    def build(self, paths):
+        os.makedirs(self.dest_dir, exist_ok=True)
+        results = {}
+        for path in sorted(set(paths)):
+            try:
+                digest = self.catalog.hash_of(path)
+            except OSError:
+                continue
+            ext = os.path.splitext(path)[1].lower()
+            dest_path = f"{self.dest_dir}/photo.{digest}{'.jpg' if ext == '.jpeg' else ext}"
+            if os.path.exists(dest_path):
+                self.reused += 1
+            else:
+                shutil.copyfile(path, dest_path)
+                self.copied += 1
+            results[path] = (dest_path, '')
+        return results
+
+
+def main(argv=None):
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="사진 폴더 해시 색인 / 중복 검사")
+    parser.add_argument('--image-root', default=IMAGE_ROOT, help='사진 폴더 (기본값: image)')
+    parser.add_argument('--image-list', default=IMAGE_LIST_CSV,
+                        help=f'비교할 사진 목록 CSV (기본값: {IMAGE_LIST_CSV})')
+    parser.add_argument('--cache-dir', default=DEFAULT_CACHE_DIR,
+                        help=f'해시 색인을 둘 캐시 폴더 (기본값: {DEFAULT_CACHE_DIR})')
+    parser.add_argument('--index', help=f'해시 색인 파일 (기본값: <캐시 폴더>/{INDEX_NAME})')
+    parser.add_argument('--publish', metavar='DIR',
+                        help='모든 사진을 DIR/photo.<해시>.jpg 이름으로 복사')
+    args = parser.parse_args(argv)
+
+    catalog = ImageCatalog(args.image_root, args.index, args.cache_dir)
+    catalog.save()
+    print(f"📷 사진 {len(catalog)}장 ({catalog.total_size() / 1024 / 1024:.1f} MB), "
+          f"새로 해시 {catalog.hashed}장, 색인 사용 {catalog.reused}장")
+
+    duplicates = catalog.duplicates()
+    if duplicates:
+        print(f"⚠️ 내용이 같은 사진 {len(duplicates)}묶음 ({catalog.wasted_bytes() / 1024:.1f} KB 중복)")
+        for paths in duplicates.values():
+            print(f"   - {', '.join(paths)}")
+    else:
+        print("✅ 내용이 같은 사진이 없습니다")
+
+    several = catalog.students_in_several_folders()
+    if several:
+        print(f"⚠️ 여러 폴더에 사진이 있는 학생 {len(several)}명")
+        for student_id, paths in several.items():
+            print(f"   - {student_id}: {', '.join(paths)}")
+
+    if os.path.exists(args.image_list):
+        missing, unlisted, wrong_class = catalog.check_image_list(args.image_list)
+        if missing or unlisted or wrong_class:
+            print(f"⚠️ 사진 목록 불일치: 파일 없음 {len(missing)}개, 목록에 없음 {len(unlisted)}개, "
+                  f"클래스 다름 {len(wrong_class)}개")
+            for path in missing:
+                print(f"   - 파일 없음: {path}")
+            for path in unlisted:
+                print(f"   - 목록에 없음: {path}")
+            for path, class_num in wrong_class:
+                print(f"   - 클래스 다름: {path} (목록: {class_num}반)")
+        else:
+            print("✅ 사진 목록과 실제 파일이 일치합니다")
+
+    if args.publish:
+        store = HashedPhotoStore(catalog, args.publish)
+        store.build(catalog.paths())
+        print(f"📦 {args.publish}/: 새로 복사 {store.copied}장, 이미 있음 {store.reused}장")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,326 @@
+"""학생 명단 기록 저장소: 생성할 때마다의 명단을 학기/클래스별 Arrow 파일로 쌓아 두고 비교
+
+integrated_student_data.csv는 학기마다 덮어쓰이므로, 자리표를 만들 때마다 명단을 스냅숏으로 남긴다.
+  <저장소>/<학기>/class_<클래스>.<내용 해시>.arrow   클래스 하나의 명단 (학번 순, 열 단위 Arrow IPC 파일)
+  <저장소>/index.json                                스냅숏 목록과 스냅숏마다 클래스별 파일 / 해시 / 학생 수
+파일 이름이 내용 해시이므로 바뀌지 않은 클래스는 이전 스냅숏의 파일을 그대로 가리키고 새로 쓰지 않는다.
+
+질의는 색인으로 바뀐 클래스를 먼저 고른 뒤 그 클래스의 파일만, 필요한 열만 읽는다.
+Arrow IPC 파일은 메모리 매핑으로 열기 때문에 고르지 않은 열은 디스크에서 읽지 않는다.
+  changed_classes()  스냅숏 사이에 새로 생긴 / 없어진 / 바뀐 클래스 (색인만 읽음)
+  moved_seats()      자리(클래스, 행, 열)가 바뀐 학생
+  score_deltas()     학생별 점수 변화
+스냅숏은 번호(0 이상), 끝에서부터의 위치(-1이 가장 최근) 또는 학기 이름(그 학기의 가장 최근)으로 고른다.
+
+사용법:
+    python roster_store.py add integrated_student_data.csv --term 2026-2
+    python roster_store.py snapshots
+    python roster_store.py classes              # 직전 스냅숏과 비교
+    python roster_store.py moves --old 2026-1 --new 2026-2
+    python roster_store.py scores --all
+"""
+import argparse
+import hashlib
+import json
+import os
+import time
+
+from student_data import DEFAULT_CSV, HAS_PYARROW, load_students
+
+DEFAULT_STORE = 'roster_store'
+INDEX_NAME = 'index.json'
+# 저장하는 열과 Arrow 자료형 이름 (클래스는 파일 단위로 나누므로 열로 두지 않음)
+STORE_COLUMNS = (('학번', 'string'), ('이름', 'string'), ('점수', 'float32'), ('행', 'int16'), ('열', 'int16'),
+                 ('파일명', 'string'))
+
+
+def current_term(today=None):
+    """오늘 날짜의 학기 이름 (3~8월은 <해>-1, 9~12월은 <해>-2, 1~2월은 지난해 2학기)"""
+    today = today or time.localtime()
+    year, month = today.tm_year, today.tm_mon
+    if month < 3:
+        return f"{year - 1}-2"
+    return f"{year}-{1 if month < 9 else 2}"
+
+
+def _schema():
+    import pyarrow as pa
+    return pa.schema([(name, getattr(pa, type_name)()) for name, type_name in STORE_COLUMNS])
+
+
+def _class_tables(data):
+    """DataFrame / 행(dict) 목록을 {클래스(문자열): 학번 순 Arrow 테이블}로 나누기"""
+    import pyarrow as pa
+
+    schema = _schema()
+    if isinstance(data, list):
+        columns = {}
+        for record in data:
+            class_columns = columns.setdefault(str(record['클래스']), {name: [] for name, _ in STORE_COLUMNS})
+            for name, _ in STORE_COLUMNS:
+                class_columns[name].append(record[name])
+        tables = {key: pa.table(class_columns, schema=schema) for key, class_columns in columns.items()}
+    else:
+        arrays = {}
+        for name, type_name in STORE_COLUMNS:
+            if type_name == 'float32':
+                # 빈 칸 자리의 값을 0으로 두어 행 목록에서 만든 파일과 바이트까지 같게 함 (내용 해시가 같도록)
+                arrays[name] = pa.array(data[name].to_numpy(dtype='float32', na_value=0),
+                                        mask=data[name].isna().to_numpy(), type=schema.field(name).type)
+            else:
+                column = data[name].astype('string') if type_name == 'string' else data[name]
+                arrays[name] = pa.array(column, type=schema.field(name).type, from_pandas=True)
+        table = pa.table(arrays, schema=schema)
+        groups = data.groupby(data['클래스'].astype(str), observed=True).indices
+        tables = {key: table.take(pa.array(indices)) for key, indices in groups.items()}
+    return {key: tables[key].sort_by('학번') for key in sorted(tables, key=_class_order)}
+
+
+def _class_order(key):
+    """클래스 문자열 정렬 순서 (숫자는 숫자 순으로 먼저)"""
+    return (0, int(key), '') if key.lstrip('-').isdigit() else (1, 0, key)
+
+
+def _ipc_bytes(table):
+    import pyarrow as pa
+
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_file(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue()
+
+
+class RosterStore:
+    """명단 스냅숏 저장소 (pyarrow 필요)"""
+
+    def __init__(self, root=DEFAULT_STORE):
+        if not HAS_PYARROW:
+            raise ImportError("명단 저장소에는 pyarrow가 필요합니다 (pip install pyarrow)")
+        self.root = root
+        self.files_read = 0   # 질의에서 연 파티션 파일 수
+        self.files_written = 0
+        self._index_path = os.path.join(root, INDEX_NAME)
+        try:
+            with open(self._index_path, encoding='utf-8') as f:
+                self._index = json.load(f)
+        except FileNotFoundError:
+            self._index = {'version': 1, 'snapshots': []}
+
+    @property
+    def snapshots(self):
+        return self._index['snapshots']
+
+    def _save_index(self):
+        os.makedirs(self.root, exist_ok=True)
+        tmp_path = self._index_path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self._index, f, ensure_ascii=False, indent=1)
+        os.replace(tmp_path, self._index_path)
+
+    def append(self, data, term=None, source=None):
+        """명단 하나를 스냅숏으로 추가하고 (스냅숏, 새로 추가했는지) 반환
+
+        같은 학기의 가장 최근 스냅숏과 모든 클래스가 같으면 추가하지 않고 그 스냅숏을 돌려준다.
+        """
+        term = term or current_term()
+        classes = {}
+        for key, table in _class_tables(data).items():
+            payload = _ipc_bytes(table)
+            digest = hashlib.sha256(payload).hexdigest()[:16]
+            relpath = f"{term}/class_{key}.{digest}.arrow"
+            path = os.path.join(self.root, relpath)
+            if not os.path.exists(path):
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                with open(path + '.tmp', 'wb') as f:
+                    f.write(payload)
+                os.replace(path + '.tmp', path)
+                self.files_written += 1
+            classes[key] = {'rows': table.num_rows, 'digest': digest, 'file': relpath}
+
+        same_term = [snapshot for snapshot in self.snapshots if snapshot['term'] == term]
+        if same_term and same_term[-1]['classes'] == classes:
+            return same_term[-1], False
+
+        snapshot = {
+            'id': self.snapshots[-1]['id'] + 1 if self.snapshots else 0,
+            'term': term,
+            'time': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'source': source,
+            'students': sum(entry['rows'] for entry in classes.values()),
+            'classes': classes,
+        }
+        self.snapshots.append(snapshot)
+        self._save_index()
+        return snapshot, True
+
+    def snapshot(self, selector=-1):
+        """스냅숏 고르기: 번호(0 이상), 끝에서부터의 위치(음수), 학기 이름(그 학기의 가장 최근)"""
+        if isinstance(selector, str):
+            matches = [snapshot for snapshot in self.snapshots if snapshot['term'] == selector]
+            if not matches:
+                raise KeyError(f"'{selector}' 학기의 스냅숏이 없습니다")
+            return matches[-1]
+        if selector < 0:
+            if len(self.snapshots) < -selector:
+                raise KeyError(f"스냅숏이 {len(self.snapshots)}개뿐입니다")
+            return self.snapshots[selector]
+        for snapshot in self.snapshots:
+            if snapshot['id'] == selector:
+                return snapshot
+        raise KeyError(f"{selector}번 스냅숏이 없습니다")
+
+    def _pair(self, old, new):
+        new_snapshot = self.snapshot(new)
+        if old is None:
+            position = self.snapshots.index(new_snapshot)
+            if position == 0:
+                raise KeyError("비교할 이전 스냅숏이 없습니다")
+            return self.snapshots[position - 1], new_snapshot
+        return self.snapshot(old), new_snapshot
+
+    def changed_classes(self, old=None, new=-1):
+        """{'added': [...], 'removed': [...], 'changed': [...]} - 색인만 읽음 (old가 없으면 new의 바로 앞)"""
+        old_snapshot, new_snapshot = self._pair(old, new)
+        old_classes, new_classes = old_snapshot['classes'], new_snapshot['classes']
+        return {
+            'added': sorted(new_classes.keys() - old_classes.keys(), key=_class_order),
+            'removed': sorted(old_classes.keys() - new_classes.keys(), key=_class_order),
+            'changed': sorted((key for key in old_classes.keys() & new_classes.keys()
+                               if old_classes[key]['digest'] != new_classes[key]['digest']), key=_class_order),
+        }
+
+    def read_class(self, snapshot, class_key, columns):
+        """스냅숏의 클래스 하나에서 고른 열만 {열: 값 목록}으로 읽기 (메모리 매핑)"""
+        import pyarrow as pa
+
+        path = os.path.join(self.root, snapshot['classes'][class_key]['file'])
+        self.files_read += 1
+        with pa.memory_map(path, 'r') as source:
+            table = pa.ipc.open_file(source).read_all()
+            return {name: table.column(name).to_pylist() for name in columns}
+
+    def _students(self, snapshot, class_keys, columns):
+        """{학번: (클래스, 고른 열 값...)} (고른 클래스의 파일만 읽음)"""
+        students = {}
+        for key in class_keys:
+            if key not in snapshot['classes']:
+                continue
+            values = self.read_class(snapshot, key, ('학번', *columns))
+            for student_id, *row in zip(values['학번'], *(values[name] for name in columns)):
+                students[student_id] = (key, *row)
+        return students
+
+    def _compared_classes(self, old_snapshot, new_snapshot, changed_only):
+        if not changed_only:
+            return sorted(old_snapshot['classes'].keys() | new_snapshot['classes'].keys(), key=_class_order)
+        changes = self.changed_classes(old_snapshot['id'], new_snapshot['id'])
+        return changes['added'] + changes['removed'] + changes['changed']
+
+    def moved_seats(self, old=None, new=-1):
+        """자리가 바뀐 학생: [(학번, 이름, (이전 클래스, 행, 열), (새 클래스, 행, 열))]
+
+        바뀌지 않은 클래스에서는 아무도 옮기지 않았으므로 바뀐 클래스의 파일만 읽는다.
+        """
+        old_snapshot, new_snapshot = self._pair(old, new)
+        keys = self._compared_classes(old_snapshot, new_snapshot, changed_only=True)
+        before = self._students(old_snapshot, keys, ('행', '열'))
+        after = self._students(new_snapshot, keys, ('이름', '행', '열'))
+        moves = []
+        for student_id, (key, name, row, col) in after.items():
+            if student_id in before and before[student_id] != (key, row, col):
+                moves.append((student_id, name, before[student_id], (key, row, col)))
+        return sorted(moves)
+
+    def score_deltas(self, old=None, new=-1, changed_only=True):
+        """학생별 점수 변화: [(학번, 이름, 이전 점수, 새 점수, 차이)] (차이가 큰 순)
+
+        두 스냅숏에 모두 있는 학생만 넣으며 한쪽 점수가 없으면 차이는 None이다.
+        changed_only이면 바뀐 클래스의 파일만 읽고 점수가 그대로인 학생은 뺀다.
+        """
+        old_snapshot, new_snapshot = self._pair(old, new)
+        keys = self._compared_classes(old_snapshot, new_snapshot, changed_only)
+        before = self._students(old_snapshot, keys, ('점수',))
+        after = self._students(new_snapshot, keys, ('이름', '점수'))
+        deltas = []
+        for student_id, (_, name, score) in after.items():
+            if student_id not in before:
+                continue
+            old_score = before[student_id][1]
+            if changed_only and old_score == score:
+                continue
+            delta = score - old_score if score is not None and old_score is not None else None
+            deltas.append((student_id, name, old_score, score, delta))
+        return sorted(deltas, key=lambda item: (item[4] is None, -abs(item[4] or 0), item[0]))
+
+
+def _selector(text):
+    """명령행의 스냅숏 지정 (정수면 번호/위치, 아니면 학기 이름)"""
+    if text is None:
+        return None
+    return int(text) if text.lstrip('-').isdigit() else text
+
+
+def _fmt_score(score):
+    return '-' if score is None else f"{score:.1f}"
+
+
+def main(argv=None):
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="학생 명단 기록 저장소")
+    parser.add_argument('--store', default=DEFAULT_STORE, help=f'저장소 폴더 (기본값: {DEFAULT_STORE})')
+    commands = parser.add_subparsers(dest='command', required=True)
+    add = commands.add_parser('add', help='명단 CSV를 스냅숏으로 추가')
+    add.add_argument('csv', nargs='?', default=DEFAULT_CSV)
+    add.add_argument('--term', help='학기 이름 (기본값: 오늘 날짜의 학기, 예: 2026-2)')
+    commands.add_parser('snapshots', help='스냅숏 목록')
+    for name, help_text in (('classes', '바뀐 클래스'), ('moves', '자리가 바뀐 학생'), ('scores', '학생별 점수 변화')):
+        command = commands.add_parser(name, help=help_text)
+        command.add_argument('--old', help='이전 스냅숏 (번호, 음수 위치, 학기 이름 / 기본값: --new의 바로 앞)')
+        command.add_argument('--new', default='-1', help='새 스냅숏 (기본값: -1 = 가장 최근)')
+        if name == 'scores':
+            command.add_argument('--all', action='store_true', help='점수가 그대로인 학생도 보여 주기')
+    args = parser.parse_args(argv)
+
+    try:
+        store = RosterStore(args.store)
+        if args.command == 'add':
+            snapshot, added = store.append(load_students(args.csv), args.term, source=args.csv)
+            if added:
+                print(f"✅ {snapshot['id']}번 스냅숏 추가 ({snapshot['term']}, 학생 {snapshot['students']}명, "
+                      f"새 파일 {store.files_written}개)")
+            else:
+                print(f"♻️ {snapshot['id']}번 스냅숏과 같아 추가하지 않았습니다")
+            return 0
+        if args.command == 'snapshots':
+            for snapshot in store.snapshots:
+                print(f"   {snapshot['id']:>3}  {snapshot['term']:<8} {snapshot['time']}  학생 {snapshot['students']:>5}명, "
+                      f"클래스 {len(snapshot['classes'])}개  {snapshot['source'] or ''}")
+            return 0
+
+        old, new = _selector(args.old), _selector(args.new)
+        old_snapshot, new_snapshot = store._pair(old, new)
+        print(f"🔍 {old_snapshot['id']}번({old_snapshot['term']}) → {new_snapshot['id']}번({new_snapshot['term']})")
+        if args.command == 'classes':
+            changes = store.changed_classes(old, new)
+            for label, key in (('새로 생긴', 'added'), ('없어진', 'removed'), ('바뀐', 'changed')):
+                print(f"   {label} 클래스: {', '.join(changes[key]) or '없음'}")
+        elif args.command == 'moves':
+            moves = store.moved_seats(old, new)
+            for student_id, name, (old_class, old_row, old_col), (new_class, new_row, new_col) in moves:
+                print(f"   {student_id} {name}: {old_class}반 {old_row}행 {old_col}열 → "
+                      f"{new_class}반 {new_row}행 {new_col}열")
+            print(f"🪑 자리가 바뀐 학생 {len(moves)}명 (읽은 파일 {store.files_read}개)")
+        else:
+            deltas = store.score_deltas(old, new, changed_only=not args.all)
+            for student_id, name, old_score, score, delta in deltas:
+                change = '' if delta is None else f" ({delta:+.1f})"
+                print(f"   {student_id} {name}: {_fmt_score(old_score)} → {_fmt_score(score)}{change}")
+            print(f"📈 학생 {len(deltas)}명 (읽은 파일 {store.files_read}개)")
+    except (ImportError, KeyError, FileNotFoundError) as e:
+        print(f"❌ {e.args[0] if isinstance(e, KeyError) else e}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
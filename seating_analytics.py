@@ -0,0 +1,204 @@
+"""점수 통계 (--analytics): 클래스별 평균/중앙값, 성적 구간별 학생 수, 행/열 평균 열지도
+
+생성할 때 한 번만 계산해 '통계' 탭에 표와 인라인 SVG로 넣으므로 브라우저에서는 계산하지 않는다.
+DataFrame은 (클래스, 행, 열) groupby 한 번으로 자리별 점수 합계/개수와 성적 구간별 학생 수를 모은 뒤,
+그 작은 결과만 다시 묶어 클래스/행/열 값을 구한다 (중앙값만 클래스별 groupby를 한 번 더 함).
+작은 입력(student_data.read_csv_records()의 행 목록)은 pandas 없이 한 번 훑어 같은 값을 만든다.
+
+결과는 {클래스: 통계} 딕셔너리이며 통계 하나는 다음과 같다.
+    students / scored   학생 수 / 점수 있는 학생 수
+    sum, mean, median   점수 합계, 평균, 중앙값 (점수가 없으면 평균/중앙값은 None)
+    bands               SCORE_BANDS 순서의 성적 구간별 학생 수
+    cells, rows, cols   (행, 열) / 행 / 열 → (점수 합계, 점수 있는 학생 수)
+"""
+import statistics
+
+from create_combined_seating_html import SCORE_BANDS, score_band, score_band_array
+from seating_templates import (
+    STATS_CLASS, STATS_SUMMARY_CLOSE_BYTES, STATS_SUMMARY_OPEN, STATS_SUMMARY_ROW, STATS_TAB_CLOSE_BYTES,
+    STATS_TAB_OPEN_BYTES,
+)
+
+BAND_COLORS = ('#27ae60', '#f39c12', '#e74c3c', '#95a5a6')  # 자리 테두리 색과 같음
+NO_SCORE_COLOR = '#ecf0f1'
+# 열지도 색: 40점 이하 빨강 → 70점 주황 → 100점 초록
+HEAT_STOPS = ((40, (231, 76, 60)), (70, (243, 156, 18)), (100, (39, 174, 96)))
+CELL = 34       # 열지도 칸 크기 (px)
+GAP = 2
+LABEL = 28      # 행/열 번호 자리
+BAR_WIDTH = 160  # 성적 구간 막대 폭
+
+
+def _empty_stats():
+    return {'students': 0, 'scored': 0, 'sum': 0.0, 'mean': None, 'median': None, 'bands': [0] * len(SCORE_BANDS),
+            'cells': {}, 'rows': {}, 'cols': {}}
+
+
+def _add(table, key, total, n):
+    old_total, old_n = table.get(key, (0.0, 0))
+    table[key] = (old_total + total, old_n + n)
+
+
+def _stats_from_frame(df):
+    """DataFrame: (클래스, 행, 열) groupby 한 번 + 클래스별 중앙값"""
+    import numpy as np
+    import pandas as pd
+
+    has_score, values, band = score_band_array(df['점수'])
+    frame = pd.DataFrame({
+        '클래스': df['클래스'].to_numpy(),
+        '행': df['행'].to_numpy(),
+        '열': df['열'].to_numpy(),
+        'sum': np.where(has_score, values, 0.0),
+        'n': has_score.astype(np.int64),
+        **{f"band{i}": (band == i).astype(np.int64) for i in range(len(SCORE_BANDS))},
+    })
+    by_seat = frame.groupby(['클래스', '행', '열'], sort=True).sum()
+    medians = pd.Series(values).groupby(frame['클래스'], sort=True).median()
+
+    # 클래스 / 행 / 열 값은 자리별 결과(작은 표)를 다시 묶어서 구함
+    band_columns = [f"band{i}" for i in range(len(SCORE_BANDS))]
+    by_class = by_seat.groupby(level=0, sort=True).sum()
+    stats = {}
+    for class_num, total, n, *bands in zip(by_class.index.tolist(),
+                                           *(by_class[column].tolist() for column in ('sum', 'n', *band_columns))):
+        entry = stats[class_num] = _empty_stats()
+        median = medians.get(class_num)
+        entry.update(sum=total, scored=n, students=sum(bands), bands=bands,
+                     median=None if median is None or np.isnan(median) else float(median))
+
+    by_row = by_seat[['sum', 'n']].groupby(level=[0, 1], sort=True).sum()
+    by_col = by_seat[['sum', 'n']].groupby(level=[0, 2], sort=True).sum()
+    for (class_num, row, col), total, n in zip(by_seat.index.tolist(), by_seat['sum'].tolist(), by_seat['n'].tolist()):
+        stats[class_num]['cells'][(row, col)] = (total, n)
+    for (class_num, row), total, n in zip(by_row.index.tolist(), by_row['sum'].tolist(), by_row['n'].tolist()):
+        stats[class_num]['rows'][row] = (total, n)
+    for (class_num, col), total, n in zip(by_col.index.tolist(), by_col['sum'].tolist(), by_col['n'].tolist()):
+        stats[class_num]['cols'][col] = (total, n)
+    return stats
+
+
+def _stats_from_records(records):
+    """행(dict) 목록: 한 번 훑기 (pandas 없이)"""
+    stats = {}
+    scores = {}
+    for record in records:
+        class_num, score = record['클래스'], record['점수']
+        entry = stats.get(class_num)
+        if entry is None:
+            entry = stats[class_num] = _empty_stats()
+            scores[class_num] = []
+        total, n = (score, 1) if score is not None else (0.0, 0)
+        _add(entry['cells'], (record['행'], record['열']), total, n)
+        _add(entry['rows'], record['행'], total, n)
+        _add(entry['cols'], record['열'], total, n)
+        entry['sum'] += total
+        entry['scored'] += n
+        entry['students'] += 1
+        entry['bands'][score_band(score)] += 1
+        if score is not None:
+            scores[class_num].append(score)
+    for class_num, values in scores.items():
+        stats[class_num]['median'] = statistics.median(values) if values else None
+    return {class_num: stats[class_num] for class_num in sorted(stats)}
+
+
+def compute_score_stats(data):
+    """DataFrame / 행(dict) 목록에서 클래스별 점수 통계 계산 (클래스 순서)"""
+    stats = _stats_from_records(data) if isinstance(data, list) else _stats_from_frame(data)
+    for entry in stats.values():
+        if entry['scored']:
+            entry['mean'] = entry['sum'] / entry['scored']
+    return stats
+
+
+def heat_color(score):
+    """평균 점수의 열지도 색 (점수가 없으면 회색)"""
+    if score is None:
+        return NO_SCORE_COLOR
+    (low, low_rgb), *stops = HEAT_STOPS
+    if score <= low:
+        return '#%02x%02x%02x' % low_rgb
+    for high, high_rgb in stops:
+        if score <= high:
+            t = (score - low) / (high - low)
+            return '#%02x%02x%02x' % tuple(round(a + (b - a) * t) for a, b in zip(low_rgb, high_rgb))
+        low, low_rgb = high, high_rgb
+    return '#%02x%02x%02x' % low_rgb
+
+
+def _mean(total_n):
+    total, n = total_n
+    return total / n if n else None
+
+
+def _fmt(value):
+    return '-' if value is None else f"{value:.1f}"
+
+
+def band_bar_svg(bands):
+    """성적 구간별 학생 수 누적 막대 (인라인 SVG)"""
+    students = sum(bands)
+    parts = []
+    x = 0.0
+    for (score_class, emoji), count, color in zip(SCORE_BANDS, bands, BAND_COLORS):
+        if not count:
+            continue
+        width = BAR_WIDTH * count / students
+        parts.append(f'<rect x="{x:.1f}" width="{width:.1f}" height="14" fill="{color}">'
+                     f'<title>{emoji} {count}명</title></rect>')
+        x += width
+    return (f'<svg class="band-bar" width="{BAR_WIDTH}" height="14" viewBox="0 0 {BAR_WIDTH} 14">'
+            f'{"".join(parts)}</svg>')
+
+
+def heatmap_svg(entry):
+    """자리별 평균 점수 열지도 + 오른쪽에 행 평균, 아래에 열 평균 (인라인 SVG, 1행이 맨 앞)"""
+    max_row = max(entry['rows'])
+    max_col = max(entry['cols'])
+    step = CELL + GAP
+    mean_x = LABEL + max_col * step + 8   # 행 평균 칸
+    mean_y = LABEL + max_row * step + 8   # 열 평균 칸
+    width = mean_x + CELL + 4
+    height = mean_y + CELL + 4
+
+    def cell(x, y, score, title, extra=''):
+        text = '' if score is None else f'<text x="{x + CELL / 2:g}" y="{y + CELL / 2 + 4:g}">{score:.0f}</text>'
+        return (f'<g{extra}><rect x="{x}" y="{y}" width="{CELL}" height="{CELL}" rx="4" fill="{heat_color(score)}">'
+                f'<title>{title}</title></rect>{text}</g>')
+
+    parts = []
+    for col in range(1, max_col + 1):
+        x = LABEL + (col - 1) * step
+        parts.append(f'<text class="axis" x="{x + CELL / 2:g}" y="{LABEL - 8}">{col}열</text>')
+        mean = _mean(entry['cols'].get(col, (0.0, 0)))
+        parts.append(cell(x, mean_y, mean, f"{col}열 평균 {_fmt(mean)}", ' class="mean"'))
+    for row in range(1, max_row + 1):
+        y = LABEL + (row - 1) * step
+        parts.append(f'<text class="axis" x="{LABEL / 2:g}" y="{y + CELL / 2 + 4:g}">{row}행</text>')
+        mean = _mean(entry['rows'].get(row, (0.0, 0)))
+        parts.append(cell(mean_x, y, mean, f"{row}행 평균 {_fmt(mean)}", ' class="mean"'))
+    for (row, col), total_n in sorted(entry['cells'].items()):
+        if row < 1 or col < 1:
+            continue
+        mean = _mean(total_n)
+        parts.append(cell(LABEL + (col - 1) * step, LABEL + (row - 1) * step, mean,
+                          f"{row}행 {col}열: {_fmt(mean)}" + (f" ({total_n[1]}명 평균)" if total_n[1] > 1 else "")))
+    parts.append(f'<text class="axis" x="{mean_x + CELL / 2:g}" y="{LABEL - 8}">평균</text>')
+    return (f'<svg class="heatmap" width="{width}" height="{height}" viewBox="0 0 {width} {height}">'
+            f'{"".join(parts)}</svg>')
+
+
+def iter_stats_tab_html(stats):
+    """'통계' 탭 내용 (UTF-8 바이트 조각): 클래스별 요약 표, 클래스별 열지도"""
+    yield STATS_TAB_OPEN_BYTES
+    yield STATS_SUMMARY_OPEN.fill(*(emoji for _, emoji in SCORE_BANDS)).encode('utf-8')
+    for class_num, entry in stats.items():
+        yield STATS_SUMMARY_ROW.fill(class_num, entry['students'], entry['scored'], _fmt(entry['mean']),
+                                     _fmt(entry['median']), *entry['bands'],
+                                     band_bar_svg(entry['bands'])).encode('utf-8')
+    yield STATS_SUMMARY_CLOSE_BYTES
+    for class_num, entry in stats.items():
+        if entry['rows']:
+            yield STATS_CLASS.fill(class_num, heatmap_svg(entry)).encode('utf-8')
+    yield STATS_TAB_CLOSE_BYTES
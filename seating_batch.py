@@ -0,0 +1,262 @@
+"""여러 학교 / 학년의 자리표를 한 번에 만드는 일괄 생성
+
+작업 목록 파일(JSON)에 적힌 작업마다 학생 데이터 CSV, 사진 폴더, 출력 경로로 자리표를 만든다.
+한 프로세스 안에서 스레드로 여러 작업을 함께 실행하며, 같은 사진 폴더를 쓰는 작업끼리는
+사진 색인(PhotoIndex)을, 모든 작업은 썸네일 캐시(ThumbnailCache, 내용 해시 이름)를 함께 쓴다.
+HTML 틀은 seating_templates의 모듈 상수이므로 처음 한 번만 불러온다.
+끝나면 작업마다 걸린 시간과 출력 크기를 표로 보여 준다.
+
+작업 목록 파일 예 (상대 경로는 이 파일이 있는 폴더 기준):
+    {
+      "defaults": {"lazy_tabs": true},
+      "jobs": [
+        {"name": "A고 3학년", "csv": "a/integrated_student_data.csv", "image_roots": ["a/image"],
+         "output": "site/a.html"},
+        {"name": "B고 2학년", "csv": "b/students.csv", "image_roots": ["b/image", "b/extra"],
+         "output": "site/b/seat_{class_num}.html", "split": true, "classes": [1, 2, 3]}
+      ]
+    }
+작업 항목: name, csv, image_roots, output(필수), classes, split, thumbnails, bundle, lazy_tabs, search,
+analytics, jobs, incremental, static_assets(CSS/JS 분리, .gz/.br, static-manifest.json). defaults의 값은 작업에 같은 항목이 없을 때 쓴다.
+image_roots는 작업이나 defaults에 꼭 적어야 한다 (작업 목록 옆의 image/를 몰래 쓰지 않도록).
+name은 작업마다 캐시 폴더 이름으로도 쓰므로 /, \\, :를 넣을 수 없다.
+
+페이지의 사진 주소는 각 출력 파일 기준 상대 경로로 쓴다. 사진 폴더나 썸네일 폴더(--thumbnail-dir)가 출력 폴더 밖에 있으면 주소가 ../로
+시작하므로 파일로 열 때는 보이지만 출력 폴더만 웹 서버에 올리면 사진이 빠진다 (시작할 때 경고를 보여 주고,
+static_assets의 static-manifest.json에도 넣지 않는다). 호스팅할 때는 두 폴더를 출력 폴더 안에 둔다.
+
+사용법:
+    python seating_batch.py schools.json
+    python seating_batch.py schools.json --workers 4 --thumbnails
+"""
+import argparse
+import json
+import os
+import threading
+import time
+import unicodedata
+from concurrent.futures import ThreadPoolExecutor
+
+from create_combined_seating_html import FragmentCache, PhotoIndex, render
+from student_data import DEFAULT_CACHE_DIR, load_students
+
+JOB_KEYS = ('name', 'csv', 'image_roots', 'output', 'classes', 'split', 'thumbnails', 'bundle', 'lazy_tabs',
+            'search', 'analytics', 'jobs', 'incremental', 'static_assets')
+PATH_KEYS = ('csv', 'output')
+
+
+def load_manifest(path):
+    """작업 목록 파일을 읽어 작업(dict) 목록 반환 (defaults 적용, 상대 경로는 파일 위치 기준)"""
+    with open(path, encoding='utf-8') as f:
+        manifest = json.load(f)
+    base = os.path.dirname(os.path.abspath(path))
+    defaults = manifest.get('defaults', {})
+
+    jobs = []
+    names = set()
+    for i, entry in enumerate(manifest['jobs'], 1):
+        job = {**defaults, **entry}
+        unknown = set(job) - set(JOB_KEYS)
+        if unknown:
+            raise ValueError(f"{i}번째 작업: 알 수 없는 항목 {sorted(unknown)}")
+        for key in ('csv', 'output', 'image_roots'):
+            if not job.get(key):
+                raise ValueError(f"{i}번째 작업: '{key}' 항목이 필요합니다")
+        job.setdefault('name', os.path.splitext(os.path.basename(job['output']))[0])
+        # 이름은 캐시 폴더(<캐시>/batch/<이름>)로도 쓰므로 경로가 될 수 있는 이름은 받지 않음
+        if job['name'] in ('', '.', '..') or any(char in job['name'] for char in '/\\:'):
+            raise ValueError(f"{i}번째 작업: 이름에 /, \\, :를 쓸 수 없고 '.', '..'도 안 됩니다: {job['name']!r}")
+        if job['name'] in names:
+            raise ValueError(f"작업 이름이 겹칩니다: {job['name']}")
+        names.add(job['name'])
+
+        for key in PATH_KEYS:
+            job[key] = os.path.join(base, job[key])
+        job['image_roots'] = [os.path.join(base, root) for root in job['image_roots']]
+        jobs.append(job)
+    return jobs
+
+
+def roots_outside_output(job, thumbnail_dir=None):
+    """출력 폴더 밖에 있는 사진 / 썸네일 폴더 목록 (출력 폴더만 호스팅하면 그 사진은 보이지 않음)
+
+    썸네일을 쓰는 작업은 thumbnail_dir(모든 작업이 함께 쓰는 썸네일 폴더)도 확인한다.
+    한 파일 묶음(bundle)은 썸네일을 HTML 안에 넣으므로 확인하지 않는다.
+    """
+    out_dir = os.path.normpath(os.path.dirname(job['output']))
+    roots = list(job['image_roots'])
+    if thumbnail_dir and job.get('thumbnails') and not job.get('bundle'):
+        roots.append(os.path.abspath(thumbnail_dir))
+    outside = []
+    for root in roots:
+        root = os.path.normpath(root)
+        try:
+            inside = os.path.commonpath([out_dir, root]) == out_dir
+        except ValueError:  # 윈도에서 드라이브가 다름
+            inside = False
+        if not inside:
+            outside.append(root)
+    return outside
+
+
+class JobResult:
+    """작업 하나의 결과 (실패하면 error에 메시지)"""
+
+    def __init__(self, name, render_result=None, seconds=0.0, error=None, warnings=None):
+        self.name = name
+        self.render_result = render_result
+        self.seconds = seconds
+        self.error = error
+        self.warnings = warnings or []
+
+
+class BatchRunner:
+    """작업들이 함께 쓰는 사진 색인과 썸네일 캐시를 들고 작업을 실행"""
+
+    def __init__(self, thumbnail_dir='thumbnails', cache_dir=DEFAULT_CACHE_DIR):
+        self.thumbnail_dir = thumbnail_dir
+        self.cache_dir = cache_dir
+        self.thumbnails = None  # 썸네일을 쓰는 작업이 처음 나올 때 만듦
+        self._indexes = {}  # 사진 폴더 목록 -> PhotoIndex
+        self._lock = threading.Lock()
+        self._static_lock = threading.Lock()  # 같은 폴더의 assets/, static-manifest.json을 함께 쓰지 않도록
+
+    def thumbnail_cache(self):
+        with self._lock:
+            if self.thumbnails is None:
+                from thumbnails import ThumbnailCache
+                self.thumbnails = ThumbnailCache(self.thumbnail_dir)
+            return self.thumbnails
+
+    def photo_index(self, image_roots):
+        """같은 사진 폴더 목록이면 이미 만든 색인을 돌려줌"""
+        key = tuple(image_roots)
+        with self._lock:
+            if key not in self._indexes:
+                self._indexes[key] = PhotoIndex(key[0], key[1:])
+            return self._indexes[key]
+
+    @property
+    def index_count(self):
+        return len(self._indexes)
+
+    def run_job(self, job):
+        """작업 하나 실행 (예외는 JobResult.error로 돌려줌)"""
+        start = time.perf_counter()
+        warnings = []
+        try:
+            # 작업마다 데이터 / 조각 캐시 폴더를 따로 둠 (CSV 이름과 클래스 번호가 겹칠 수 있으므로)
+            cache_dir = os.path.join(self.cache_dir, 'batch', job['name']) if self.cache_dir else None
+            data = load_students(job['csv'], cache_dir=cache_dir)
+            fragment_cache = FragmentCache(cache_dir) if job.get('incremental') and cache_dir else None
+            bundle = job.get('bundle', False)
+            thumbnails = self.thumbnail_cache() if bundle or job.get('thumbnails') else None
+            result = render(
+                data, job['output'], classes=job.get('classes'), split=job.get('split', False),
+                photo_index=self.photo_index(job['image_roots']), thumbnails=thumbnails, bundle=bundle,
+                lazy_tabs=job.get('lazy_tabs', False), search=job.get('search', True),
+                analytics=job.get('analytics', False), fragment_cache=fragment_cache,
+                jobs=job.get('jobs', 1),
+            )
+            if job.get('static_assets'):
+                from static_assets import export_static
+                with self._static_lock:
+                    export = export_static(result.paths)
+                if export.skipped:
+                    warnings.append(f"정적 목록에 넣지 않은 사진 {len(export.skipped)}개 ({export.skipped_summary()})")
+        except Exception as e:
+            return JobResult(job['name'], seconds=time.perf_counter() - start, error=f"{type(e).__name__}: {e}")
+        return JobResult(job['name'], result, time.perf_counter() - start, warnings=warnings)
+
+    def run(self, jobs, workers=None):
+        """작업들을 스레드 workers개로 함께 실행하고 작업 순서대로 JobResult 목록 반환"""
+        workers = workers or min(len(jobs), os.cpu_count() or 1) or 1
+        if workers == 1:
+            return [self.run_job(job) for job in jobs]
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(self.run_job, jobs))
+
+
+def _display_width(text):
+    """터미널에서 차지하는 칸 수 (한글 등 넓은 글자는 두 칸)"""
+    return sum(2 if unicodedata.east_asian_width(char) in 'WF' else 1 for char in text)
+
+
+def _pad(text, width):
+    return text + ' ' * (width - _display_width(text))
+
+
+def summary_lines(results):
+    """작업별 요약 표 (줄 목록)"""
+    width = max([_display_width(result.name) for result in results] + [4])
+    # 한글 머리글은 두 칸씩 차지하므로 그만큼 폭을 줄임
+    lines = [f"   {_pad('작업', width)} {'학생':>4} {'클래스':>3} {'파일':>4} {'크기(KB)':>8} {'시간(ms)':>8}"]
+    for result in results:
+        if result.error:
+            lines.append(f"   {_pad(result.name, width)} ❌ {result.error}")
+            continue
+        r = result.render_result
+        lines.append(f"   {_pad(result.name, width)} {r.students:>6} {len(r.classes):>6} {len(r.outputs):>6}"
+                     f" {r.total_bytes / 1024:>10.1f} {result.seconds * 1000:>10.1f}")
+    done = [result for result in results if not result.error]
+    total_bytes = sum(result.render_result.total_bytes for result in done)
+    lines.append(f"   {_pad('합계', width)} {sum(r.render_result.students for r in done):>6}"
+                 f" {sum(len(r.render_result.classes) for r in done):>6}"
+                 f" {sum(len(r.render_result.outputs) for r in done):>6} {total_bytes / 1024:>10.1f}")
+    return lines
+
+
+def main(argv=None):
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="여러 학교 / 학년의 자리표 일괄 생성")
+    parser.add_argument('manifest', help='작업 목록 파일 (JSON)')
+    parser.add_argument('--workers', '-w', type=int,
+                        help='함께 실행할 작업 수 (기본값: 작업 수와 CPU 수 중 작은 값)')
+    parser.add_argument('--thumbnails', action='store_true',
+                        help='작업에 thumbnails 항목이 없으면 썸네일 사용 (Pillow 필요)')
+    parser.add_argument('--thumbnail-dir', default='thumbnails',
+                        help='모든 작업이 함께 쓰는 썸네일 캐시 폴더 (기본값: thumbnails)')
+    parser.add_argument('--cache-dir', default=DEFAULT_CACHE_DIR,
+                        help=f'데이터 / 조각 캐시 폴더, 작업마다 batch/<작업 이름>에 둠 (기본값: {DEFAULT_CACHE_DIR})')
+    args = parser.parse_args(argv)
+
+    try:
+        jobs = load_manifest(args.manifest)
+    except (OSError, ValueError, KeyError) as e:
+        print(f"❌ 작업 목록을 읽을 수 없습니다: {e}")
+        return 1
+
+    if args.thumbnails:
+        for job in jobs:
+            job.setdefault('thumbnails', True)
+    for job in jobs:
+        for root in roots_outside_output(job, args.thumbnail_dir):
+            print(f"⚠️ {job['name']}: {os.path.relpath(root)} 폴더가 출력 폴더 밖에 있습니다"
+                  f" (출력 폴더만 올리면 사진이 보이지 않음)")
+
+    print(f"📋 작업 {len(jobs)}개 시작")
+    start = time.perf_counter()
+    runner = BatchRunner(args.thumbnail_dir, args.cache_dir)
+    results = runner.run(jobs, args.workers)
+    seconds = time.perf_counter() - start
+
+    print(f"\n📊 작업별 결과 (전체 {seconds * 1000:.0f} ms, 사진 색인 {runner.index_count}개 공유)")
+    for line in summary_lines(results):
+        print(line)
+    for result in results:
+        for warning in result.warnings:
+            print(f"⚠️ {result.name}: {warning}")
+    if runner.thumbnails is not None:
+        print(f"🖼️ 썸네일: 새로 생성 {runner.thumbnails.generated}개, 캐시 사용 {runner.thumbnails.reused}개"
+              f" ({args.thumbnail_dir}/)")
+
+    failed = [result for result in results if result.error]
+    if failed:
+        print(f"⚠️ 실패한 작업 {len(failed)}개")
+        return 1
+    print("✅ 모든 작업 완료")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,312 @@
+"""인쇄용 자리표 PDF: 모든 클래스를 한 번에, 클래스마다 한 쪽
+
+브라우저에서 탭마다 Ctrl+P로 인쇄하면 원본 사진을 그대로 받고 한 반씩 인쇄해야 한다.
+여기서는 썸네일(ThumbnailCache, 100×100)로 클래스마다 A4 한 쪽을 그림으로 그린 뒤
+(자리가 가로로 넓으면 가로 방향) 프로세스 풀에서 나눠 만들고, 쪽 그림(JPEG)을
+다시 인코딩하지 않고 PDF 하나에 차례로 이어 쓴다.
+쪽 크기(--dpi)와 JPEG 품질이 정해져 있으므로 쪽마다 크기와 시간이 거의 일정하고,
+한 번에 메모리에 올리는 것은 작업마다 한 쪽뿐이다 (50개 클래스 이상도 같음).
+
+한글 글꼴은 맑은 고딕 / 나눔고딕 / Noto Sans CJK / Apple SD 고딕 Neo 순서로 찾으며
+--font로 직접 줄 수 있다. Pillow가 필요하다.
+
+사용법:
+    python seating_print.py
+    python seating_print.py --csv integrated_student_data.csv -o seating_print.pdf --jobs 4
+"""
+import argparse
+import functools
+import io
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from create_combined_seating_html import (
+    DEFAULT_CSV, EXTRA_IMAGE_ROOTS, IMAGE_ROOT, SCORE_BANDS, PhotoIndex, iter_seat_rows, prepare_class_seats,
+    select_classes,
+)
+from student_data import DEFAULT_CACHE_DIR, load_students
+
+try:
+    from PIL import Image, ImageDraw, ImageFont, ImageOps
+except ImportError:  # Pillow가 없으면 PDF 인쇄만 사용할 수 없음
+    Image = None
+
+DEFAULT_OUTPUT = 'seating_print.pdf'
+PAGE_MM = (210, 297)  # A4 (세로 폭, 높이)
+MARGIN_MM = 10
+DPI = 150
+JPEG_QUALITY = 75
+FONT_CANDIDATES = (
+    'C:/Windows/Fonts/malgun.ttf',
+    '/usr/share/fonts/truetype/nanum/NanumGothic.ttf',
+    '/usr/share/fonts/opentype/noto/NotoSansCJK-Regular.ttc',
+    '/usr/share/fonts/noto-cjk/NotoSansCJK-Regular.ttc',
+    '/System/Library/Fonts/AppleSDGothicNeo.ttc',
+)
+# 자리 테두리 / 점수 배경 색 (seating_templates의 .seat.<구간>과 같음)
+BAND_COLORS = dict(zip((score_class for score_class, _ in SCORE_BANDS),
+                       ('#27ae60', '#f39c12', '#e74c3c', '#95a5a6')))
+TEXT_COLOR = '#2c3e50'
+NO_PHOTO_COLOR = '#ecf0f1'
+SEAT_ASPECT = 120 / 110  # 화면의 .seat (120×110)과 같은 비율
+
+
+def find_font(path=None):
+    """한글 글꼴 경로 (path가 있으면 그대로, 없으면 FONT_CANDIDATES 중 있는 것, 못 찾으면 None)"""
+    if path:
+        return path
+    return next((candidate for candidate in FONT_CANDIDATES if os.path.exists(candidate)), None)
+
+
+@functools.lru_cache(maxsize=None)
+def _font(font_path, size):
+    if font_path is None:
+        return ImageFont.load_default(size)
+    return ImageFont.truetype(font_path, size)
+
+
+def _fit_text(draw, text, font_path, size, max_width):
+    """max_width 안에 들어가도록 글자 크기를 줄인 글꼴 (6픽셀까지)"""
+    while size > 6:
+        font = _font(font_path, size)
+        if draw.textlength(text, font=font) <= max_width:
+            return font
+        size = max(6, int(size * 0.9))
+    return _font(font_path, size)
+
+
+def _photo(path, size):
+    """사진을 size×size 정사각형으로 (가운데를 잘라 화면의 object-fit: cover와 같게), 없으면 None"""
+    if not path:
+        return None
+    try:
+        with Image.open(path) as image:
+            return ImageOps.fit(image.convert('RGB'), (size, size), Image.LANCZOS)
+    except OSError:
+        return None
+
+
+def render_class_page(task):
+    """한 클래스의 쪽을 JPEG로 그려 (클래스, JPEG 바이트, 픽셀 크기, 쪽 크기(mm), 걸린 시간) 반환
+    (작업 프로세스에서도 실행됨)
+
+    task는 (클래스, 최대 행, 최대 열, 좌석 목록, 설정)이며 설정은 dpi, quality, font, date를 담은 dict이다.
+    """
+    class_num, max_row, max_col, seats, settings = task
+    start = time.perf_counter()
+    rows = list(iter_seat_rows(max_row, max_col, seats))
+    page_mm = PAGE_MM if len(rows) > max_col else PAGE_MM[::-1]  # 자리가 가로로 넓으면 가로 방향
+    scale = settings['dpi'] / 25.4  # mm → 픽셀
+    width, height = round(page_mm[0] * scale), round(page_mm[1] * scale)
+    margin = round(MARGIN_MM * scale)
+    font_path = settings['font']
+
+    page = Image.new('RGB', (width, height), 'white')
+    draw = ImageDraw.Draw(page)
+
+    # 제목 / 학생 수와 날짜 / 앞(1행) 표시
+    title_size = round(8 * scale)
+    draw.text((margin, margin), f"{class_num}반 자리표", fill=TEXT_COLOR, font=_font(font_path, title_size))
+    info_font = _font(font_path, round(4 * scale))
+    draw.text((width - margin, margin + title_size), f"{len(seats)}명 · {settings['date']}", fill='#7f8c8d',
+              font=info_font, anchor='rd')
+    front_top = margin + title_size + round(5 * scale)
+    front_height = round(7 * scale)
+    draw.rounded_rectangle((margin, front_top, width - margin, front_top + front_height), radius=round(2 * scale),
+                           fill='#ecf0f1')
+    draw.text((width // 2, front_top + front_height // 2), "앞 (교탁)", fill='#7f8c8d', font=info_font, anchor='mm')
+
+    # 자리 크기: 남은 공간에 맞추되 화면의 자리 비율을 지킴
+    gap = round(2 * scale)
+    top = front_top + front_height + round(4 * scale)
+    n_rows = max(len(rows), 1)
+    cell_w = (width - 2 * margin - gap * (max_col - 1)) / max_col
+    cell_h = (height - margin - top - gap * (n_rows - 1)) / n_rows
+    cell_w, cell_h = min(cell_w, cell_h * SEAT_ASPECT), min(cell_h, cell_w / SEAT_ASPECT)
+    left = (width - (cell_w * max_col + gap * (max_col - 1))) / 2
+    photo_size = round(min(cell_w, cell_h) * 0.5)
+    border = max(2, round(0.6 * scale))
+    label_size = round(cell_h * 0.11)
+    score_size = round(cell_h * 0.095)
+
+    for r, seat_row in enumerate(rows):
+        y = top + r * (cell_h + gap)
+        for c, seat in enumerate(seat_row):
+            if seat is None:
+                continue
+            x = left + c * (cell_w + gap)
+            _, _, score_class, _, score_text, label, _, image_path, _, _ = seat
+            color = BAND_COLORS.get(score_class, BAND_COLORS['none'])
+            draw.rounded_rectangle((x, y, x + cell_w, y + cell_h), radius=round(cell_h * 0.07), fill='white',
+                                   outline=color, width=border)
+
+            photo_x, photo_y = round(x + (cell_w - photo_size) / 2), round(y + cell_h * 0.08)
+            photo = _photo(image_path, photo_size)
+            if photo is not None:
+                page.paste(photo, (photo_x, photo_y))
+            else:
+                draw.rounded_rectangle((photo_x, photo_y, photo_x + photo_size, photo_y + photo_size),
+                                       radius=round(photo_size * 0.2), fill=NO_PHOTO_COLOR)
+
+            center_x = x + cell_w / 2
+            label_y = photo_y + photo_size + cell_h * 0.1
+            draw.text((center_x, label_y), label, fill=TEXT_COLOR, anchor='mm',
+                      font=_fit_text(draw, label, font_path, label_size, cell_w - 2 * border - 4))
+            score_font = _font(font_path, score_size)
+            score_y = label_y + cell_h * 0.15
+            pill_w = draw.textlength(score_text, font=score_font) + score_size
+            draw.rounded_rectangle((center_x - pill_w / 2, score_y - score_size * 0.75,
+                                    center_x + pill_w / 2, score_y + score_size * 0.75),
+                                   radius=score_size * 0.75, fill=color)
+            draw.text((center_x, score_y), score_text, fill='white', font=score_font, anchor='mm')
+
+    buffer = io.BytesIO()
+    page.save(buffer, 'JPEG', quality=settings['quality'], optimize=True, dpi=(settings['dpi'],) * 2)
+    return class_num, buffer.getvalue(), page.size, page_mm, time.perf_counter() - start
+
+
+class PdfWriter:
+    """JPEG 쪽 그림을 다시 인코딩하지 않고 차례로 이어 쓰는 최소 PDF 작성기
+
+    쪽은 받는 즉시 파일에 쓰고 위치만 기억하며, 쪽 목록(Pages)과 문서(Catalog)는 close()에서 쓴다.
+    """
+
+    def __init__(self, out):
+        self.out = out
+        self.offsets = {}  # 객체 번호 → 파일 위치
+        self.pages = []    # 쪽 객체 번호
+        self._next = 3     # 1: Catalog, 2: Pages
+        self._write(b'%PDF-1.4\n%\xe2\xe3\xcf\xd3\n')
+
+    def _write(self, data):
+        self.out.write(data)
+
+    def _position(self):
+        return self.out.tell()
+
+    def _object(self, number, body, stream=None):
+        self.offsets[number] = self._position()
+        self._write(f"{number} 0 obj\n".encode('ascii') + body)
+        if stream is not None:
+            self._write(b'\nstream\n' + stream + b'\nendstream')
+        self._write(b'\nendobj\n')
+
+    def add_page(self, jpeg, pixel_size, page_mm):
+        """JPEG 그림 한 장을 page_mm(폭, 높이) 크기의 쪽 하나로 추가"""
+        image, content, page = self._next, self._next + 1, self._next + 2
+        self._next += 3
+        width_pt, height_pt = (round(mm * 72 / 25.4, 2) for mm in page_mm)
+        self._object(image, (f"<< /Type /XObject /Subtype /Image /Width {pixel_size[0]} /Height {pixel_size[1]} "
+                             f"/ColorSpace /DeviceRGB /BitsPerComponent 8 /Filter /DCTDecode "
+                             f"/Length {len(jpeg)} >>").encode('ascii'), jpeg)
+        drawing = f"q {width_pt} 0 0 {height_pt} 0 0 cm /Im0 Do Q".encode('ascii')
+        self._object(content, f"<< /Length {len(drawing)} >>".encode('ascii'), drawing)
+        self._object(page, (f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 {width_pt} {height_pt}] "
+                            f"/Resources << /XObject << /Im0 {image} 0 R >> >> /Contents {content} 0 R >>"
+                            ).encode('ascii'))
+        self.pages.append(page)
+
+    def close(self, title=''):
+        kids = ' '.join(f"{page} 0 R" for page in self.pages)
+        self._object(2, f"<< /Type /Pages /Kids [{kids}] /Count {len(self.pages)} >>".encode('ascii'))
+        self._object(1, b"<< /Type /Catalog /Pages 2 0 R >>")
+        info = self._next
+        title_hex = ('\ufeff' + title).encode('utf-16-be').hex()  # 한글 제목은 UTF-16BE(BOM 포함) 16진 문자열로
+        self._object(info, f"<< /Title <{title_hex}> /Producer (seating_print) >>".encode('ascii'))
+        xref = self._position()
+        lines = [f"xref\n0 {info + 1}\n", "0000000000 65535 f \n"]
+        lines += [f"{self.offsets[number]:010d} 00000 n \n" for number in range(1, info + 1)]
+        lines.append(f"trailer\n<< /Size {info + 1} /Root 1 0 R /Info {info} 0 R >>\nstartxref\n{xref}\n%%EOF\n")
+        self._write(''.join(lines).encode('ascii'))
+
+
+def iter_class_pages(class_seats, settings, jobs=1):
+    """클래스 순서대로 render_class_page() 결과 생성 (jobs가 2 이상이면 프로세스 풀에서 나눠 그림)"""
+    tasks = [(class_num, max_row, max_col, seats, settings) for class_num, max_row, max_col, seats in class_seats]
+    if jobs <= 1 or len(tasks) <= 1:
+        yield from map(render_class_page, tasks)
+        return
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        yield from pool.map(render_class_page, tasks)
+
+
+def write_print_pdf(class_seats, output=DEFAULT_OUTPUT, jobs=1, dpi=DPI, quality=JPEG_QUALITY, font=None,
+                    title="전체 클래스 자리표"):
+    """prepare_class_seats()로 만든 좌석 데이터를 클래스마다 한 쪽인 PDF로 쓰고 (쪽 수, 바이트 수, 쪽별 시간) 반환
+
+    사진은 좌석의 이미지 경로(썸네일을 쓰면 썸네일)를 그대로 쓴다. 파일은 임시 파일에 다 쓴 뒤 바꿔치기한다.
+    """
+    if Image is None:
+        raise ImportError("PDF 인쇄에는 Pillow가 필요합니다 (pip install pillow)")
+    settings = {'dpi': dpi, 'quality': quality, 'font': find_font(font), 'date': time.strftime('%Y-%m-%d')}
+    folder = os.path.dirname(output)
+    if folder:
+        os.makedirs(folder, exist_ok=True)
+    tmp_path = output + '.tmp'
+    page_seconds = {}
+    with open(tmp_path, 'wb') as f:
+        writer = PdfWriter(f)
+        for class_num, jpeg, pixel_size, page_mm, seconds in iter_class_pages(class_seats, settings, jobs):
+            writer.add_page(jpeg, pixel_size, page_mm)
+            page_seconds[class_num] = seconds
+        writer.close(title)
+        size = f.tell()
+    os.replace(tmp_path, output)
+    return len(writer.pages), size, page_seconds
+
+
+def main(argv=None):
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="인쇄용 자리표 PDF (클래스마다 한 쪽)")
+    parser.add_argument('--csv', default=DEFAULT_CSV, help=f'학생 데이터 CSV (기본값: {DEFAULT_CSV})')
+    parser.add_argument('--output', '-o', default=DEFAULT_OUTPUT, help=f'출력 PDF 파일 (기본값: {DEFAULT_OUTPUT})')
+    parser.add_argument('--image-root', default=IMAGE_ROOT,
+                        help=f'class_N 사진 폴더가 있는 곳 (기본값: {IMAGE_ROOT})')
+    parser.add_argument('--extra-image-root', action='append', metavar='DIR',
+                        help=f"사진을 더 찾아볼 폴더, 여러 번 줄 수 있음 (기본값: {', '.join(EXTRA_IMAGE_ROOTS)})")
+    parser.add_argument('--classes', nargs='+', metavar='N', help='이 클래스들만 인쇄 (기본값: 전체)')
+    parser.add_argument('--jobs', '-j', type=int, default=os.cpu_count() or 1,
+                        help='쪽을 나눠 그릴 프로세스 수 (기본값: CPU 수)')
+    parser.add_argument('--dpi', type=int, default=DPI, help=f'쪽 그림 해상도 (기본값: {DPI})')
+    parser.add_argument('--quality', type=int, default=JPEG_QUALITY, help=f'쪽 그림 JPEG 품질 (기본값: {JPEG_QUALITY})')
+    parser.add_argument('--font', help='한글 글꼴 파일 (.ttf/.ttc, 기본값: 맑은 고딕 등 설치된 글꼴)')
+    parser.add_argument('--thumbnail-dir', default='thumbnails', help='썸네일 캐시 폴더 (기본값: thumbnails)')
+    parser.add_argument('--cache-dir', default=DEFAULT_CACHE_DIR,
+                        help=f'데이터 캐시 폴더 (기본값: {DEFAULT_CACHE_DIR})')
+    args = parser.parse_args(argv)
+
+    if Image is None:
+        print("❌ PDF 인쇄에는 Pillow가 필요합니다 (pip install pillow)")
+        return 1
+    if find_font(args.font) is None:
+        print("⚠️ 한글 글꼴을 찾지 못했습니다. 글자가 깨지면 --font로 글꼴 파일을 지정하세요")
+
+    start = time.perf_counter()
+    try:
+        data = load_students(args.csv, cache_dir=args.cache_dir)
+    except FileNotFoundError:
+        print(f"❌ {args.csv} 파일을 찾을 수 없습니다.")
+        return 1
+    if args.classes:
+        data = select_classes(data, args.classes)
+
+    from thumbnails import ThumbnailCache
+    thumbnails = ThumbnailCache(args.thumbnail_dir)
+    extra_roots = args.extra_image_root if args.extra_image_root is not None else list(EXTRA_IMAGE_ROOTS)
+    class_seats = prepare_class_seats(data, PhotoIndex(args.image_root, extra_roots), thumbnails)
+    prepared = time.perf_counter()
+    print(f"✅ {len(data)}명, 클래스 {len(class_seats)}개 (썸네일: 새로 생성 {thumbnails.generated}개, "
+          f"캐시 사용 {thumbnails.reused}개, {(prepared - start) * 1000:.0f} ms)")
+
+    pages, size, page_seconds = write_print_pdf(class_seats, args.output, args.jobs, args.dpi, args.quality,
+                                                args.font)
+    seconds = time.perf_counter() - prepared
+    slowest = max(page_seconds.values(), default=0)
+    print(f"🖨️ {args.output} 생성 완료: {pages}쪽, {size / 1024:.1f} KB (쪽당 {size / max(pages, 1) / 1024:.1f} KB), "
+          f"{seconds * 1000:.0f} ms (작업 {args.jobs}개, 가장 느린 쪽 {slowest * 1000:.0f} ms)")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,386 @@
+"""자리표 서버 모드: 학생 명단을 한 번 읽어 두고 클래스 탭을 요청받을 때 만들어 보냄
+
+한 파일에 모든 클래스를 넣으면 선생님이 자기 반만 열어도 전체를 만들고 받아야 한다.
+서버 모드는 http.server(요청마다 스레드)로 다음 주소를 보여 준다.
+    /                 탭 버튼과 빈 탭 자리만 있는 페이지 (탭을 처음 열 때 조각을 받아 옴, /#3 이면 3반부터)
+    /class/<반>       그 클래스의 탭 HTML 조각 (처음 요청할 때 만들어 최근에 쓴 것부터 LRU로 보관)
+    /photos/<키>/<이름>  조각이 가리키는 사진 / 썸네일만 ETag / Last-Modified로 조건부 GET(304) 지원
+                      (키는 파일 경로의 해시이므로 사진 폴더의 실제 경로는 페이지에 드러나지 않음)
+    /__stats          조각 캐시 적중 / 생성 수 (JSON)
+CSV와 사진 폴더는 seating_watch의 감시기로 지켜보다가 바뀌었을 때만 다시 읽는다.
+다시 읽으면 클래스마다 조각 키(좌석 데이터와 사진 수정 시간의 해시)를 새로 계산하므로,
+바뀐 클래스의 조각만 캐시에서 빠지고 나머지는 그대로 쓴다. 요청은 CSV를 읽지 않는다.
+
+사용법:
+    python seating_server.py
+    python seating_server.py --csv integrated_student_data.csv --port 8000 --thumbnails
+"""
+import argparse
+import email.utils
+import gzip
+import hashlib
+import json
+import os
+import shutil
+import threading
+import time
+from collections import OrderedDict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import unquote
+
+from create_combined_seating_html import (
+    DEFAULT_CSV, EXTRA_IMAGE_ROOTS, IMAGE_ROOT, FragmentCache, PhotoIndex, prepare_class_seats, render_class_tab,
+)
+from seating_templates import HTML_HEAD_BYTES, HTML_TAIL_BYTES, SERVER_SCRIPT_BYTES, SERVER_TAB, TAB_BUTTON, \
+    TAB_BUTTONS_END_BYTES
+from static_assets import REVALIDATE, content_hash, content_type, file_cache_headers
+from student_data import DEFAULT_CACHE_DIR, load_students
+
+DEFAULT_PORT = 8000
+CACHE_SIZE = 64      # 메모리에 보관할 탭 조각 수
+GZIP_MIN_BYTES = 1024
+PHOTO_PREFIX = '/photos/'
+
+
+def photo_url(path):
+    """사진 파일의 서버 주소 /photos/<절대 경로 해시>/<파일 이름> (명단을 다시 읽어도 같음)"""
+    path = os.path.abspath(path)
+    key = hashlib.sha256(os.fsencode(path)).hexdigest()[:12]
+    return f"{PHOTO_PREFIX}{key}/{os.path.basename(path)}"
+
+
+def _served_seat(seat, photos):
+    """좌석의 사진 경로를 서버 주소로 바꾼 좌석 (주소 -> 경로는 photos에 모음)"""
+    urls = []
+    for path in (seat[7], seat[8]):
+        url = photo_url(path) if path else path
+        if path:
+            photos[url] = os.path.normpath(os.path.abspath(path))
+        urls.append(url)
+    return (*seat[:7], *urls, *seat[9:])
+
+
+class LRUFragmentCache(FragmentCache):
+    """최근에 쓴 탭 조각 maxsize개만 메모리에 보관하는 FragmentCache (여러 스레드에서 함께 씀)
+
+    키는 FragmentCache와 같은 (클래스, 좌석 데이터, 사진 수정 시간) 해시이다. 같은 조각을 여러 요청이
+    동시에 기다리면 한 요청만 만들고 나머지는 그 결과를 쓴다. 조각마다 gzip 압축본도 함께 보관한다.
+    """
+
+    def __init__(self, maxsize=CACHE_SIZE):
+        self.cache_dir = None
+        self.maxsize = maxsize
+        self.stat_count = 0
+        self.hits = 0
+        self.misses = 0
+        self.render_seconds = 0.0
+        self._entries = OrderedDict()  # 키 -> (조각, gzip 조각)
+        self._building = {}            # 만드는 중인 키 -> threading.Event
+        self._lock = threading.Lock()
+
+    def digest(self, class_num, max_row, max_col, seats):
+        """클래스 조각의 키 (사진 수정 시간을 확인하므로 다시 읽을 때 한 번만 계산)"""
+        return self._digest(class_num, max_row, max_col, seats, (False, False, []))
+
+    def get(self, digest, entry):
+        """키에 맞는 (조각, gzip 조각) 반환 - 없으면 entry(클래스 좌석 데이터)로 만들어 보관"""
+        while True:
+            with self._lock:
+                cached = self._entries.get(digest)
+                if cached is not None:
+                    self._entries.move_to_end(digest)
+                    self.hits += 1
+                    return cached
+                building = self._building.get(digest)
+                if building is None:
+                    building = self._building[digest] = threading.Event()
+                    break
+            building.wait()  # 다른 요청이 만드는 중 (실패했으면 다시 시도)
+
+        try:
+            fragment, seconds = render_class_tab((*entry, False, None, False, None))
+            cached = (fragment, gzip.compress(fragment, 6, mtime=0) if len(fragment) >= GZIP_MIN_BYTES else None)
+            with self._lock:
+                self._entries[digest] = cached
+                while len(self._entries) > self.maxsize:
+                    self._entries.popitem(last=False)
+                self.misses += 1
+                self.render_seconds += seconds
+            return cached
+        finally:
+            with self._lock:
+                del self._building[digest]
+            building.set()
+
+    def retain(self, digests):
+        """지금 명단에 없는 키(바뀐 클래스의 옛 조각)를 캐시에서 뺌"""
+        with self._lock:
+            for digest in set(self._entries) - set(digests):
+                del self._entries[digest]
+
+    def __len__(self):
+        return len(self._entries)
+
+
+class RosterSnapshot:
+    """한 번 읽은 명단으로 만든 값들 (다시 읽으면 새 스냅숏으로 통째로 바꿈)
+
+    classes의 좌석은 사진 경로 대신 서버 주소(photo_url)를 담고, photos는 주소 -> 파일 경로이다.
+    """
+
+    def __init__(self, generation, class_seats, digests):
+        self.generation = generation
+        self.students = sum(len(seats) for _, _, _, seats in class_seats)
+        self.digests = digests  # 클래스 -> 조각 키
+        self.photos = {}
+        self.classes = {str(class_num): (class_num, max_row, max_col,
+                                         [_served_seat(seat, self.photos) for seat in seats])
+                        for class_num, max_row, max_col, seats in class_seats}
+        self.shell = self._build_shell(class_seats)
+        self.shell_etag = f'"{content_hash(self.shell)}"'
+
+    @staticmethod
+    def _build_shell(class_seats):
+        return b''.join([
+            HTML_HEAD_BYTES,
+            ''.join(TAB_BUTTON.fill('', class_num, class_num) for class_num, _, _, _ in class_seats).encode('utf-8'),
+            TAB_BUTTONS_END_BYTES,
+            ''.join(SERVER_TAB.fill(class_num, class_num) for class_num, _, _, _ in class_seats).encode('utf-8'),
+            SERVER_SCRIPT_BYTES,
+            HTML_TAIL_BYTES,
+        ])
+
+
+class SeatingServer:
+    """명단 / 사진 색인 / 조각 캐시를 들고 있고 파일이 바뀌면 명단을 다시 읽음"""
+
+    def __init__(self, csv_path, image_roots=None, thumbnails=None, cache_size=CACHE_SIZE,
+                 cache_dir=DEFAULT_CACHE_DIR):
+        roots = list(image_roots) if image_roots else [IMAGE_ROOT, *EXTRA_IMAGE_ROOTS]
+        self.csv_path = csv_path
+        self.cache_dir = cache_dir
+        self.thumbnails = thumbnails
+        self.photo_index = PhotoIndex(roots[0], roots[1:])
+        self.fragments = LRUFragmentCache(cache_size)
+        self.snapshot = None
+        self.reload_count = 0
+        self.reload()
+
+    def reload(self):
+        """CSV를 읽고 클래스별 좌석 / 조각 키를 다시 계산해 스냅숏을 바꿈 (요청 처리와 함께 실행돼도 됨)"""
+        start = time.perf_counter()
+        data = load_students(self.csv_path, cache_dir=self.cache_dir)
+        class_seats = prepare_class_seats(data, self.photo_index, self.thumbnails)
+        digests = {str(entry[0]): self.fragments.digest(*entry) for entry in class_seats}
+        generation = self.snapshot.generation + 1 if self.snapshot else 1
+        self.snapshot = RosterSnapshot(generation, class_seats, digests)
+        self.fragments.retain(digests.values())
+        self.reload_count += 1
+        return time.perf_counter() - start
+
+    def fragment(self, class_num):
+        """(조각, gzip 조각, ETag) 또는 없는 클래스면 None"""
+        snapshot = self.snapshot
+        entry = snapshot.classes.get(class_num)
+        if entry is None:
+            return None
+        digest = snapshot.digests[class_num]
+        fragment, packed = self.fragments.get(digest, entry)
+        return fragment, packed, f'"{digest[:16]}"'
+
+    def stats(self):
+        snapshot = self.snapshot
+        return {'generation': snapshot.generation, 'students': snapshot.students, 'classes': len(snapshot.classes),
+                'cached': len(self.fragments), 'hits': self.fragments.hits, 'misses': self.fragments.misses,
+                'render_ms': round(self.fragments.render_seconds * 1000, 1), 'reloads': self.reload_count}
+
+    def watch(self):
+        """CSV/사진 폴더가 바뀔 때마다 다시 읽음 (백그라운드 스레드에서 실행)"""
+        from seating_watch import make_watcher
+        watcher = make_watcher(self.csv_path, self.photo_index)
+        try:
+            while True:
+                watcher.wait()
+                try:
+                    self.photo_index.refresh()
+                    seconds = self.reload()
+                except Exception as e:  # 저장 도중의 CSV 등: 이전 명단을 그대로 씀
+                    print(f"⚠️ 다시 읽지 못했습니다 (이전 명단 유지): {e}")
+                    continue
+                print(f"🔁 {time.strftime('%H:%M:%S')} 명단 다시 읽음 ({seconds * 1000:.0f} ms, "
+                      f"캐시 {len(self.fragments)}개 유지)")
+        finally:
+            watcher.close()
+
+
+class SeatingRequestHandler(BaseHTTPRequestHandler):
+    """/, /class/<반>, 사진 파일, /__stats 처리 (GET / HEAD)"""
+
+    server_version = 'SeatingServer'
+    protocol_version = 'HTTP/1.1'
+
+    def __init__(self, *args, app, **kwargs):
+        self.app = app
+        super().__init__(*args, **kwargs)
+
+    def do_GET(self):
+        self._head_only = False
+        self._route()
+
+    def do_HEAD(self):
+        self._head_only = True  # 한 연결로 여러 요청이 오므로 요청마다 정함
+        self._route()
+
+    def _route(self):
+        path = unquote(self.path.split('?', 1)[0])
+        if path in ('/', '/index.html'):
+            snapshot = self.app.snapshot
+            self._send_bytes(snapshot.shell, 'text/html; charset=utf-8', snapshot.shell_etag)
+        elif path.startswith('/class/'):
+            result = self.app.fragment(path[len('/class/'):])
+            if result is None:
+                self.send_error(404)
+                return
+            fragment, packed, etag = result
+            self._send_bytes(fragment, 'text/html; charset=utf-8', etag, packed)
+        elif path == '/__stats':
+            body = json.dumps(self.app.stats(), ensure_ascii=False).encode('utf-8')
+            self._send_bytes(body, 'application/json', None)
+        else:
+            self._send_photo(self.app.snapshot.photos.get(path))
+
+    def _not_modified(self, etag, mtime=None):
+        """조건부 GET: If-None-Match가 있으면 ETag로, 없으면 If-Modified-Since로 판단"""
+        if_none_match = self.headers.get('If-None-Match')
+        if if_none_match is not None:
+            return etag is not None and (if_none_match.strip() == '*' or etag in
+                                         [tag.strip() for tag in if_none_match.split(',')])
+        if_modified_since = self.headers.get('If-Modified-Since')
+        if if_modified_since and mtime is not None:
+            try:
+                since = email.utils.parsedate_to_datetime(if_modified_since).timestamp()
+            except (TypeError, ValueError):
+                return False
+            return int(mtime) <= since
+        return False
+
+    def _send_not_modified(self, etag, cache_control, vary=False):
+        self.send_response(304)
+        self.send_header('ETag', etag)
+        self.send_header('Cache-Control', cache_control)
+        if vary:
+            self.send_header('Vary', 'Accept-Encoding')
+        self.end_headers()
+
+    def _send_bytes(self, body, content_type, etag, packed=None):
+        # gzip 본문은 다른 바이트이므로 ETag도 따로 (강한 ETag는 본문마다 달라야 함)
+        gzipped = packed is not None and 'gzip' in self.headers.get('Accept-Encoding', '')
+        if gzipped:
+            body = packed
+            if etag is not None:
+                etag = etag[:-1] + '-gz"'
+        if etag is not None and self._not_modified(etag):
+            self._send_not_modified(etag, REVALIDATE, packed is not None)
+            return
+        self.send_response(200)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Cache-Control', REVALIDATE)
+        if etag is not None:
+            self.send_header('ETag', etag)
+        if packed is not None:
+            self.send_header('Vary', 'Accept-Encoding')
+        if gzipped:
+            self.send_header('Content-Encoding', 'gzip')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        if not self._head_only:
+            self.wfile.write(body)
+
+    def _send_photo(self, path):
+        # 명단의 자리표가 가리키는 사진 / 썸네일만 보냄 (CSV 등 다른 파일은 보내지 않음)
+        if path is None:
+            self.send_error(404)
+            return
+        try:
+            f = open(path, 'rb')
+        except OSError:
+            self.send_error(404)
+            return
+        with f:
+            stat = os.fstat(f.fileno())
+            etag, cache_control = file_cache_headers(path, stat)
+            if self._not_modified(etag, stat.st_mtime):
+                self._send_not_modified(etag, cache_control)
+                return
+            self.send_response(200)
+            self.send_header('Content-Type', content_type(path))
+            self.send_header('Content-Length', str(stat.st_size))
+            self.send_header('ETag', etag)
+            self.send_header('Last-Modified', email.utils.formatdate(stat.st_mtime, usegmt=True))
+            self.send_header('Cache-Control', cache_control)
+            self.end_headers()
+            if not self._head_only:
+                shutil.copyfileobj(f, self.wfile)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def make_server(app, port=DEFAULT_PORT, bind='127.0.0.1'):
+    """요청마다 스레드로 처리하는 HTTP 서버 (serve_forever()로 시작)"""
+    server = ThreadingHTTPServer((bind, port), lambda *args: SeatingRequestHandler(*args, app=app))
+    server.daemon_threads = True
+    return server
+
+
+def main(argv=None):
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="자리표 서버 (클래스 탭을 요청받을 때 생성)")
+    parser.add_argument('--csv', default=DEFAULT_CSV, help=f'학생 데이터 CSV (기본값: {DEFAULT_CSV})')
+    parser.add_argument('--image-root', default=IMAGE_ROOT,
+                        help=f'class_N 사진 폴더가 있는 곳 (기본값: {IMAGE_ROOT})')
+    parser.add_argument('--extra-image-root', action='append', metavar='DIR',
+                        help=f"사진을 더 찾아볼 폴더, 여러 번 줄 수 있음 (기본값: {', '.join(EXTRA_IMAGE_ROOTS)})")
+    parser.add_argument('--port', '-p', type=int, default=DEFAULT_PORT, help=f'포트 (기본값: {DEFAULT_PORT})')
+    parser.add_argument('--bind', default='127.0.0.1', help='받을 주소 (기본값: 127.0.0.1)')
+    parser.add_argument('--cache-size', type=int, default=CACHE_SIZE,
+                        help=f'메모리에 보관할 탭 조각 수 (기본값: {CACHE_SIZE})')
+    parser.add_argument('--thumbnails', action='store_true',
+                        help='원본 사진 대신 작은 썸네일을 만들어 사용 (Pillow 필요)')
+    parser.add_argument('--thumbnail-dir', default='thumbnails', help='썸네일 캐시 폴더 (기본값: thumbnails)')
+    parser.add_argument('--cache-dir', default=DEFAULT_CACHE_DIR,
+                        help=f'데이터 캐시 폴더 (기본값: {DEFAULT_CACHE_DIR})')
+    parser.add_argument('--no-watch', dest='watch', action='store_false',
+                        help='CSV / 사진 폴더가 바뀌어도 다시 읽지 않기')
+    args = parser.parse_args(argv)
+
+    thumbnails = None
+    if args.thumbnails:
+        from thumbnails import ThumbnailCache
+        thumbnails = ThumbnailCache(args.thumbnail_dir)
+    extra_roots = args.extra_image_root if args.extra_image_root is not None else list(EXTRA_IMAGE_ROOTS)
+    try:
+        app = SeatingServer(args.csv, [args.image_root, *extra_roots], thumbnails, args.cache_size, args.cache_dir)
+    except FileNotFoundError:
+        print(f"❌ {args.csv} 파일을 찾을 수 없습니다.")
+        return 1
+    snapshot = app.snapshot
+    print(f"✅ 명단 로드 완료: {snapshot.students}명, 클래스 {len(snapshot.classes)}개")
+
+    server = make_server(app, args.port, args.bind)
+    if args.watch:
+        threading.Thread(target=app.watch, daemon=True).start()
+    host, port = server.server_address[:2]
+    print(f"🌐 http://{host}:{port}/ 에서 볼 수 있습니다 (/#<반>으로 바로 열기) - Ctrl+C로 종료")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        stats = app.stats()
+        print(f"\n👋 서버를 마칩니다 (조각 생성 {stats['misses']}번, 캐시 사용 {stats['hits']}번)")
+    finally:
+        server.server_close()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
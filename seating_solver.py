@@ -0,0 +1,295 @@
+"""자리 배치 도우미: 조건에 맞는 새 자리(행, 열) 배치 만들기
+
+클래스마다 지금 학생들이 앉아 있는 자리 위치는 그대로 두고, 학생과 자리의 짝을 새로 정한다.
+조건은 세 가지이다.
+  - 행마다 평균 점수가 비슷하도록 (점수 없는 학생은 클래스 평균으로 계산)
+  - 떨어뜨려야 할 두 학생이 붙어 앉지 않도록 (앞뒤/옆/대각선)
+  - 도움이 필요한 학생은 앞쪽 행(1행이 맨 앞)에 앉도록
+두 학생의 자리를 바꾸는 담금질 기법(simulated annealing)으로 찾으며, 한 번에 여러 개의
+자리 바꾸기 후보를 NumPy 배열로 만들어 비용을 함께 계산한다. 클래스는 프로세스 풀에서
+나눠 푼다. 결과는 새 CSV와 기존 자리표 생성기(create_combined_seating_chart_html)로 만든
+HTML로 저장한다.
+
+조건 파일(JSON) 예:
+    {"apart": [["30102", "30105"]], "front": ["30110"], "front_rows": 2}
+
+사용법:
+    python seating_solver.py
+    python seating_solver.py --constraints seating_constraints.json --seed 3 --jobs 4
+"""
+import argparse
+import csv
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from student_data import DEFAULT_CSV, load_students
+
+DEFAULT_CONSTRAINTS = 'seating_constraints.json'
+DEFAULT_OUTPUT = 'new_seating_chart.html'
+DEFAULT_CSV_OUTPUT = 'new_seating.csv'
+
+# 비용 가중치
+BALANCE_WEIGHT = 1.0   # 행별 평균 점수 차이 (점수를 표준화한 뒤의 분산)
+APART_WEIGHT = 10.0    # 붙어 앉은 '떨어뜨릴 짝' 하나
+FRONT_WEIGHT = 3.0     # 도움이 필요한 학생이 앞쪽 행보다 뒤로 간 행 수
+
+BATCH_SIZE = 32        # 한 번에 비용을 계산할 자리 바꾸기 후보 수
+STEPS = 1500           # 담금질 단계 수
+
+
+class SeatingProblem:
+    """한 클래스의 자리 배치 문제
+
+    학생 i가 앉는 자리는 seat_of[i] (자리 번호 0..n-1)로 나타내며, 자리 번호 j의 위치는
+    (seat_rows[j], seat_cols[j])이다. 처음 배치(현재 자리)는 seat_of = [0, 1, ..., n-1]이다.
+    """
+
+    def __init__(self, class_num, student_ids, scores, seat_rows, seat_cols, apart=(), front=(), front_rows=2):
+        self.class_num = class_num
+        self.n = len(student_ids)
+        self.seat_rows = np.asarray(seat_rows, dtype=np.int64)
+        self.seat_cols = np.asarray(seat_cols, dtype=np.int64)
+        self.front_rows = front_rows
+
+        # 점수 표준화 (점수 없는 학생은 평균 = 0)
+        scores = np.asarray(scores, dtype=np.float64)
+        self.raw_scores = scores
+        known = ~np.isnan(scores)
+        mean = scores[known].mean() if known.any() else 0.0
+        std = scores[known].std() if known.sum() > 1 else 0.0
+        self.scores = np.where(known, (scores - mean) / (std or 1.0), 0.0)
+
+        # 자리 행 → 0..R-1 번호, 행마다 자리 수
+        _, self.seat_row_ids = np.unique(self.seat_rows, return_inverse=True)
+        self.row_counts = np.bincount(self.seat_row_ids).astype(np.float64)
+
+        index = {student_id: i for i, student_id in enumerate(student_ids)}
+        self.pairs = np.array([(index[a], index[b]) for a, b in apart if a in index and b in index],
+                              dtype=np.int64).reshape(-1, 2)
+        self.front = np.zeros(self.n)
+        for student_id in front:
+            if student_id in index:
+                self.front[index[student_id]] = 1.0
+
+    def cost_parts(self, seat_of):
+        """배치 여러 개(B×n 배열)의 (행 균형, 붙어 앉은 짝 수, 앞쪽에서 밀려난 행 수)를 한꺼번에 계산"""
+        seat_of = np.atleast_2d(seat_of)
+        batch = seat_of.shape[0]
+        rows = self.seat_rows[seat_of]
+        cols = self.seat_cols[seat_of]
+
+        # 행별 점수 합 → 평균의 (자리 수로 가중한) 분산
+        n_rows = len(self.row_counts)
+        offsets = self.seat_row_ids[seat_of] + (np.arange(batch) * n_rows)[:, None]
+        sums = np.bincount(offsets.ravel(), weights=np.broadcast_to(self.scores, seat_of.shape).ravel(),
+                           minlength=batch * n_rows).reshape(batch, n_rows)
+        balance = (sums ** 2 / self.row_counts).sum(axis=1) / self.n
+
+        if len(self.pairs):
+            a, b = self.pairs[:, 0], self.pairs[:, 1]
+            near = (np.abs(rows[:, a] - rows[:, b]) <= 1) & (np.abs(cols[:, a] - cols[:, b]) <= 1)
+            apart = near.sum(axis=1)
+        else:
+            apart = np.zeros(batch)
+
+        behind = np.maximum(rows - self.front_rows, 0) @ self.front
+        return balance, apart, behind
+
+    def cost(self, seat_of):
+        balance, apart, behind = self.cost_parts(seat_of)
+        return BALANCE_WEIGHT * balance + APART_WEIGHT * apart + FRONT_WEIGHT * behind
+
+    def describe(self, seat_of):
+        """사람이 읽을 요약: 행 평균 점수 차이(최고-최저), 붙어 앉은 짝 수, 앞쪽에서 밀려난 학생 수"""
+        seat_of = np.asarray(seat_of)
+        rows = self.seat_rows[seat_of]
+        known = ~np.isnan(self.raw_scores)
+        row_means = [self.raw_scores[known & (rows == row)].mean()
+                     for row in np.unique(rows) if (known & (rows == row)).any()]
+        spread = float(max(row_means) - min(row_means)) if row_means else 0.0
+        _, apart, _ = self.cost_parts(seat_of)
+        behind = int(((rows > self.front_rows) & (self.front > 0)).sum())
+        return spread, int(apart[0]), behind
+
+
+def anneal(problem, steps=STEPS, seed=0, batch_size=BATCH_SIZE):
+    """담금질 기법으로 좋은 배치(seat_of) 찾기
+
+    단계마다 자리 바꾸기 후보 batch_size개의 비용을 한꺼번에 계산하고, 받아들일 수 있는
+    후보(비용이 줄거나 온도에 따른 확률을 통과한 것) 중 가장 좋은 것으로 옮긴다.
+    """
+    n = problem.n
+    seat_of = np.arange(n)
+    if n < 2:
+        return seat_of
+    rng = np.random.default_rng(seed)
+    current = problem.cost(seat_of)[0]
+    best, best_cost = seat_of.copy(), current
+
+    # 처음 온도: 무작위 자리 바꾸기 한 번이 바꾸는 비용의 크기
+    probe = np.tile(seat_of, (batch_size, 1))
+    first, second = rng.integers(n, size=(2, batch_size))
+    probe[np.arange(batch_size), first], probe[np.arange(batch_size), second] = second, first
+    temperature = max(float(np.abs(problem.cost(probe) - current).mean()), 1e-3)
+    cooling = (1e-3) ** (1.0 / steps)
+
+    candidates = np.empty((batch_size, n), dtype=seat_of.dtype)
+    batch_index = np.arange(batch_size)
+    for _ in range(steps):
+        first, second = rng.integers(n, size=(2, batch_size))
+        candidates[:] = seat_of
+        candidates[batch_index, first] = seat_of[second]
+        candidates[batch_index, second] = seat_of[first]
+        delta = problem.cost(candidates) - current
+
+        accept = (delta <= 0) | (rng.random(batch_size) < np.exp(-np.maximum(delta, 0) / temperature))
+        if accept.any():
+            choice = np.argmin(np.where(accept, delta, np.inf))
+            seat_of = candidates[choice].copy()
+            current += delta[choice]
+            if current < best_cost - 1e-12:
+                best, best_cost = seat_of.copy(), current
+        temperature *= cooling
+    return best
+
+
+def solve_class(task):
+    """클래스 하나 풀기 (작업 프로세스에서도 실행됨) → (클래스, seat_of, 걸린 시간)"""
+    problem, steps, seed = task
+    start = time.perf_counter()
+    seat_of = anneal(problem, steps=steps, seed=seed)
+    return problem.class_num, seat_of, time.perf_counter() - start
+
+
+def load_constraints(path=DEFAULT_CONSTRAINTS):
+    """조건 파일 읽기 (없으면 빈 조건)"""
+    constraints = {'apart': [], 'front': [], 'front_rows': 2}
+    if path and os.path.exists(path):
+        with open(path, encoding='utf-8') as f:
+            constraints.update(json.load(f))
+    constraints['apart'] = [(str(a), str(b)) for a, b in constraints['apart']]
+    constraints['front'] = [str(student_id) for student_id in constraints['front']]
+    return constraints
+
+
+def _student_columns(data):
+    """DataFrame / 행(dict) 목록에서 (클래스, 학번, 점수, 행, 열) 열 꺼내기"""
+    if isinstance(data, list):
+        return ([record['클래스'] for record in data],
+                [str(record['학번']) for record in data],
+                np.array([np.nan if record['점수'] is None else record['점수'] for record in data], dtype=np.float64),
+                np.array([record['행'] for record in data], dtype=np.int64),
+                np.array([record['열'] for record in data], dtype=np.int64))
+    return (data['클래스'].tolist(),
+            data['학번'].astype(str).tolist(),
+            data['점수'].to_numpy(dtype=np.float64, na_value=np.nan),
+            data['행'].to_numpy(dtype=np.int64),
+            data['열'].to_numpy(dtype=np.int64))
+
+
+def build_problems(data, constraints):
+    """클래스별 (클래스, 데이터 안의 학생 위치 배열, SeatingProblem) 목록"""
+    classes, student_ids, scores, rows, cols = _student_columns(data)
+    groups = {}
+    for i, class_num in enumerate(classes):
+        if class_num == class_num:  # NaN 클래스 제외
+            groups.setdefault(class_num, []).append(i)
+
+    problems = []
+    for class_num, positions in sorted(groups.items()):
+        positions = np.array(positions)
+        problem = SeatingProblem(class_num, [student_ids[i] for i in positions], scores[positions],
+                                 rows[positions], cols[positions], constraints['apart'],
+                                 constraints['front'], constraints['front_rows'])
+        problems.append((class_num, positions, problem))
+    return problems, rows, cols
+
+
+def solve_seating(data, constraints, steps=STEPS, seed=0, jobs=1):
+    """모든 클래스의 새 배치를 구함
+
+    (새 행 배열, 새 열 배열, 클래스별 보고 목록)을 반환하며 배열 순서는 data의 행 순서와 같다.
+    보고는 (클래스, 이전 요약, 새 요약, 걸린 시간)이고 요약은 SeatingProblem.describe()의 값이다.
+    """
+    problems, rows, cols = build_problems(data, constraints)
+    tasks = [(problem, steps, seed + i) for i, (_, _, problem) in enumerate(problems)]
+    if jobs > 1 and len(tasks) > 1:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            results = list(pool.map(solve_class, tasks))
+    else:
+        results = [solve_class(task) for task in tasks]
+
+    new_rows, new_cols = rows.copy(), cols.copy()
+    reports = []
+    for (class_num, positions, problem), (_, seat_of, seconds) in zip(problems, results):
+        new_rows[positions] = problem.seat_rows[seat_of]
+        new_cols[positions] = problem.seat_cols[seat_of]
+        reports.append((class_num, problem.describe(np.arange(problem.n)), problem.describe(seat_of), seconds))
+    return new_rows, new_cols, reports
+
+
+def apply_seating(data, new_rows, new_cols):
+    """새 행/열을 넣은 데이터 사본 (data와 같은 형태)"""
+    if isinstance(data, list):
+        return [dict(record, 행=int(row), 열=int(col)) for record, row, col in zip(data, new_rows, new_cols)]
+    data = data.copy()
+    data['행'] = new_rows.astype(data['행'].dtype)
+    data['열'] = new_cols.astype(data['열'].dtype)
+    return data
+
+
+def write_seating_csv(src_csv, dest_csv, new_rows, new_cols):
+    """원본 CSV의 행/열 값만 바꿔 새 CSV로 저장 (나머지 값과 형식은 그대로)"""
+    with open(src_csv, encoding='utf-8-sig', newline='') as f:
+        reader = csv.reader(f)
+        header = next(reader)
+        records = list(reader)
+    row_index, col_index = header.index('행'), header.index('열')
+    for record, row, col in zip(records, new_rows, new_cols):
+        record[row_index] = str(row)
+        record[col_index] = str(col)
+    with open(dest_csv, 'w', encoding='utf-8-sig', newline='') as f:
+        writer = csv.writer(f, lineterminator='\n')  # 원본 CSV와 같은 LF 줄바꿈 (비교할 때 모든 줄이 바뀌지 않도록)
+        writer.writerow(header)
+        writer.writerows(records)
+
+
+def main(argv=None):
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="조건에 맞는 새 자리 배치 만들기")
+    parser.add_argument('--csv', default=DEFAULT_CSV, help=f'학생 데이터 (기본값: {DEFAULT_CSV})')
+    parser.add_argument('--constraints', default=DEFAULT_CONSTRAINTS,
+                        help=f'조건 파일 JSON (기본값: {DEFAULT_CONSTRAINTS}, 없으면 행 균형만 맞춤)')
+    parser.add_argument('--csv-output', default=DEFAULT_CSV_OUTPUT, help=f'새 배치 CSV (기본값: {DEFAULT_CSV_OUTPUT})')
+    parser.add_argument('--output', default=DEFAULT_OUTPUT, help=f'새 배치 자리표 HTML (기본값: {DEFAULT_OUTPUT})')
+    parser.add_argument('--steps', type=int, default=STEPS, help=f'담금질 단계 수 (기본값: {STEPS})')
+    parser.add_argument('--seed', type=int, default=0, help='난수 시드 (같은 시드면 같은 배치)')
+    parser.add_argument('--jobs', '-j', type=int, default=1, help='클래스를 나눠 풀 프로세스 수 (기본값: 1)')
+    args = parser.parse_args(argv)
+
+    data = load_students(args.csv)
+    constraints = load_constraints(args.constraints)
+    print(f"✅ 데이터 로드 완료: {len(data)}명, 떨어뜨릴 짝 {len(constraints['apart'])}쌍, "
+          f"앞자리 학생 {len(constraints['front'])}명")
+
+    start = time.perf_counter()
+    new_rows, new_cols, reports = solve_seating(data, constraints, args.steps, args.seed, args.jobs)
+    print(f"🧩 자리 배치 완료 ({(time.perf_counter() - start) * 1000:.0f} ms)")
+    for class_num, before, after, seconds in reports:
+        print(f"   - {class_num}반: 행 평균 차이 {before[0]:.1f} → {after[0]:.1f}점, "
+              f"붙어 앉은 짝 {before[1]} → {after[1]}, 앞자리 밖 {before[2]} → {after[2]}명 ({seconds * 1000:.0f} ms)")
+
+    write_seating_csv(args.csv, args.csv_output, new_rows, new_cols)
+    print(f"✅ {args.csv_output} 저장 완료")
+
+    from create_combined_seating_html import PhotoIndex, create_combined_seating_chart_html
+    create_combined_seating_chart_html(apply_seating(data, new_rows, new_cols), args.output,
+                                       photo_index=PhotoIndex())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,998 @@
+"""자리표 HTML 틀
+
+정적인 부분(스타일, 비밀번호 화면, 모달, 스크립트)은 불러올 때 한 번만 UTF-8로 인코딩해 두고,
+자리/탭처럼 반복되는 부분은 SlotTemplate으로 미리 해석해 두어 값만 채워 넣는다.
+"""
+import re
+
+
+class SlotTemplate:
+    """{{이름}} 자리를 가진 HTML 틀
+
+    만들 때 한 번만 해석해서 f-string 하나로 된 함수로 컴파일해 두고, fill()은 자리가
+    나오는 순서대로 값을 받아 채운다.
+    """
+
+    _SLOT = re.compile(r'\{\{(\w+)\}\}')
+
+    def __init__(self, text):
+        parts = self._SLOT.split(text)
+        self.slots = tuple(parts[1::2])
+        self.fill = self._compile(parts[0::2], len(self.slots))
+
+    @staticmethod
+    def _compile(literals, n_slots):
+        args = [f"v{i}" for i in range(n_slots)]
+        pieces = []
+        for i, literal in enumerate(literals):
+            if literal:
+                pieces.append('f' + repr(literal.replace('{', '{{').replace('}', '}}')))
+            if i < n_slots:
+                pieces.append(f"f'{{{args[i]}}}'")
+        source = f"lambda {', '.join(args)}: {' '.join(pieces) or repr('')}"
+        return eval(compile(source, '<SlotTemplate>', 'eval'))
+
+
+# HTML 시작 부분 (스타일, 비밀번호 화면, 탭 버튼 영역 시작)
+HTML_HEAD = """
+<!DOCTYPE html>
+<html lang="ko">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>전체 클래스 자리표</title>
+    <style>
+        body {
+            font-family: 'Malgun Gothic', Arial, sans-serif;
+            margin: 0;
+            padding: 20px;
+            background-color: #f5f5f5;
+        }
+        
+        .header {
+            text-align: center;
+            margin-bottom: 0;
+            background: white;
+            padding: 15px 20px 10px 20px;
+            border-radius: 10px 10px 0 0;
+            box-shadow: 0 2px 10px rgba(0,0,0,0.1);
+        }
+        
+        .header h1 {
+            color: #2c3e50;
+            margin: 0;
+            font-size: 1.8em;
+        }
+        
+        /* 탭 스타일 */
+        .tab-container {
+            background: white;
+            border-radius: 0 0 10px 10px;
+            box-shadow: 0 2px 10px rgba(0,0,0,0.1);
+            margin-bottom: 20px;
+            overflow: hidden;
+        }
+        
+        .tab-buttons {
+            display: flex;
+            background: #ecf0f1;
+        }
+        
+        .tab-button {
+            flex: 1;
+            padding: 15px 20px;
+            background: #ecf0f1;
+            border: none;
+            cursor: pointer;
+            font-size: 1.1em;
+            font-weight: bold;
+            color: #7f8c8d;
+            transition: all 0.3s ease;
+        }
+        
+        .tab-button:hover {
+            background: #d5dbdb;
+        }
+        
+        .tab-button.active {
+            background: #3498db;
+            color: white;
+        }
+        
+        .tab-content {
+            display: none;
+            padding: 20px;
+        }
+        
+        .tab-content.active {
+            display: block;
+        }
+        
+        .seating-container {
+            display: flex;
+            justify-content: center;
+            margin-bottom: 30px;
+        }
+        
+        .seating-table {
+            border-collapse: separate;
+            border-spacing: 10px;
+            background: white;
+            padding: 20px;
+            border-radius: 15px;
+            box-shadow: 0 4px 15px rgba(0,0,0,0.1);
+        }
+        
+        .seat {
+            width: 120px;
+            height: 110px;
+            border: 2px solid #ddd;
+            border-radius: 8px;
+            text-align: center;
+            vertical-align: top;
+            padding: 5px 5px 2px 5px;
+            background: white;
+            transition: all 0.3s ease;
+            position: relative;
+            cursor: pointer;
+        }
+        
+        .seat:hover {
+            transform: translateY(-3px);
+            box-shadow: 0 6px 20px rgba(0,0,0,0.15);
+        }
+        
+        .seat.excellent {
+            border-color: #27ae60;
+            background: linear-gradient(135deg, #ffffff 0%, #f8fff8 100%);
+        }
+        
+        .seat.good {
+            border-color: #f39c12;
+            background: linear-gradient(135deg, #ffffff 0%, #fffdf8 100%);
+        }
+        
+        .seat.needs {
+            border-color: #e74c3c;
+            background: linear-gradient(135deg, #ffffff 0%, #fff8f8 100%);
+        }
+        
+        .seat.none {
+            border-color: #95a5a6;
+            background: linear-gradient(135deg, #ffffff 0%, #f8f9fa 100%);
+        }
+        
+        .student-photo {
+            width: 50px;
+            height: 50px;
+            border-radius: 12px;
+            object-fit: cover;
+            margin: 2px auto 5px;
+            border: 2px solid #fff;
+            box-shadow: 0 2px 6px rgba(0,0,0,0.2);
+            display: block;
+        }
+        
+        .no-photo {
+            width: 50px;
+            height: 50px;
+            border-radius: 12px;
+            background: #ecf0f1;
+            margin: 2px auto 5px;
+            display: flex;
+            align-items: center;
+            justify-content: center;
+            font-size: 1.2em;
+            color: #bdc3c7;
+        }
+        
+        .student-id {
+            font-size: 0.8em;
+            font-weight: bold;
+            color: #2c3e50;
+            margin-bottom: 3px;
+            line-height: 1.1;
+        }
+        
+        .student-score {
+            font-size: 0.75em;
+            font-weight: bold;
+            padding: 1px 4px;
+            border-radius: 10px;
+            display: inline-block;
+        }
+        
+        .excellent .student-score {
+            background: #27ae60;
+            color: white;
+        }
+        
+        .good .student-score {
+            background: #f39c12;
+            color: white;
+        }
+        
+        .needs .student-score {
+            background: #e74c3c;
+            color: white;
+        }
+        
+        .none .student-score {
+            background: #95a5a6;
+            color: white;
+        }
+        
+        /* 이미지 모달 스타일 */
+        .modal {
+            display: none;
+            position: fixed;
+            z-index: 1000;
+            left: 0;
+            top: 0;
+            width: 100%;
+            height: 100%;
+            background-color: rgba(0,0,0,0.8);
+            animation: fadeIn 0.3s;
+        }
+        
+        .modal-content {
+            position: absolute;
+            top: 50%;
+            left: 50%;
+            transform: translate(-50%, -50%);
+            background: white;
+            padding: 20px;
+            border-radius: 15px;
+            text-align: center;
+            box-shadow: 0 10px 30px rgba(0,0,0,0.3);
+            max-width: 90%;
+            max-height: 90%;
+        }
+        
+        .modal-image {
+            max-width: 300px;
+            max-height: 400px;
+            border-radius: 15px;
+            box-shadow: 0 5px 15px rgba(0,0,0,0.2);
+        }
+        
+        .modal-info {
+            margin-top: 15px;
+            font-size: 1.2em;
+            color: #2c3e50;
+        }
+        
+        .close {
+            position: absolute;
+            top: 10px;
+            right: 15px;
+            font-size: 28px;
+            font-weight: bold;
+            color: #aaa;
+            cursor: pointer;
+        }
+        
+        .close:hover {
+            color: #000;
+        }
+        
+        @keyframes fadeIn {
+            from { opacity: 0; }
+            to { opacity: 1; }
+        }
+        
+        /* 비밀번호 인증 스타일 */
+        .password-overlay {
+            position: fixed;
+            top: 0;
+            left: 0;
+            width: 100%;
+            height: 100%;
+            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+            display: flex;
+            justify-content: center;
+            align-items: center;
+            z-index: 9999;
+        }
+        
+        .password-container {
+            background: white;
+            padding: 40px;
+            border-radius: 20px;
+            box-shadow: 0 20px 40px rgba(0,0,0,0.3);
+            text-align: center;
+            max-width: 400px;
+            width: 90%;
+        }
+        
+        .password-container h2 {
+            color: #2c3e50;
+            margin-bottom: 20px;
+            font-size: 1.5em;
+        }
+        
+        .password-input {
+            width: 100%;
+            padding: 15px;
+            font-size: 1.2em;
+            border: 2px solid #ddd;
+            border-radius: 10px;
+            margin-bottom: 20px;
+            text-align: center;
+            box-sizing: border-box;
+        }
+        
+        .password-input:focus {
+            outline: none;
+            border-color: #3498db;
+        }
+        
+        .password-button {
+            background: #3498db;
+            color: white;
+            border: none;
+            padding: 15px 30px;
+            font-size: 1.1em;
+            border-radius: 10px;
+            cursor: pointer;
+            transition: background 0.3s ease;
+        }
+        
+        .password-button:hover {
+            background: #2980b9;
+        }
+        
+        .password-error {
+            color: #e74c3c;
+            margin-top: 10px;
+            display: none;
+        }
+        
+        .main-content {
+            display: none;
+        }
+        
+        @media print {
+            body { margin: 0; }
+            .password-overlay { display: none !important; }
+            .main-content { display: block !important; }
+            .tab-container { 
+                box-shadow: none;
+                margin-bottom: 0;
+            }
+            .tab-buttons { display: none; }
+            .tab-content { 
+                display: none !important;
+                padding: 0;
+            }
+            .tab-content.active { 
+                display: block !important;
+            }
+            .seating-table { 
+                page-break-inside: avoid;
+                box-shadow: none;
+            }
+            .modal { display: none !important; }
+            .header {
+                box-shadow: none;
+                margin-bottom: 10px;
+            }
+        }
+    </style>
+</head>
+<body>
+    <div class="password-overlay">
+        <div class="password-container">
+            <h2>비밀번호 인증</h2>
+            <input type="password" class="password-input" id="password-input" placeholder="비밀번호를 입력하세요">
+            <button class="password-button" id="password-button">인증</button>
+            <div class="password-error" id="password-error"></div>
+        </div>
+    </div>
+    
+    <div class="main-content">
+        <div class="header">
+            <h1>🏫 전체 클래스 자리표</h1>
+        </div>
+        
+        <div class="tab-container">
+            <div class="tab-buttons">
+"""
+
+# HTML 끝 부분 (이미지 모달, 스크립트)
+HTML_TAIL = """    </div>
+    </div>
+    
+    <!-- 이미지 모달 -->
+    <div id="imageModal" class="modal">
+        <div class="modal-content">
+            <span class="close">&times;</span>
+            <img id="modalImage" class="modal-image" src="" alt="">
+            <div id="modalInfo" class="modal-info"></div>
+        </div>
+    </div>
+    
+    <script>
+        // 탭 전환 함수
+        function showTab(classNum) {
+            // 모든 탭 버튼과 콘텐츠 비활성화
+            document.querySelectorAll('.tab-button').forEach(btn => btn.classList.remove('active'));
+            document.querySelectorAll('.tab-content').forEach(content => content.classList.remove('active'));
+            
+            // 선택된 탭 활성화 (지연 렌더링된 탭은 처음 열 때 자리표 생성)
+            event.target.classList.add('active');
+            const tab = document.getElementById(`class-${classNum}`);
+            hydrateTab(tab);
+            tab.classList.add('active');
+        }
+        
+        // 지연 렌더링된 탭: 자리 데이터(JSON)로 자리표 만들기
+        function hydrateTab(tab) {
+            const data = tab.querySelector('script.seat-data');
+            if (!data) return;
+            const rows = JSON.parse(data.textContent);
+            tab.querySelector('.seating-table').innerHTML = rows
+                .map(row => '<tr>' + row.map(seatHtml).join('') + '</tr>')
+                .join('');
+            data.remove();
+            bindSeats(tab);
+        }
+        
+        function seatHtml(seat) {
+            if (!seat) return '<td class="seat"></td>';
+            const [scoreClass, scoreEmoji, scoreText, label, name, src, full, tile] = seat;
+            let image = '<div class="no-photo">👤</div>';
+            if (tile) {
+                const [col, row] = tile.split(',').map(Number);
+                image = `<div class="student-photo photo-sprite" data-tile="${tile}" title="${name}" style="background-position: -${col * 50}px -${row * 50}px"></div>`;
+            } else if (src) {
+                const fullAttr = full ? ` data-full="${full}"` : '';
+                image = `<img src="${src}"${fullAttr} alt="${name}" class="student-photo" loading="lazy" decoding="async">`;
+            }
+            return `<td class="seat ${scoreClass}">${image}<div class="student-id">${label}</div>` +
+                `<div class="student-score">${scoreEmoji} ${scoreText}</div></td>`;
+        }
+        
+        // 모달 관련 요소들
+        const modal = document.getElementById('imageModal');
+        const modalImage = document.getElementById('modalImage');
+        const modalInfo = document.getElementById('modalInfo');
+        const closeBtn = document.querySelector('.close');
+        
+        // 자리 클릭 시 학생 정보 강조 및 이미지 모달
+        function bindSeats(root) {
+            root.querySelectorAll('.seat:not(:empty)').forEach(seat => {
+                seat.addEventListener('click', function() {
+                    // 기존 강조 제거
+                    document.querySelectorAll('.seat').forEach(s => s.style.transform = '');
+                    
+                    // 클릭된 자리 강조
+                    this.style.transform = 'scale(1.05)';
+                    
+                    // 이미지가 있는 경우 모달 표시
+                    const img = this.querySelector('.student-photo');
+                    if (img) {
+                        if (img.dataset.tile) {
+                            // 한 파일 묶음: 스프라이트에서 잘라서 표시
+                            modalImage.src = spriteTile(img.dataset.tile);
+                            modalImage.alt = img.title;
+                        } else {
+                            modalImage.src = img.dataset.full || img.src;
+                            modalImage.alt = img.alt;
+                        }
+                        
+                        const studentId = this.querySelector('.student-id').textContent;
+                        const studentScore = this.querySelector('.student-score').textContent;
+                        modalInfo.innerHTML = `<strong>${studentId}</strong><br>성적: ${studentScore}`;
+                        
+                        modal.style.display = 'block';
+                    }
+                    
+                    // 3초 후 강조 해제
+                    setTimeout(() => {
+                        this.style.transform = '';
+                    }, 3000);
+                });
+            });
+        }
+        bindSeats(document);
+        
+        // 모달 닫기
+        closeBtn.addEventListener('click', function() {
+            modal.style.display = 'none';
+        });
+        
+        // 모달 배경 클릭 시 닫기
+        modal.addEventListener('click', function(e) {
+            if (e.target === modal) {
+                modal.style.display = 'none';
+            }
+        });
+        
+        // ESC 키로 모달 닫기
+        document.addEventListener('keydown', function(e) {
+            if (e.key === 'Escape') {
+                modal.style.display = 'none';
+            }
+        });
+        
+        // 인쇄 기능
+        function printSeatingChart() {
+            window.print();
+        }
+        
+        // 키보드 단축키 (Ctrl+P)
+        document.addEventListener('keydown', function(e) {
+            if (e.ctrlKey && e.key === 'p') {
+                e.preventDefault();
+                printSeatingChart();
+            }
+        });
+        
+        // 비밀번호 인증
+        const passwordInput = document.getElementById('password-input');
+        const passwordButton = document.getElementById('password-button');
+        const passwordError = document.getElementById('password-error');
+        const mainContent = document.querySelector('.main-content');
+        const passwordOverlay = document.querySelector('.password-overlay');
+        
+        passwordButton.addEventListener('click', function() {
+            const password = passwordInput.value.trim();
+            if (password === '1679') {
+                mainContent.style.display = 'block';
+                passwordOverlay.style.display = 'none';
+            } else {
+                passwordError.style.display = 'block';
+                passwordError.textContent = '잘못된 비밀번호입니다.';
+                passwordInput.value = '';
+                passwordInput.focus();
+            }
+        });
+        
+        // Enter 키로 비밀번호 인증
+        passwordInput.addEventListener('keypress', function(e) {
+            if (e.key === 'Enter') {
+                passwordButton.click();
+            }
+        });
+        
+        // 페이지 로드 시 비밀번호 입력창에 포커스
+        passwordInput.focus();
+    </script>
+</body>
+</html>
+"""
+
+# 정적인 부분은 미리 인코딩 (</style> 앞에는 스프라이트 / 검색 스타일을,
+# 머리글과 탭 사이에는 검색 상자를 끼워 넣을 수 있도록 나눠 둠)
+_STYLE_END = HTML_HEAD.index("    </style>\n")
+_HEAD_END = _STYLE_END + len("    </style>\n")
+_TABS_START = HTML_HEAD.index('        <div class="tab-container">')
+HTML_HEAD_BYTES = HTML_HEAD.encode('utf-8')
+HTML_HEAD_STYLE_BYTES = HTML_HEAD[:_STYLE_END].encode('utf-8')
+HTML_HEAD_STYLE_END_BYTES = HTML_HEAD[_STYLE_END:_HEAD_END].encode('utf-8')
+HTML_HEAD_HEADER_BYTES = HTML_HEAD[_HEAD_END:_TABS_START].encode('utf-8')
+HTML_HEAD_TABS_BYTES = HTML_HEAD[_TABS_START:].encode('utf-8')
+HTML_TAIL_BYTES = HTML_TAIL.encode('utf-8')
+
+# 탭 버튼 / 탭 틀
+TAB_BUTTON = SlotTemplate(
+    '            <button class="tab-button {{active}}" onclick="showTab({{class_num}})">{{label}}반</button>\n')
+TAB_BUTTONS_END_BYTES = b"        </div>\n"
+TAB_OPEN = SlotTemplate("""
+        <div id="class-{{class_num}}" class="tab-content {{active}}">
+            <div class="seating-container">
+                <table class="seating-table">
+""")
+TAB_CLOSE = """                </table>
+            </div>
+        </div>
+"""
+LAZY_TAB_CLOSE = SlotTemplate("""                </table>
+                <script type="application/json" class="seat-data">{{seat_data}}</script>
+            </div>
+        </div>
+""")
+
+# 자리표 행 / 자리 (사진 종류별로 한 번에 채우는 틀)
+ROW_OPEN = "                    <tr>\n"
+ROW_CLOSE = "                    </tr>\n"
+EMPTY_SEAT = '                        <td class="seat"></td>\n'
+_SEAT = """                        <td class="seat {{score_class}}">
+                            %s
+                            <div class="student-id">{{label}}</div>
+                            <div class="student-score">{{score_emoji}} {{score_text}}</div>
+                        </td>
+"""
+SEAT_PHOTO = SlotTemplate(_SEAT % (
+    '<img src="{{src}}"{{full_attr}} alt="{{name}}" class="student-photo" loading="lazy" decoding="async">'))
+SEAT_SPRITE = SlotTemplate(_SEAT % (
+    '<div class="student-photo photo-sprite" data-tile="{{tile}}" title="{{name}}" '
+    'style="background-position: -{{x}}px -{{y}}px"></div>'))
+SEAT_NO_PHOTO = SlotTemplate(_SEAT % '<div class="no-photo">👤</div>')
+FULL_ATTR = SlotTemplate(' data-full="{{full}}"')
+
+# 한 파일 묶음(--bundle)에서 사진 스프라이트를 쓰기 위한 스타일/스크립트
+SPRITE_STYLE = SlotTemplate("""        
+        .photo-sprite {
+            background-image: var(--photo-sprite);
+            background-size: {{width}}px {{height}}px;
+        }
+""")
+
+SPRITE_SCRIPT = SlotTemplate("""    <script>
+        // 학생 사진 스프라이트 (모든 썸네일을 한 장으로 합친 이미지)
+        const PHOTO_SPRITE = "{{data_url}}";
+        const PHOTO_TILE = {{tile}};
+        document.documentElement.style.setProperty('--photo-sprite', `url(${PHOTO_SPRITE})`);
+        const photoSpriteImage = new Image();
+        photoSpriteImage.src = PHOTO_SPRITE;
+        
+        // 스프라이트에서 사진 한 칸을 잘라 이미지 주소로 반환
+        function spriteTile(tile) {
+            const [col, row] = tile.split(',').map(Number);
+            const canvas = document.createElement('canvas');
+            canvas.width = canvas.height = PHOTO_TILE;
+            canvas.getContext('2d').drawImage(photoSpriteImage, col * PHOTO_TILE, row * PHOTO_TILE,
+                PHOTO_TILE, PHOTO_TILE, 0, 0, PHOTO_TILE, PHOTO_TILE);
+            return canvas.toDataURL();
+        }
+    </script>
+""")
+
+# 학생 찾기 상자와 성적 구간 필터
+SEARCH_STYLE_BYTES = """        
+        /* 학생 찾기 / 성적 구간 필터 */
+        .search-bar {
+            display: flex;
+            flex-wrap: wrap;
+            align-items: center;
+            gap: 10px 20px;
+            background: white;
+            padding: 0 20px 15px 20px;
+        }
+        
+        .search-box {
+            position: relative;
+            flex: 1;
+            min-width: 220px;
+        }
+        
+        .search-input {
+            width: 100%;
+            padding: 8px 12px;
+            font-size: 1em;
+            border: 2px solid #ddd;
+            border-radius: 10px;
+            box-sizing: border-box;
+        }
+        
+        .search-input:focus {
+            outline: none;
+            border-color: #3498db;
+        }
+        
+        .search-results {
+            display: none;
+            position: absolute;
+            z-index: 100;
+            left: 0;
+            right: 0;
+            max-height: 320px;
+            overflow-y: auto;
+            background: white;
+            border-radius: 10px;
+            box-shadow: 0 6px 20px rgba(0,0,0,0.15);
+        }
+        
+        .search-result {
+            padding: 8px 12px;
+            cursor: pointer;
+            border-left: 4px solid #95a5a6;
+        }
+        
+        .search-result.excellent { border-left-color: #27ae60; }
+        .search-result.good { border-left-color: #f39c12; }
+        .search-result.needs { border-left-color: #e74c3c; }
+        
+        .search-result:hover, .search-result.selected {
+            background: #ecf0f1;
+        }
+        
+        .search-count {
+            padding: 6px 12px;
+            font-size: 0.85em;
+            color: #7f8c8d;
+        }
+        
+        .band-filter {
+            font-size: 0.9em;
+            color: #2c3e50;
+            cursor: pointer;
+            white-space: nowrap;
+        }
+        
+        .hide-excellent .seat.excellent,
+        .hide-good .seat.good,
+        .hide-needs .seat.needs,
+        .hide-none .seat.none {
+            opacity: 0.15;
+        }
+        
+        .seat.search-hit {
+            outline: 4px solid #3498db;
+            outline-offset: 2px;
+            animation: searchHit 0.6s ease 3;
+        }
+        
+        @keyframes searchHit {
+            50% { outline-color: transparent; }
+        }
+        
+        @media print {
+            .search-bar { display: none; }
+        }
+""".encode('utf-8')
+
+SEARCH_BOX_BYTES = """        <div class="search-bar">
+            <div class="search-box">
+                <input type="search" class="search-input" id="search-input" placeholder="🔍 이름, 학번, 반(예: 3반)으로 찾기" autocomplete="off">
+                <div class="search-results" id="search-results"></div>
+            </div>
+            <div class="band-filters">
+                <label class="band-filter"><input type="checkbox" value="excellent" checked> 🌟 80점 이상</label>
+                <label class="band-filter"><input type="checkbox" value="good" checked> 👍 60점 이상</label>
+                <label class="band-filter"><input type="checkbox" value="needs" checked> 💪 60점 미만</label>
+                <label class="band-filter"><input type="checkbox" value="none" checked> ❓ 점수 없음</label>
+            </div>
+        </div>
+        
+""".encode('utf-8')
+
+# 검색 색인(JSON)과 검색 스크립트 - 탭 내용 뒤, HTML_TAIL 앞에 넣음
+SEARCH_SCRIPT = SlotTemplate("""    <script type="application/json" id="search-index">{{index}}</script>
+    <script>
+        // 학생 찾기: 미리 만든 색인에서 찾고 자리표(DOM)는 훑지 않음
+        // 색인: classes[클래스 위치], keys[학생] = '반 이름 학번', seats[학생 * 4 + k] = 클래스 위치, 성적 구간, 표의 행, 열
+        const SEARCH_INDEX = JSON.parse(document.getElementById('search-index').textContent);
+        const SEARCH_BANDS = ['excellent', 'good', 'needs', 'none'];
+        const SEARCH_LIMIT = 30;
+        const searchKeys = SEARCH_INDEX.keys.map(key => key.toLowerCase());
+        const searchInput = document.getElementById('search-input');
+        const searchResults = document.getElementById('search-results');
+        const hiddenBands = new Set();
+        let searchMatches = [];
+        let searchSelected = 0;
+        let searchHit = null;
+        
+        // 검색어를 띄어쓰기로 나눠 모두 들어 있는 학생 번호 목록 ('3반'처럼 반으로 끝나면 그 반만)
+        function searchStudents(query) {
+            const terms = query.trim().toLowerCase().split(/\s+/).filter(Boolean);
+            const matches = [];
+            if (!terms.length) return matches;
+            const seats = SEARCH_INDEX.seats;
+            for (let i = 0; i < searchKeys.length; i++) {
+                if (hiddenBands.size && hiddenBands.has(SEARCH_BANDS[seats[i * 4 + 1]])) continue;
+                const key = searchKeys[i];
+                let found = true;
+                for (const term of terms) {
+                    if (term.endsWith('반') ? !key.startsWith(term + ' ') : !key.includes(term)) {
+                        found = false;
+                        break;
+                    }
+                }
+                if (found) matches.push(i);
+            }
+            return matches;
+        }
+        
+        function showSearchResults() {
+            searchMatches = searchStudents(searchInput.value);
+            searchSelected = 0;
+            searchResults.replaceChildren();
+            if (!searchInput.value.trim()) {
+                searchResults.style.display = 'none';
+                return;
+            }
+            searchMatches.slice(0, SEARCH_LIMIT).forEach((i, n) => {
+                const item = document.createElement('div');
+                item.className = `search-result ${SEARCH_BANDS[SEARCH_INDEX.seats[i * 4 + 1]]}` + (n === 0 ? ' selected' : '');
+                item.textContent = SEARCH_INDEX.keys[i];
+                item.addEventListener('mousedown', e => {
+                    e.preventDefault();
+                    jumpToSeat(i);
+                });
+                searchResults.appendChild(item);
+            });
+            const count = document.createElement('div');
+            count.className = 'search-count';
+            count.textContent = searchMatches.length > SEARCH_LIMIT
+                ? `${searchMatches.length}명 중 ${SEARCH_LIMIT}명 표시` : `${searchMatches.length}명`;
+            searchResults.appendChild(count);
+            searchResults.style.display = 'block';
+        }
+        
+        // 학생이 있는 탭을 열고 자리를 강조
+        function jumpToSeat(i) {
+            const [classIndex, , tableRow, tableCol] = SEARCH_INDEX.seats.slice(i * 4, i * 4 + 4);
+            document.querySelectorAll('.tab-button.active, .tab-content.active')
+                .forEach(element => element.classList.remove('active'));
+            document.querySelectorAll('.tab-button')[classIndex].classList.add('active');
+            const tab = document.getElementById(`class-${SEARCH_INDEX.classes[classIndex]}`);
+            hydrateTab(tab);
+            tab.classList.add('active');
+            
+            if (searchHit) searchHit.classList.remove('search-hit');
+            searchHit = tab.querySelector('.seating-table').rows[tableRow].cells[tableCol];
+            searchHit.classList.add('search-hit');
+            searchHit.scrollIntoView({block: 'center', behavior: 'smooth'});
+            searchResults.style.display = 'none';
+        }
+        
+        function selectSearchResult(n) {
+            const items = searchResults.querySelectorAll('.search-result');
+            if (!items.length) return;
+            items[searchSelected].classList.remove('selected');
+            searchSelected = (n + items.length) % items.length;
+            items[searchSelected].classList.add('selected');
+            items[searchSelected].scrollIntoView({block: 'nearest'});
+        }
+        
+        searchInput.addEventListener('input', showSearchResults);
+        searchInput.addEventListener('focus', showSearchResults);
+        searchInput.addEventListener('blur', () => searchResults.style.display = 'none');
+        searchInput.addEventListener('keydown', function(e) {
+            if (e.key === 'ArrowDown' || e.key === 'ArrowUp') {
+                e.preventDefault();
+                selectSearchResult(searchSelected + (e.key === 'ArrowDown' ? 1 : -1));
+            } else if (e.key === 'Enter' && searchMatches.length) {
+                jumpToSeat(searchMatches[searchSelected]);
+            } else if (e.key === 'Escape') {
+                searchInput.value = '';
+                showSearchResults();
+            }
+        });
+        
+        // 성적 구간 필터: 끈 구간의 자리는 흐리게 (클래스 하나만 바꾸므로 자리 수와 관계없음)
+        document.querySelectorAll('.band-filter input').forEach(checkbox => {
+            checkbox.addEventListener('change', function() {
+                hiddenBands[this.checked ? 'delete' : 'add'](this.value);
+                document.querySelector('.main-content').classList.toggle(`hide-${this.value}`, !this.checked);
+                if (searchInput.value.trim()) showSearchResults();
+            });
+        });
+    </script>
+""")
+
+# 점수 통계 탭 (--analytics) - 값은 생성할 때 계산해 넣으므로 스크립트가 없음
+STATS_STYLE_BYTES = """        
+        /* 점수 통계 탭 */
+        .stats-table {
+            border-collapse: collapse;
+            margin: 0 auto 30px;
+            font-size: 0.95em;
+        }
+        
+        .stats-table th, .stats-table td {
+            padding: 6px 12px;
+            border-bottom: 1px solid #ecf0f1;
+            text-align: right;
+        }
+        
+        .stats-table th {
+            background: #ecf0f1;
+            color: #2c3e50;
+        }
+        
+        .stats-table td:first-child, .stats-table th:first-child {
+            text-align: left;
+            font-weight: bold;
+        }
+        
+        .band-bar {
+            display: block;
+            border-radius: 4px;
+        }
+        
+        .stats-classes {
+            display: flex;
+            flex-wrap: wrap;
+            justify-content: center;
+            gap: 20px;
+        }
+        
+        .stats-class {
+            background: white;
+            padding: 10px 15px;
+            border-radius: 15px;
+            box-shadow: 0 4px 15px rgba(0,0,0,0.1);
+        }
+        
+        .stats-class h3 {
+            margin: 0 0 5px;
+            color: #2c3e50;
+        }
+        
+        .heatmap text {
+            font-size: 11px;
+            text-anchor: middle;
+            fill: white;
+            font-weight: bold;
+        }
+        
+        .heatmap text.axis {
+            fill: #7f8c8d;
+            font-weight: normal;
+        }
+        
+        .heatmap .mean rect {
+            stroke: #2c3e50;
+            stroke-width: 1;
+        }
+""".encode('utf-8')
+
+STATS_TAB_BUTTON_BYTES = (
+    """            <button class="tab-button" onclick="showTab('stats')">📊 통계</button>\n""".encode('utf-8'))
+STATS_TAB_OPEN_BYTES = """
+        <div id="class-stats" class="tab-content">
+            <table class="stats-table">
+""".encode('utf-8')
+STATS_SUMMARY_OPEN = SlotTemplate("""                <thead>
+                    <tr><th>반</th><th>학생</th><th>점수 있음</th><th>평균</th><th>중앙값</th><th>{{excellent}}</th><th>{{good}}</th><th>{{needs}}</th><th>{{none}}</th><th>성적 구간</th></tr>
+                </thead>
+                <tbody>
+""")
+STATS_SUMMARY_ROW = SlotTemplate(
+    "                    <tr><td>{{class_num}}반</td><td>{{students}}</td><td>{{scored}}</td><td>{{mean}}</td>"
+    "<td>{{median}}</td><td>{{excellent}}</td><td>{{good}}</td><td>{{needs}}</td><td>{{none}}</td>"
+    "<td>{{band_bar}}</td></tr>\n")
+STATS_SUMMARY_CLOSE_BYTES = """                </tbody>
+            </table>
+            <div class="stats-classes">
+""".encode('utf-8')
+STATS_CLASS = SlotTemplate("""                <div class="stats-class">
+                    <h3>{{class_num}}반 자리별 평균 점수 (1행이 맨 앞)</h3>
+                    {{heatmap}}
+                </div>
+""")
+STATS_TAB_CLOSE_BYTES = """            </div>
+        </div>
+""".encode('utf-8')
+
+# 서버 모드(seating_server.py): 탭 자리만 두고 처음 열 때 /class/<반> 조각을 받아 넣음
+SERVER_TAB = SlotTemplate("""
+        <div id="class-{{class_num}}" class="tab-content" data-src="class/{{class_num}}">
+            <div class="seating-container">불러오는 중...</div>
+        </div>
+""")
+SERVER_SCRIPT_BYTES = """    <script>
+        // 서버 모드: 탭을 처음 열 때 자리표 조각을 받아 오고, 주소의 #<반>이 있으면 그 탭부터 보여 줌
+        document.addEventListener('DOMContentLoaded', function () {
+            const hydrateLocal = hydrateTab;
+            hydrateTab = function (tab) {
+                const src = tab.dataset.src;
+                if (!src) return hydrateLocal(tab);
+                delete tab.dataset.src;
+                fetch(src)
+                    .then(response => {
+                        if (!response.ok) throw new Error(response.status);
+                        return response.text();
+                    })
+                    .then(html => {
+                        const template = document.createElement('template');
+                        template.innerHTML = html;
+                        tab.replaceChildren(...template.content.firstElementChild.childNodes);
+                        bindSeats(tab);
+                    })
+                    .catch(error => {
+                        tab.dataset.src = src;  // 다시 열면 다시 받아 옴
+                        tab.querySelector('.seating-container').textContent = `불러오지 못했습니다 (${error.message})`;
+                    });
+            };
+            const wanted = `showTab(${decodeURIComponent(location.hash.slice(1))})`;
+            const buttons = [...document.querySelectorAll('.tab-button')];
+            const first = buttons.find(button => button.getAttribute('onclick') === wanted) || buttons[0];
+            if (first) first.click();
+        });
+    </script>
+""".encode('utf-8')
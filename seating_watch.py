@@ -0,0 +1,383 @@
+"""자리표 변경 감시 모드 (--watch)
+
+학생 데이터 CSV와 사진 폴더를 감시하다가 바뀌면 자리표를 다시 만든다.
+리눅스에서는 inotify로, 그 밖의 환경에서는 수정 시간을 주기적으로 확인해 변경을 알아낸다.
+탭 조각은 메모리에 보관하므로 좌석이 바뀐 클래스의 탭만 다시 만들고,
+결과는 임시 파일에 쓴 뒤 바꿔치기한다.
+--serve를 주면 http.server로 자리표를 보여 주고, 다시 만들 때마다
+서버 전송 이벤트(SSE)로 열린 브라우저를 새로 고친다. 서버는 자리표 페이지, /__events,
+그 페이지가 가리키는 사진/썸네일만 보내고 그 밖의 파일(CSV, 캐시 등)은 404로 답한다.
+"""
+import contextlib
+import ctypes
+import ctypes.util
+import functools
+import html
+import os
+import posixpath
+import select
+import shutil
+import struct
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import unquote
+
+from create_combined_seating_html import FragmentCache, create_combined_seating_chart_html
+from static_assets import PHOTO_PATTERN, content_type
+from student_data import load_students
+
+POLL_INTERVAL = 0.5   # 수정 시간 확인 간격 (초)
+DEBOUNCE = 0.1        # 저장 한 번에 이벤트가 여러 개 오므로 조용해질 때까지 기다리는 시간 (초)
+EVENTS_PATH = '/__events'
+RELOAD_SCRIPT = (
+    f"<script>new EventSource('{EVENTS_PATH}').onmessage = function () {{ location.reload(); }};</script>\n"
+).encode('utf-8')
+
+# inotify 이벤트 (linux/inotify.h)
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_ISDIR = 0x40000000
+WATCH_MASK = IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+EVENT_HEADER = struct.Struct('iIII')  # wd, mask, cookie, len
+
+
+class MemoryFragmentCache(FragmentCache):
+    """탭 조각을 디스크 대신 메모리에 보관하는 FragmentCache (감시 모드용)"""
+
+    def __init__(self):
+        self.cache_dir = None
+        self.rebuilt = []
+        self.reused = []
+        self.stat_count = 0
+        self._manifest = {}
+        self._seen = set()
+        self._fragments = {}
+
+    def _read_fragment(self, class_num):
+        return self._fragments.get(str(class_num))
+
+    def _write_fragment(self, class_num, fragment):
+        self._fragments[str(class_num)] = fragment
+
+    def _remove_fragment(self, class_num):
+        self._fragments.pop(str(class_num), None)
+
+    def save(self):
+        self.prune()
+
+
+def _watched_dirs(photo_index):
+    """감시할 사진 폴더: image/, image/class_N, 추가 사진 폴더"""
+    dirs = [photo_index.image_root, *photo_index.extra_roots]
+    try:
+        with os.scandir(photo_index.image_root) as entries:
+            dirs.extend(f"{photo_index.image_root}/{entry.name}" for entry in entries
+                        if entry.is_dir() and entry.name.startswith('class_'))
+    except FileNotFoundError:
+        pass
+    return [path for path in dirs if os.path.isdir(path)]
+
+
+class InotifyWatcher:
+    """inotify로 CSV 파일과 사진 폴더의 변경을 기다림 (리눅스 전용)"""
+
+    def __init__(self, csv_path, photo_index):
+        libc = ctypes.CDLL(ctypes.util.find_library('c'), use_errno=True)
+        if not hasattr(libc, 'inotify_init1'):
+            raise OSError("inotify를 사용할 수 없습니다")
+        self._libc = libc
+        self._fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 실패")
+        self.photo_index = photo_index
+        self.csv_dir = os.path.dirname(os.path.abspath(csv_path))
+        self.csv_name = os.path.basename(csv_path)
+        self._dirs = {}  # 감시 번호(wd) -> 폴더 경로
+        self._image_dirs = set()
+        self._add_watch(self.csv_dir)
+        for path in _watched_dirs(photo_index):
+            self._add_watch(os.path.abspath(path), image_dir=True)
+
+    def _add_watch(self, path, image_dir=False):
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(path), WATCH_MASK)
+        if wd >= 0:
+            self._dirs[wd] = path
+            if image_dir:
+                self._image_dirs.add(path)
+
+    def _read_events(self):
+        """쌓인 이벤트를 모두 읽어 (폴더, 이름, 마스크) 목록으로 반환"""
+        events = []
+        while True:
+            try:
+                data = os.read(self._fd, 64 * 1024)
+            except BlockingIOError:
+                return events
+            offset = 0
+            while offset < len(data):
+                wd, mask, _, length = EVENT_HEADER.unpack_from(data, offset)
+                offset += EVENT_HEADER.size
+                name = os.fsdecode(data[offset:offset + length].rstrip(b'\0'))
+                offset += length
+                if wd in self._dirs:
+                    events.append((self._dirs[wd], name, mask))
+
+    def _is_relevant(self, directory, name, mask):
+        if directory == self.csv_dir and name == self.csv_name:
+            return True
+        if directory not in self._image_dirs:
+            return False  # CSV 폴더의 다른 파일 (출력 HTML, 캐시 등)
+        # 새로 생긴 class_N 폴더도 감시
+        if mask & IN_ISDIR and mask & (IN_CREATE | IN_MOVED_TO) and name.startswith('class_'):
+            self._add_watch(os.path.join(directory, name), image_dir=True)
+        return not name.startswith('.') and not name.endswith('.tmp')
+
+    def wait(self):
+        """관련 있는 변경이 생길 때까지 기다렸다가 조용해지면 반환"""
+        changed = False
+        while True:
+            ready, _, _ = select.select([self._fd], [], [], DEBOUNCE if changed else None)
+            if not ready:
+                return
+            for directory, name, mask in self._read_events():
+                if self._is_relevant(directory, name, mask):
+                    changed = True
+
+    def close(self):
+        os.close(self._fd)
+
+
+class PollingWatcher:
+    """수정 시간/크기를 주기적으로 비교해 변경을 기다림 (inotify가 없을 때)"""
+
+    def __init__(self, csv_path, photo_index, interval=POLL_INTERVAL):
+        self.csv_path = csv_path
+        self.photo_index = photo_index
+        self.interval = interval
+        self._snapshot = self._take_snapshot()
+
+    def _take_snapshot(self):
+        snapshot = {}
+        for path in (self.csv_path, *_watched_dirs(self.photo_index)):
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                continue
+            snapshot[path] = (stat.st_mtime_ns, stat.st_size)
+            if os.path.isdir(path):
+                with os.scandir(path) as entries:
+                    for entry in entries:
+                        if entry.is_file():
+                            entry_stat = entry.stat()
+                            snapshot[entry.path] = (entry_stat.st_mtime_ns, entry_stat.st_size)
+        return snapshot
+
+    def wait(self):
+        while True:
+            time.sleep(self.interval)
+            snapshot = self._take_snapshot()
+            if snapshot != self._snapshot:
+                self._snapshot = snapshot
+                return
+
+    def close(self):
+        pass
+
+
+def make_watcher(csv_path, photo_index):
+    """inotify 감시기를 만들고, 사용할 수 없으면 주기 확인 감시기로 대신함"""
+    try:
+        return InotifyWatcher(csv_path, photo_index)
+    except (OSError, AttributeError, TypeError):
+        return PollingWatcher(csv_path, photo_index)
+
+
+class ReloadNotifier:
+    """다시 만들 때마다 판 번호를 올리고 기다리는 SSE 연결을 깨움"""
+
+    def __init__(self):
+        self.version = 0
+        self._condition = threading.Condition()
+
+    def notify(self):
+        with self._condition:
+            self.version += 1
+            self._condition.notify_all()
+
+    def wait(self, version, timeout):
+        """판 번호가 version에서 바뀌거나 timeout이 지나면 현재 판 번호 반환"""
+        with self._condition:
+            self._condition.wait_for(lambda: self.version != version, timeout)
+            return self.version
+
+
+class LivePage:
+    """감시 모드로 보여 주는 자리표 파일과 그 페이지가 가리키는 사진 목록
+
+    사진 목록은 요청 주소(/로 시작) -> 파일 경로이며, 페이지 파일이 바뀌었을 때만 다시 읽는다.
+    페이지의 사진 주소는 출력 폴더 기준 상대 경로이므로 ../로 시작하는 주소는 브라우저가
+    / 아래로 줄여 요청하는 주소로 바꿔 둔다.
+    """
+
+    def __init__(self, path):
+        self.path = os.path.abspath(path)
+        self.name = os.path.basename(path)
+        self.directory = os.path.dirname(self.path)
+        self._key = None
+        self._photos = {}
+        self._lock = threading.Lock()
+
+    def read(self):
+        with open(self.path, 'rb') as f:
+            return f.read()
+
+    def photo_path(self, url_path):
+        """요청 주소가 페이지에 있는 사진이면 그 파일 경로, 아니면 None"""
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            return None
+        with self._lock:
+            if self._key != (stat.st_mtime_ns, stat.st_size):
+                photos = {}
+                for src in PHOTO_PATTERN.findall(self.read().decode('utf-8', 'replace')):
+                    src = html.unescape(src)
+                    if '://' not in src and not src.startswith(('data:', '/')):
+                        photos[posixpath.normpath('/' + src)] = os.path.normpath(os.path.join(self.directory, src))
+                self._photos = photos
+                self._key = (stat.st_mtime_ns, stat.st_size)
+            return self._photos.get(url_path)
+
+
+class LiveReloadHandler(BaseHTTPRequestHandler):
+    """자리표 페이지에는 새로 고침 스크립트를 넣고, /__events로 SSE를 보내는 처리기
+
+    페이지가 가리키는 사진 말고 다른 파일은 보내지 않는다 (seating_server와 같음).
+    """
+
+    def __init__(self, *args, page, notifier, **kwargs):
+        self.page = page
+        self.notifier = notifier
+        super().__init__(*args, **kwargs)
+
+    def do_GET(self):
+        path = unquote(self.path.split('?', 1)[0])
+        if path == EVENTS_PATH:
+            self._send_events()
+        elif path in ('/', '/' + self.page.name):
+            self._send_page()
+        else:
+            self._send_photo(self.page.photo_path(path))
+
+    def _send_photo(self, path):
+        try:
+            f = open(path, 'rb') if path else None
+        except OSError:
+            f = None
+        if f is None:
+            self.send_error(404)
+            return
+        with f:
+            self.send_response(200)
+            self.send_header('Content-Type', content_type(path))
+            self.send_header('Content-Length', str(os.fstat(f.fileno()).st_size))
+            self.send_header('Cache-Control', 'no-cache')
+            self.end_headers()
+            shutil.copyfileobj(f, self.wfile)
+
+    def _send_page(self):
+        try:
+            body = self.page.read()
+        except FileNotFoundError:
+            self.send_error(404)
+            return
+        end = body.rfind(b'</body>')
+        if end != -1:
+            body = body[:end] + RELOAD_SCRIPT + body[end:]
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('Cache-Control', 'no-cache')
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_events(self):
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/event-stream')
+        self.send_header('Cache-Control', 'no-cache')
+        self.end_headers()
+        version = self.notifier.version
+        try:
+            while True:
+                current = self.notifier.wait(version, timeout=15)
+                # 연결이 끊겼는지 알 수 있도록 변경이 없어도 주석 줄을 보냄
+                self.wfile.write(b'data: reload\n\n' if current != version else b': ping\n\n')
+                self.wfile.flush()
+                version = current
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_live_server(output, port, bind='127.0.0.1'):
+    """자리표 페이지를 보여 주는 서버를 백그라운드 스레드로 시작하고 (서버, 알림기) 반환"""
+    notifier = ReloadNotifier()
+    handler = functools.partial(LiveReloadHandler, page=LivePage(output), notifier=notifier)
+    server = ThreadingHTTPServer((bind, port), handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, notifier
+
+
+def watch(csv_path, output, options, cache_dir=None, serve_port=None):
+    """CSV/사진 폴더가 바뀔 때마다 자리표를 다시 만듦 (Ctrl+C로 종료)
+
+    options는 create_combined_seating_chart_html에 넘긴 것과 같은 옵션이며,
+    fragment_cache가 없으면 메모리 조각 캐시를 쓴다.
+    """
+    options = dict(options)
+    fragment_cache = options.setdefault('fragment_cache', MemoryFragmentCache())
+    photo_index = options['photo_index']
+
+    server = notifier = None
+    if serve_port is not None:
+        server, notifier = start_live_server(output, serve_port)
+        host, port = server.server_address[:2]
+        print(f"🌐 http://{host}:{port}/{os.path.basename(output)} 에서 볼 수 있습니다 (바뀌면 자동 새로 고침)")
+
+    watcher = make_watcher(csv_path, photo_index)
+    method = 'inotify' if isinstance(watcher, InotifyWatcher) else f'{watcher.interval}초마다 확인'
+    print(f"👀 {csv_path}와 사진 폴더 감시 중 ({method}) - Ctrl+C로 종료")
+    try:
+        while True:
+            watcher.wait()
+            start = time.perf_counter()
+            fragment_cache.rebuilt.clear()
+            fragment_cache.reused.clear()
+            try:
+                df = load_students(csv_path, cache_dir=cache_dir)
+                photo_index.refresh()
+                with open(os.devnull, 'w') as quiet, contextlib.redirect_stdout(quiet):
+                    create_combined_seating_chart_html(df, output, **options)
+            except Exception as e:  # 저장 도중의 CSV 등: 이전 자리표를 그대로 둠
+                print(f"⚠️ 다시 만들지 못했습니다 (이전 자리표 유지): {e}")
+                continue
+            elapsed = (time.perf_counter() - start) * 1000
+            changed = [f"{class_num}반" for class_num, _ in fragment_cache.rebuilt]
+            print(f"🔁 {time.strftime('%H:%M:%S')} 다시 생성 ({elapsed:.0f} ms): "
+                  f"{', '.join(changed) if changed else '바뀐 탭 없음'}")
+            if notifier is not None:
+                notifier.notify()
+    except KeyboardInterrupt:
+        print("\n👋 감시를 마칩니다")
+    finally:
+        watcher.close()
+        if server is not None:
+            server.shutdown()
+
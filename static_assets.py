@@ -0,0 +1,219 @@
+"""정적 호스팅용 출력 (--static-assets): 내용 해시 CSS/JS, 미리 압축한 .gz/.br, 캐시 헤더 목록
+
+생성한 HTML 안의 <style>과 <script>(데이터가 아닌 실행 스크립트)를 꺼내 assets/ 폴더에
+seating.<해시>.css / seating.<해시>.js로 쓰고 HTML에는 <link>/<script src defer>만 남긴다.
+이름이 내용으로 정해지므로 브라우저가 기한 없이 캐시해도 되고, 다시 방문할 때는 바뀐 HTML 본문만 받는다.
+검색 색인, 지연 탭의 자리 데이터 같은 <script type="application/json">은 페이지마다 다르므로 HTML에 둔다.
+
+HTML과 CSS/JS 옆에는 gzip(.gz)과 brotli(.br, brotli 패키지가 있을 때만)로 미리 압축한 파일을 두고,
+출력 폴더의 static-manifest.json에 파일마다 ETag, 권장 Cache-Control, 압축본 경로를 적는다.
+    HTML                   no-cache (항상 ETag로 확인, 바뀌지 않았으면 304)
+    CSS/JS, 내용 해시 사진  public, max-age=31536000, immutable
+    그 밖의 사진            no-cache (수정 시간/크기로 만든 약한 ETag)
+출력 폴더 밖에 있거나(../) 없는 사진은 호스팅에서 보낼 수 없으므로 목록에 넣지 않고 skipped에 모은다.
+"""
+import gzip
+import hashlib
+import html
+import importlib.util
+import json
+import mimetypes
+import os
+import re
+
+HAS_BROTLI = importlib.util.find_spec('brotli') is not None
+
+ASSET_DIR = 'assets'
+MANIFEST_NAME = 'static-manifest.json'
+IMMUTABLE = 'public, max-age=31536000, immutable'
+REVALIDATE = 'no-cache'
+
+STYLE_PATTERN = re.compile(r'<style>\n?(.*?)</style>', re.S)
+SCRIPT_PATTERN = re.compile(r'<script>\n?(.*?)</script>', re.S)
+PHOTO_PATTERN = re.compile(r'"([^"<>\\]+?\.(?:jpe?g|png|webp))"', re.I)
+# photo.<해시>.jpg, <해시>_s.webp(썸네일), seating.<해시>.css 처럼 이름에 내용 해시가 있는 파일
+HASHED_NAME_PATTERN = re.compile(r'(?:^|\.)([0-9a-f]{16}(?:_[sm])?)\.\w+$')
+CONTENT_TYPES = {'.html': 'text/html; charset=utf-8', '.css': 'text/css; charset=utf-8',
+                 '.js': 'text/javascript; charset=utf-8'}
+
+
+def content_hash(data):
+    """바이트 내용의 SHA-256 해시 (앞 16자리, thumbnails.file_hash와 같은 길이)"""
+    return hashlib.sha256(data).hexdigest()[:16]
+
+
+def content_type(path):
+    ext = os.path.splitext(path)[1].lower()
+    return CONTENT_TYPES.get(ext) or mimetypes.guess_type(path)[0] or 'application/octet-stream'
+
+
+def file_cache_headers(path, stat):
+    """사진 등 파일의 (ETag, Cache-Control) - 내용을 다시 읽지 않음
+
+    이름에 내용 해시가 있으면 그 해시와 immutable을, 아니면 수정 시간/크기로 만든 약한 ETag와 no-cache를 쓴다.
+    """
+    match = HASHED_NAME_PATTERN.search(os.path.basename(path))
+    if match:
+        return f'"{match.group(1)}"', IMMUTABLE
+    return f'W/"{stat.st_mtime_ns:x}-{stat.st_size:x}"', REVALIDATE
+
+
+def _url(path, start):
+    """start 폴더에서 path로 가는 상대 주소 (/ 구분)"""
+    return os.path.relpath(path, start).replace(os.sep, '/')
+
+
+def _write_bytes(path, data):
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+class StaticExport:
+    """출력 폴더(root)의 HTML을 정적 호스팅용으로 바꾸고 캐시 헤더 목록을 모음
+
+    add_page()로 HTML마다 CSS/JS를 꺼내고 압축본을 쓴 뒤 write_manifest()로 목록을 저장한다.
+    같은 내용의 CSS/JS는 이미 있으면 다시 쓰지 않는다 (written / reused).
+    목록에 넣지 못한 사진은 skipped(경로 -> 이유)에 남는다.
+    """
+
+    def __init__(self, root, asset_dir=ASSET_DIR, brotli_quality=11):
+        self.root = root
+        self.asset_dir = os.path.join(root, asset_dir)
+        self.brotli_quality = brotli_quality
+        self.entries = {}  # root 기준 경로 → 목록 항목
+        self.written = 0
+        self.reused = 0
+        self.original_bytes = 0  # 꺼내기 전 HTML 크기 합계
+        self.skipped = {}  # 목록에 넣지 않은 사진 경로 -> 이유
+
+    def _key(self, path):
+        return _url(path, self.root)
+
+    def _compress(self, path, data):
+        """압축본(.gz, .br)을 쓰고 {인코딩: 항목} 반환"""
+        encodings = {}
+        variants = [('gzip', '.gz', lambda: gzip.compress(data, 9, mtime=0))]
+        if HAS_BROTLI:
+            import brotli
+            variants.append(('br', '.br', lambda: brotli.compress(data, quality=self.brotli_quality)))
+        for encoding, ext, compress in variants:
+            packed = compress()
+            _write_bytes(path + ext, packed)
+            encodings[encoding] = {'path': self._key(path + ext), 'size': len(packed),
+                                   'etag': f'"{content_hash(packed)}"'}
+        return encodings
+
+    def _add_entry(self, path, data, cache_control, encodings=None):
+        entry = {'etag': f'"{content_hash(data)}"', 'size': len(data), 'content_type': content_type(path),
+                 'cache_control': cache_control}
+        if encodings:
+            entry['vary'] = 'Accept-Encoding'
+            entry['encodings'] = encodings
+        self.entries[self._key(path)] = entry
+
+    def _asset(self, text, ext, page_dir):
+        """CSS/JS 내용을 assets/seating.<해시>.<ext>로 쓰고 page_dir에서 가는 주소 반환"""
+        data = text.encode('utf-8')
+        path = os.path.join(self.asset_dir, f"seating.{content_hash(data)}{ext}")
+        if os.path.exists(path) and os.path.exists(path + '.gz'):
+            self.reused += 1
+            encodings = {}
+            for encoding, suffix in (('gzip', '.gz'), ('br', '.br')):
+                if os.path.exists(path + suffix):
+                    with open(path + suffix, 'rb') as f:
+                        packed = f.read()
+                    encodings[encoding] = {'path': self._key(path + suffix), 'size': len(packed),
+                                           'etag': f'"{content_hash(packed)}"'}
+        else:
+            os.makedirs(self.asset_dir, exist_ok=True)
+            _write_bytes(path, data)
+            encodings = self._compress(path, data)
+            self.written += 1
+        self._add_entry(path, data, IMMUTABLE, encodings)
+        return _url(path, page_dir)
+
+    def _add_photo(self, path):
+        try:
+            key = self._key(path)
+        except ValueError:  # 윈도에서 드라이브가 다름
+            key = path
+        if key in self.entries or path in self.skipped:
+            return
+        if key == '..' or key.startswith('../') or os.path.isabs(key):
+            self.skipped[path] = '출력 폴더 밖'
+            return
+        try:
+            stat = os.stat(path)
+        except OSError:
+            self.skipped[path] = '파일 없음'
+            return
+        etag, cache_control = file_cache_headers(path, stat)
+        self.entries[key] = {'etag': etag, 'size': stat.st_size, 'content_type': content_type(path),
+                             'cache_control': cache_control}
+
+    def skipped_summary(self):
+        """목록에 넣지 않은 사진의 이유별 개수 ('출력 폴더 밖 3개, 파일 없음 1개')"""
+        counts = {}
+        for reason in self.skipped.values():
+            counts[reason] = counts.get(reason, 0) + 1
+        return ', '.join(f"{reason} {count}개" for reason, count in counts.items())
+
+    def add_page(self, html_path):
+        """HTML 한 파일: CSS/JS를 꺼내 바꿔 쓰고 압축본을 만든 뒤 HTML 크기(바이트) 반환"""
+        page_dir = os.path.dirname(html_path) or '.'
+        with open(html_path, encoding='utf-8') as f:
+            page = f.read()
+        self.original_bytes += len(page.encode('utf-8'))
+
+        page = STYLE_PATTERN.sub(
+            lambda m: f'<link rel="stylesheet" href="{self._asset(m.group(1), ".css", page_dir)}">', page)
+        # defer: 문서를 다 읽은 뒤 나온 순서대로 실행 (인라인일 때처럼 요소들이 이미 있음)
+        page = SCRIPT_PATTERN.sub(
+            lambda m: f'<script src="{self._asset(m.group(1), ".js", page_dir)}" defer></script>', page)
+        data = page.encode('utf-8')
+        _write_bytes(html_path, data)
+        self._add_entry(html_path, data, REVALIDATE, self._compress(html_path, data))
+
+        for src in PHOTO_PATTERN.findall(page):
+            src = html.unescape(src)
+            if '://' not in src and not src.startswith('data:'):
+                self._add_photo(os.path.normpath(os.path.join(page_dir, src)))
+        return len(data)
+
+    def write_manifest(self, path=None):
+        """static-manifest.json 저장 후 경로 반환 (경로는 root 기준)
+
+        같은 폴더에 다른 생성이 남긴 항목은 그 파일이 아직 있으면 그대로 두고 이번 항목만 새로 쓴다.
+        """
+        path = path or os.path.join(self.root, MANIFEST_NAME)
+        files = {}
+        try:
+            with open(path, encoding='utf-8') as f:
+                files = json.load(f).get('files', {})
+        except (OSError, ValueError):
+            pass
+        files = {key: entry for key, entry in files.items() if os.path.exists(os.path.join(self.root, key))}
+        files.update(self.entries)
+        manifest = {
+            'cache_control': {'html': REVALIDATE, 'hashed': IMMUTABLE, 'photos': REVALIDATE},
+            'files': dict(sorted(files.items())),
+        }
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, ensure_ascii=False, indent=1)
+        return path
+
+
+def export_static(paths, root=None, asset_dir=ASSET_DIR):
+    """생성한 HTML 파일들을 정적 호스팅용으로 바꾸고 StaticExport 반환
+
+    root를 주지 않으면 HTML 파일들의 공통 폴더를 쓴다 (assets/와 static-manifest.json 위치).
+    """
+    if root is None:
+        root = os.path.commonpath([os.path.dirname(os.path.abspath(path)) for path in paths])
+    export = StaticExport(root, asset_dir)
+    for path in paths:
+        export.add_page(path)
+    export.write_manifest()
+    return export
@@ -0,0 +1,121 @@
+"""학생 데이터(integrated_student_data.csv) 읽기
+
+열마다 자료형을 정해 두고 읽는다 (클래스: category, 행/열: int16, 점수: Float32).
+pyarrow가 있으면 pyarrow CSV 엔진으로 읽고, 읽은 결과를 CSV의 수정 시간/크기를 키로 한
+Parquet 파일로 캐시한다. 작은 파일은 pandas를 불러오지 않고 표준 라이브러리 csv로 읽어
+행(dict) 목록으로 돌려준다.
+"""
+import csv
+import importlib.util
+import os
+import re
+import struct
+
+DEFAULT_CSV = 'integrated_student_data.csv'
+DEFAULT_CACHE_DIR = '.seating_cache'
+SMALL_CSV_BYTES = 256 * 1024  # 이보다 작으면 pandas 없이 읽음
+
+# pandas로 읽을 때의 열 자료형 (클래스는 숫자로 읽은 뒤 category로 바꿔 정렬 순서를 유지)
+CSV_DTYPES = {
+    '학번': 'string',
+    '이름': 'string',
+    '점수': 'Float32',
+    '행': 'int16',
+    '열': 'int16',
+    '파일명': 'string',
+}
+
+HAS_PYARROW = importlib.util.find_spec('pyarrow') is not None
+
+
+def _to_float32(value):
+    """pandas 경로(Float32)와 같은 값이 되도록 float32로 반올림"""
+    return struct.unpack('f', struct.pack('f', value))[0]
+
+
+def _parse_class(value):
+    return int(value) if value.lstrip('-').isdigit() else value
+
+
+def read_csv_records(path, encoding='utf-8-sig'):
+    """표준 라이브러리 csv로 읽어 행(dict) 목록 반환 (pandas를 불러오지 않음)
+
+    값의 자료형은 pandas 경로와 맞춘다: 클래스/행/열은 int, 점수는 float(float32 정밀도)
+    또는 None, 빈 파일명은 None.
+    """
+    records = []
+    with open(path, encoding=encoding, newline='') as f:
+        for row in csv.DictReader(f):
+            score = row['점수'].strip()
+            records.append({
+                '클래스': _parse_class(row['클래스'].strip()),
+                '학번': row['학번'].strip() or None,
+                '이름': row['이름'],
+                '점수': _to_float32(float(score)) if score else None,
+                '행': int(row['행']),
+                '열': int(row['열']),
+                '파일명': row['파일명'] or None,
+            })
+    return records
+
+
+def _apply_schema(df):
+    """읽은 DataFrame에 열 자료형 적용"""
+    df = df.astype(CSV_DTYPES)
+    df['클래스'] = df['클래스'].astype('category')
+    return df
+
+
+def _cache_path(path, cache_dir):
+    stat = os.stat(path)
+    name = os.path.splitext(os.path.basename(path))[0]
+    return os.path.join(cache_dir, f"{name}.{stat.st_mtime_ns}-{stat.st_size}.parquet")
+
+
+def _stale_cache_paths(cache_path):
+    """같은 CSV의 이전 캐시 (<이름>.<수정 시간>-<크기>.parquet, 다른 CSV의 캐시는 제외)"""
+    cache_dir, file_name = os.path.split(cache_path)
+    name = file_name.rsplit('.', 2)[0]
+    pattern = re.compile(re.escape(name) + r'\.\d+-\d+\.parquet')
+    return [os.path.join(cache_dir, entry) for entry in os.listdir(cache_dir)
+            if entry != file_name and pattern.fullmatch(entry)]
+
+
+def read_csv_frame(path, encoding='utf-8-sig', cache_dir=DEFAULT_CACHE_DIR):
+    """pandas DataFrame으로 읽기 (pyarrow가 있으면 pyarrow 엔진 + Parquet 캐시 사용)"""
+    import pandas as pd
+
+    cache_path = None
+    if HAS_PYARROW and cache_dir:
+        cache_path = _cache_path(path, cache_dir)
+        if os.path.exists(cache_path):
+            return _apply_schema(pd.read_parquet(cache_path))
+
+    engine = 'pyarrow' if HAS_PYARROW else 'c'
+    df = _apply_schema(pd.read_csv(path, encoding=encoding, dtype=CSV_DTYPES, engine=engine))
+
+    if cache_path is not None:
+        # 이전 수정 시간의 캐시는 지우고 새로 저장
+        os.makedirs(cache_dir, exist_ok=True)
+        for old_path in _stale_cache_paths(cache_path):
+            os.remove(old_path)
+        df.to_parquet(cache_path)
+    return df
+
+
+def load_students(path=DEFAULT_CSV, small_threshold=SMALL_CSV_BYTES, cache_dir=DEFAULT_CACHE_DIR):
+    """학생 데이터 읽기
+
+    파일 크기가 small_threshold보다 작으면 행(dict) 목록을, 아니면 pandas DataFrame을 반환한다.
+    자리표 생성 함수들은 두 형태를 모두 받는다.
+    """
+    if os.path.getsize(path) < small_threshold:
+        return read_csv_records(path)
+    return read_csv_frame(path, cache_dir=cache_dir)
+
+
+def list_classes(data):
+    """데이터에 있는 클래스 목록 (정렬)"""
+    if isinstance(data, list):
+        return sorted({record['클래스'] for record in data})
+    return sorted(data['클래스'].dropna().unique().tolist())
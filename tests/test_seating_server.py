@@ -0,0 +1,69 @@
+"""seating_server 사진 주소 테스트 (사진 폴더를 절대 경로로 줄 때)
+
+사용법:
+    python -m pytest tests
+"""
+import os
+import re
+import shutil
+import sys
+import tempfile
+import threading
+import unittest
+import urllib.error
+import urllib.parse
+import urllib.request
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from seating_server import SeatingServer, make_server
+
+CSV_TEXT = "클래스,학번,이름,점수,행,열,파일명\n1,30101,가나다,80,1,1,30101_가나다.jpg\n1,30102,라마바,90,1,2,\n"
+
+
+class AbsoluteImageRootTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.image_root = os.path.join(self.tmp, 'image')
+        os.makedirs(os.path.join(self.image_root, 'class_1'))
+        with open(os.path.join(self.image_root, 'class_1', '30101_가나다.jpg'), 'wb') as f:
+            f.write(b'\xff\xd8photo')
+        self.csv_path = os.path.join(self.tmp, 'students.csv')
+        with open(self.csv_path, 'w', encoding='utf-8') as f:
+            f.write(CSV_TEXT)
+        with open(os.path.join(self.tmp, 'secret.jpg'), 'wb') as f:
+            f.write(b'secret')
+
+        app = SeatingServer(self.csv_path, [self.image_root], cache_dir=None)
+        self.server = make_server(app, port=0)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.base = 'http://127.0.0.1:%d' % self.server.server_address[1]
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        shutil.rmtree(self.tmp)
+
+    def get(self, path):
+        with urllib.request.urlopen(self.base + urllib.parse.quote(path)) as response:
+            return response.read()
+
+    def test_fragment_hides_filesystem_paths_and_photos_are_served(self):
+        fragment = self.get('/class/1').decode('utf-8')
+        self.assertNotIn(self.tmp, fragment)
+        sources = set(re.findall(r'src="([^"]+)"', fragment))
+        self.assertEqual(len(sources), 1)
+        src = sources.pop()
+        self.assertTrue(src.startswith('/photos/'))
+        self.assertEqual(self.get(src), b'\xff\xd8photo')
+
+    def test_other_files_are_not_served(self):
+        for path in ('/students.csv', self.csv_path, os.path.join(self.tmp, 'secret.jpg'),
+                     '/photos/000000000000/secret.jpg'):
+            with self.assertRaises(urllib.error.HTTPError) as context:
+                self.get(path)
+            self.assertEqual(context.exception.code, 404)
+
+
+if __name__ == '__main__':
+    unittest.main()
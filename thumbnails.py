@@ -0,0 +1,156 @@
+"""자리표용 학생 사진 썸네일 생성기 (내용 해시 기반 디스크 캐시)
+
+원본 사진마다 자리용 작은 썸네일과 모달용 중간 크기 사진을 만든다.
+캐시 파일 이름은 원본 내용의 해시로 정해지며, 원본의 수정 시간/크기가 그대로면
+해시를 다시 계산하지 않는다. 새로 만들어야 하는 사진은 프로세스 풀에서 나눠 처리한다.
+"""
+import hashlib
+import io
+import json
+import math
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    from PIL import Image, ImageOps, features
+except ImportError:  # Pillow가 없으면 썸네일 기능만 사용할 수 없음
+    Image = None
+
+THUMB_SIZE = (100, 100)     # 자리 사진(.student-photo 50×50)의 2배
+MEDIUM_SIZE = (600, 800)    # 모달 사진(.modal-image 최대 300×400)의 2배
+DEFAULT_CACHE_DIR = 'thumbnails'
+MANIFEST_NAME = 'manifest.json'
+
+
+def file_hash(path):
+    """파일 내용의 SHA-256 해시 (앞 16자리)"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 16), b''):
+            digest.update(block)
+    return digest.hexdigest()[:16]
+
+
+def _render(task):
+    """원본 사진 하나로 썸네일과 중간 크기 사진 생성 (작업 프로세스에서 실행)"""
+    src, thumb_path, medium_path, fmt, quality = task
+    try:
+        with Image.open(src) as image:
+            image = ImageOps.exif_transpose(image).convert('RGB')
+            # 자리 사진은 object-fit: cover와 같게 가운데를 잘라 정사각형으로
+            ImageOps.fit(image, THUMB_SIZE, Image.LANCZOS).save(thumb_path, fmt, quality=quality)
+            image.thumbnail(MEDIUM_SIZE, Image.LANCZOS)
+            image.save(medium_path, fmt, quality=quality)
+    except OSError:
+        return src, False
+    return src, True
+
+
+class ThumbnailCache:
+    """원본 사진 경로 → (썸네일 경로, 중간 크기 경로)를 만들어 주는 디스크 캐시"""
+
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR, fmt=None, quality=80, jobs=None):
+        if Image is None:
+            raise ImportError("썸네일 생성에는 Pillow가 필요합니다 (pip install pillow)")
+        if fmt is None:
+            fmt = 'webp' if features.check('webp') else 'jpeg'
+        self.cache_dir = cache_dir
+        self.fmt = fmt
+        self.ext = 'jpg' if fmt == 'jpeg' else fmt
+        self.quality = quality
+        self.jobs = jobs
+        self.generated = 0
+        self.reused = 0
+        self._manifest_path = os.path.join(cache_dir, MANIFEST_NAME)
+        self._manifest = self._load_manifest()
+        self._lock = threading.Lock()  # 일괄 생성(seating_batch)에서 여러 스레드가 함께 씀
+
+    def _load_manifest(self):
+        try:
+            with open(self._manifest_path, encoding='utf-8') as f:
+                return json.load(f)
+        except (FileNotFoundError, ValueError):
+            return {}
+
+    def _save_manifest(self):
+        tmp_path = self._manifest_path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self._manifest, f, ensure_ascii=False, indent=1, sort_keys=True)
+        os.replace(tmp_path, self._manifest_path)
+
+    def _source_hash(self, path):
+        """수정 시간/크기가 그대로면 저장된 해시 사용, 아니면 다시 계산"""
+        stat = os.stat(path)
+        entry = self._manifest.get(path)
+        if entry and entry['mtime_ns'] == stat.st_mtime_ns and entry['size'] == stat.st_size:
+            return entry['hash']
+        digest = file_hash(path)
+        self._manifest[path] = {'mtime_ns': stat.st_mtime_ns, 'size': stat.st_size, 'hash': digest}
+        return digest
+
+    def build(self, paths):
+        """바뀐 사진만 새로 만들고 {원본 경로: (썸네일 경로, 중간 크기 경로)} 반환"""
+        with self._lock:
+            return self._build(paths)
+
+    def _build(self, paths):
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+        results = {}
+        tasks = []
+        for path in sorted(set(paths)):
+            try:
+                digest = self._source_hash(path)
+            except OSError:
+                continue
+            thumb_path = f"{self.cache_dir}/{digest}_s.{self.ext}"
+            medium_path = f"{self.cache_dir}/{digest}_m.{self.ext}"
+            results[path] = (thumb_path, medium_path)
+            if os.path.exists(thumb_path) and os.path.exists(medium_path):
+                self.reused += 1
+            else:
+                tasks.append((path, thumb_path, medium_path, self.fmt, self.quality))
+
+        # 새로 만들 사진은 여러 코어에서 나눠 처리
+        if len(tasks) > 1 and self.jobs != 1:
+            with ProcessPoolExecutor(max_workers=self.jobs) as pool:
+                done = list(pool.map(_render, tasks, chunksize=8))
+        else:
+            done = [_render(task) for task in tasks]
+
+        for src, ok in done:
+            if ok:
+                self.generated += 1
+            else:
+                del results[src]
+
+        self._save_manifest()
+        return results
+
+
+def build_sprite(thumb_paths, fmt='webp', quality=80):
+    """썸네일 여러 장을 한 장의 스프라이트 이미지로 합치기
+
+    같은 내용의 사진은 같은 썸네일 파일을 쓰므로 한 칸만 차지한다.
+    (이미지 바이트, {썸네일 경로: (열, 행)}, (전체 열 수, 전체 행 수))를 반환한다.
+    """
+    if Image is None:
+        raise ImportError("스프라이트 생성에는 Pillow가 필요합니다 (pip install pillow)")
+
+    unique_paths = sorted(set(thumb_paths))
+    n_cols = max(1, math.ceil(math.sqrt(len(unique_paths))))
+    n_rows = max(1, math.ceil(len(unique_paths) / n_cols))
+    tile_w, tile_h = THUMB_SIZE
+
+    sheet = Image.new('RGB', (n_cols * tile_w, n_rows * tile_h), 'white')
+    positions = {}
+    for i, path in enumerate(unique_paths):
+        col, row = i % n_cols, i // n_cols
+        with Image.open(path) as tile:
+            sheet.paste(tile.convert('RGB'), (col * tile_w, row * tile_h))
+        positions[path] = (col, row)
+
+    buffer = io.BytesIO()
+    sheet.save(buffer, fmt, quality=quality)
+    return buffer.getvalue(), positions, (n_cols, n_rows)